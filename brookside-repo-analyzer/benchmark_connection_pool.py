@@ -0,0 +1,114 @@
+"""
+Connection Pool Benchmark for Brookside BI Repository Analyzer
+
+Measures GitHubMCPClient request throughput at different connection pool sizes
+against a local stand-in for the GitHub API, which answers every request after a
+fixed simulated latency. Requests go through the full client stack (rate
+limiter, request coalescing, streamed bodies) with caches disabled.
+
+The stand-in speaks plain HTTP/1.1, so it measures pooling and keep-alive only;
+HTTP/2 multiplexing is negotiated over TLS against api.github.com.
+
+Best for: Choosing ANALYSIS_MAX_CONNECTIONS / ANALYSIS_MAX_KEEPALIVE_CONNECTIONS
+for a given level of scan concurrency.
+
+Usage:
+    python benchmark_connection_pool.py [requests] [concurrency] [latency_ms]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from types import SimpleNamespace
+
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+
+POOL_SIZES = [1, 2, 5, 10, 20, 50]
+
+
+async def handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, latency: float
+) -> None:
+    """Serve keep-alive HTTP/1.1 requests with a small JSON body after a delay"""
+    body = json.dumps({"Python": 1024}).encode()
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                break
+            await asyncio.sleep(latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run_pool(
+    base_url: str, pool_size: int, total_requests: int, concurrency: int
+) -> float:
+    """Issue distinct GETs through a client with the given pool size; return requests/second"""
+    settings = Settings()
+    settings.analysis.http_cache_enabled = False
+    settings.analysis.tree_index_enabled = False
+    settings.analysis.negative_cache_enabled = False
+    settings.analysis.max_connections = pool_size
+    settings.analysis.max_keepalive_connections = pool_size
+
+    client = GitHubMCPClient(
+        settings,
+        SimpleNamespace(github_token="benchmark"),
+        rate_limiter=RateLimitScheduler(requests_per_second=1_000_000, burst_size=1_000_000),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(index: int) -> None:
+        async with semaphore:
+            await client._request("GET", f"/repos/bench/repo-{index}/languages")
+
+    async with client:
+        client.base_url = base_url
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch(i) for i in range(total_requests)))
+        elapsed = time.perf_counter() - started
+
+    return total_requests / elapsed
+
+
+async def main(total_requests: int, concurrency: int, latency_ms: float) -> None:
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(r, w, latency_ms / 1000), "127.0.0.1", 0
+    )
+    host, port = server.sockets[0].getsockname()[:2]
+    base_url = f"http://{host}:{port}"
+
+    print(
+        f"{total_requests} requests, concurrency {concurrency}, "
+        f"simulated latency {latency_ms:.0f} ms\n"
+    )
+    print(f"{'pool size':>10}  {'req/s':>10}")
+
+    async with server:
+        for pool_size in POOL_SIZES:
+            rate = await run_pool(base_url, pool_size, total_requests, concurrency)
+            print(f"{pool_size:>10}  {rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    args = [float(arg) for arg in sys.argv[1:4]]
+    asyncio.run(
+        main(
+            total_requests=int(args[0]) if len(args) > 0 else 500,
+            concurrency=int(args[1]) if len(args) > 1 else 50,
+            latency_ms=args[2] if len(args) > 2 else 20.0,
+        )
+    )
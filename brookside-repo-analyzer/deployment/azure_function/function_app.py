@@ -11,6 +11,7 @@ with Azure-native deployment and monitoring integration.
 import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 import azure.functions as func
@@ -52,10 +53,13 @@ async def weekly_repository_scan(timer: func.TimerRequest) -> None:
     from src.analyzers.cost_calculator import CostCalculator
     from src.analyzers.pattern_miner import PatternMiner
     from src.analyzers.repo_analyzer import RepositoryAnalyzer
+    from src.analyzers.triage import RepositoryTriage
     from src.auth import CredentialManager
     from src.config import get_settings
     from src.github_mcp_client import GitHubMCPClient
+    from src.models import Repository
     from src.notion_client import NotionIntegrationClient
+    from src.scanner import RepositoryScanner
 
     logger.info("Starting weekly repository scan...")
     logger.info(f"Timer trigger at: {datetime.utcnow().isoformat()}")
@@ -84,41 +88,34 @@ async def weekly_repository_scan(timer: func.TimerRequest) -> None:
         async with GitHubMCPClient(settings, credentials) as github_client:
             logger.info(f"Scanning organization: {settings.github.organization}")
 
-            # List all repositories
-            repos = await github_client.list_organization_repos()
-            logger.info(f"Found {len(repos)} repositories to analyze")
-
             # Initialize analyzers
             analyzer = RepositoryAnalyzer(github_client)
             claude_detector = ClaudeCapabilitiesDetector(github_client)
+            scanner = RepositoryScanner(
+                analyzer,
+                claude_detector if settings.analysis.detect_claude_configs else None,
+                deep_analysis=True,
+                triage=RepositoryTriage.from_settings(settings),
+            )
 
-            analyses = []
-
-            # Analyze each repository
-            for idx, repo in enumerate(repos, 1):
-                logger.info(f"[{idx}/{len(repos)}] Analyzing: {repo.name}")
-
-                try:
-                    # Perform deep analysis
-                    analysis = await analyzer.analyze_repository(repo, deep_analysis=True)
-
-                    # Detect Claude capabilities if enabled
-                    if settings.analysis.detect_claude_configs:
-                        analysis.claude_config = await claude_detector.detect_claude_capabilities(
-                            repo
-                        )
+            def log_start(idx: int, repo: Repository) -> None:
+                logger.info(f"[{idx}] Analyzing: {repo.name}")
 
-                    analyses.append(analysis)
-                    logger.info(
-                        f"  ✓ {repo.name} - Viability: {analysis.viability.rating.value}, "
-                        f"Cost: ${analysis.monthly_cost:.2f}/mo"
-                    )
+            # Analyze repositories as listing pages arrive (failures are logged and skipped)
+            result = await scanner.scan(
+                github_client.iter_organization_repos(), on_start=log_start
+            )
+            analyses = result.analyses
 
-                except Exception as e:
-                    logger.error(f"  ✗ Failed to analyze {repo.name}: {str(e)}")
-                    continue
+            for analysis in analyses:
+                logger.info(
+                    f"  ✓ {analysis.repository.name} - Viability: {analysis.viability.rating.value}, "
+                    f"Cost: ${analysis.monthly_cost:.2f}/mo"
+                )
 
-            logger.info(f"Successfully analyzed {len(analyses)}/{len(repos)} repositories")
+            logger.info(f"Successfully analyzed {len(analyses)}/{result.scanned} repositories")
+            if result.skipped:
+                logger.info(f"Triage skipped {len(result.skipped)} repositories")
 
             # Pattern extraction
             logger.info("Extracting cross-repository patterns...")
@@ -220,7 +217,9 @@ async def manual_repository_scan(req: func.HttpRequest) -> func.HttpResponse:
         {
             "deep_analysis": true,
             "sync_to_notion": true,
-            "repository_filter": ["repo1", "repo2"]  // Optional: analyze specific repos
+            "repository_filter": ["repo1", "repo2"],  // Optional: analyze specific repos
+            "order": "recently_pushed",  // Optional: listing, recently_pushed or largest
+            "triage": true  // Optional: analyze only repos passing the triage policy
         }
 
     Returns:
@@ -229,10 +228,13 @@ async def manual_repository_scan(req: func.HttpRequest) -> func.HttpResponse:
     # Defer imports to function body for Python V2 discovery compatibility
     from src.analyzers.cost_calculator import CostCalculator
     from src.analyzers.repo_analyzer import RepositoryAnalyzer
+    from src.analyzers.triage import RepositoryTriage
     from src.auth import CredentialManager
     from src.config import get_settings
     from src.github_mcp_client import GitHubMCPClient
+    from src.models import Repository
     from src.notion_client import NotionIntegrationClient
+    from src.scanner import SCAN_ORDERS, RepositoryScanner
 
     logger.info("Manual repository scan triggered")
 
@@ -243,6 +245,15 @@ async def manual_repository_scan(req: func.HttpRequest) -> func.HttpResponse:
         deep_analysis = req_body.get("deep_analysis", True)
         sync_to_notion = req_body.get("sync_to_notion", True)
         repository_filter = req_body.get("repository_filter", [])
+        order = req_body.get("order")
+        triage = req_body.get("triage")
+
+        if order is not None and order not in SCAN_ORDERS:
+            return func.HttpResponse(
+                body=str({"status": "invalid", "error": f"Unknown order: {order}"}),
+                status_code=400,
+                mimetype="application/json",
+            )
 
         logger.info(
             f"Scan parameters: deep_analysis={deep_analysis}, "
@@ -254,23 +265,23 @@ async def manual_repository_scan(req: func.HttpRequest) -> func.HttpResponse:
         credentials = CredentialManager(settings)
 
         async with GitHubMCPClient(settings, credentials) as github_client:
-            repos = await github_client.list_organization_repos()
 
-            # Apply filter if specified
-            if repository_filter:
-                repos = [r for r in repos if r.name in repository_filter]
-                logger.info(f"Filtered to {len(repos)} repositories")
+            async def stream_repositories() -> AsyncIterator[Repository]:
+                """Yield listed repositories, applying the filter if specified"""
+                async for repo in github_client.iter_organization_repos():
+                    if not repository_filter or repo.name in repository_filter:
+                        yield repo
 
-            # Analyze repositories
+            # Analyze repositories (same scheduler as the weekly scan and CLI)
             analyzer = RepositoryAnalyzer(github_client)
-            analyses = []
-
-            for repo in repos:
-                try:
-                    analysis = await analyzer.analyze_repository(repo, deep_analysis=deep_analysis)
-                    analyses.append(analysis)
-                except Exception as e:
-                    logger.error(f"Failed to analyze {repo.name}: {str(e)}")
+            scanner = RepositoryScanner(
+                analyzer,
+                deep_analysis=deep_analysis,
+                order=order,
+                triage=RepositoryTriage.from_settings(settings, enabled=triage),
+            )
+            result = await scanner.scan(stream_repositories())
+            analyses = result.analyses
 
             # Calculate costs
             calculator = CostCalculator()
@@ -289,6 +300,8 @@ async def manual_repository_scan(req: func.HttpRequest) -> func.HttpResponse:
             response = {
                 "status": "completed",
                 "repositories_analyzed": len(analyses),
+                "repositories_failed": len(result.failures),
+                "repositories_skipped": len(result.skipped),
                 "total_monthly_cost": cost_stats["total_monthly"],
                 "total_annual_cost": cost_stats["total_annual"],
                 "timestamp": datetime.utcnow().isoformat(),
@@ -31,6 +31,7 @@ from models import (
     ViabilityRating,
     ReusabilityRating,
 )
+from analyzers.dependency_index import DependencyIndex
 from analyzers.pattern_miner import PatternMiner
 
 # Configure logging
@@ -40,6 +41,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pattern name -> dependency substrings identifying it
+FRAMEWORK_RULES = {
+    "FastAPI": ("fastapi",),
+    "Flask": ("flask",),
+    "Express.js": ("express",),
+    "Django": ("django",),
+}
+TESTING_RULES = {
+    "pytest": ("pytest",),
+    "Jest": ("jest",),
+    "unittest": ("unittest",),
+}
+VALIDATION_RULES = {
+    "Pydantic": ("pydantic",),
+    "Joi": ("joi",),
+}
+INTEGRATION_RULES = {
+    "Azure Key Vault": ("azure-keyvault", "keyvault"),
+    "Azure Storage": ("azure-storage", "blob"),
+    "Azure OpenAI": ("azure-openai", "openai"),
+}
+
 
 class PatternAnalysisWorkflow:
     """
@@ -87,54 +110,26 @@ class PatternAnalysisWorkflow:
         logger.info(f"Loaded {len(data.get('repositories', []))} repository analyses")
         return data.get("repositories", [])
 
-    def detect_framework_patterns(self, repos_data: list[dict]) -> list[dict]:
+    def detect_framework_patterns(
+        self, repos_data: list[dict], index: DependencyIndex | None = None
+    ) -> list[dict]:
         """
         Detect web framework and design patterns
 
         Args:
             repos_data: Repository analysis data
+            index: Dependency index over repos_data (built if omitted)
 
         Returns:
             List of framework patterns
         """
         patterns = []
+        index = index or DependencyIndex.from_records(repos_data)
 
         # Track framework usage
-        frameworks = defaultdict(list)
-        testing_frameworks = defaultdict(list)
-        validation_libs = defaultdict(list)
-
-        for repo in repos_data:
-            repo_name = repo.get("name", "Unknown")
-            dependencies = [d.get("name", "") for d in repo.get("dependencies", [])]
-
-            # Web frameworks
-            for dep in dependencies:
-                dep_lower = dep.lower()
-
-                # API frameworks
-                if "fastapi" in dep_lower:
-                    frameworks["FastAPI"].append(repo_name)
-                elif "flask" in dep_lower:
-                    frameworks["Flask"].append(repo_name)
-                elif "express" in dep_lower:
-                    frameworks["Express.js"].append(repo_name)
-                elif "django" in dep_lower:
-                    frameworks["Django"].append(repo_name)
-
-                # Testing frameworks
-                if "pytest" in dep_lower:
-                    testing_frameworks["pytest"].append(repo_name)
-                elif "jest" in dep_lower:
-                    testing_frameworks["Jest"].append(repo_name)
-                elif "unittest" in dep_lower:
-                    testing_frameworks["unittest"].append(repo_name)
-
-                # Validation libraries
-                if "pydantic" in dep_lower:
-                    validation_libs["Pydantic"].append(repo_name)
-                elif "joi" in dep_lower:
-                    validation_libs["Joi"].append(repo_name)
+        frameworks = _match_rules(index, FRAMEWORK_RULES)
+        testing_frameworks = _match_rules(index, TESTING_RULES)
+        validation_libs = _match_rules(index, VALIDATION_RULES)
 
         # Create patterns for frameworks with min_usage
         for framework, repos in frameworks.items():
@@ -199,38 +194,25 @@ class PatternAnalysisWorkflow:
 
         return patterns
 
-    def detect_architectural_patterns(self, repos_data: list[dict]) -> list[dict]:
+    def detect_architectural_patterns(
+        self, repos_data: list[dict], index: DependencyIndex | None = None
+    ) -> list[dict]:
         """
         Detect architectural patterns
 
         Args:
             repos_data: Repository analysis data
+            index: Dependency index over repos_data (built if omitted)
 
         Returns:
             List of architectural patterns
         """
         patterns = []
+        index = index or DependencyIndex.from_records(repos_data)
 
         # Track architectural indicators
-        serverless_repos = []
-        event_driven_repos = []
-        batch_processing_repos = []
-
-        for repo in repos_data:
-            repo_name = repo.get("name", "Unknown")
-            dependencies = [d.get("name", "").lower() for d in repo.get("dependencies", [])]
-
-            # Serverless detection
-            if any("azure-functions" in dep or "aws-lambda" in dep for dep in dependencies):
-                serverless_repos.append(repo_name)
-
-            # Event-driven detection
-            if any("event" in dep or "webhook" in dep for dep in dependencies):
-                event_driven_repos.append(repo_name)
-
-            # Batch processing detection
-            if any("schedule" in dep or "cron" in dep or "batch" in dep for dep in dependencies):
-                batch_processing_repos.append(repo_name)
+        serverless_repos = index.repositories(index.containing("azure-functions", "aws-lambda"))
+        event_driven_repos = index.repositories(index.containing("event", "webhook"))
 
         # Create patterns
         if len(serverless_repos) >= self.min_usage:
@@ -277,42 +259,38 @@ class PatternAnalysisWorkflow:
 
         return patterns
 
-    def detect_integration_patterns(self, repos_data: list[dict]) -> list[dict]:
+    def detect_integration_patterns(
+        self, repos_data: list[dict], index: DependencyIndex | None = None
+    ) -> list[dict]:
         """
         Detect integration patterns
 
         Args:
             repos_data: Repository analysis data
+            index: Dependency index over repos_data (built if omitted)
 
         Returns:
             List of integration patterns
         """
         patterns = []
+        index = index or DependencyIndex.from_records(repos_data)
 
-        # Track integration usage
-        integrations = defaultdict(list)
-
-        for repo in repos_data:
-            repo_name = repo.get("name", "Unknown")
-            dependencies = [d.get("name", "").lower() for d in repo.get("dependencies", [])]
+        # Track integration usage (Azure integrations from dependencies)
+        integrations = _match_rules(index, INTEGRATION_RULES)
 
-            # Azure integrations
-            if any("azure-keyvault" in dep or "keyvault" in dep for dep in dependencies):
-                integrations["Azure Key Vault"].append(repo_name)
+        # MCP integrations (check for MCP in name or description)
+        notion_repos = [
+            repo.get("name", "Unknown")
+            for repo in repos_data
+            if "notion" in repo.get("name", "Unknown").lower()
+            or "notion" in repo.get("description", "").lower()
+        ]
+        if notion_repos:
+            integrations["Notion MCP"] = notion_repos
 
-            if any("azure-storage" in dep or "blob" in dep for dep in dependencies):
-                integrations["Azure Storage"].append(repo_name)
-
-            if any("azure-openai" in dep or "openai" in dep for dep in dependencies):
-                integrations["Azure OpenAI"].append(repo_name)
-
-            # MCP integrations (check for MCP in name or description)
-            repo_desc = repo.get("description", "").lower()
-            if "notion" in repo_name.lower() or "notion" in repo_desc:
-                integrations["Notion MCP"].append(repo_name)
-
-            if "github" in dependencies or "octokit" in dependencies:
-                integrations["GitHub Integration"].append(repo_name)
+        github_repos = index.repositories(index.exact("github", "octokit"))
+        if github_repos:
+            integrations["GitHub Integration"] = github_repos
 
         # Create patterns
         for integration, repos in integrations.items():
@@ -514,15 +492,18 @@ class PatternAnalysisWorkflow:
             total_repos = len(repos_data)
             logger.info(f"Analyzing {total_repos} repositories for patterns...")
 
+            # Index dependencies once for every detector
+            index = DependencyIndex.from_records(repos_data)
+
             # Detect all pattern types
             logger.info("Detecting framework and design patterns...")
-            framework_patterns = self.detect_framework_patterns(repos_data)
+            framework_patterns = self.detect_framework_patterns(repos_data, index)
 
             logger.info("Detecting architectural patterns...")
-            arch_patterns = self.detect_architectural_patterns(repos_data)
+            arch_patterns = self.detect_architectural_patterns(repos_data, index)
 
             logger.info("Detecting integration patterns...")
-            integration_patterns = self.detect_integration_patterns(repos_data)
+            integration_patterns = self.detect_integration_patterns(repos_data, index)
 
             # Combine all patterns
             all_patterns = framework_patterns + arch_patterns + integration_patterns
@@ -556,6 +537,16 @@ class PatternAnalysisWorkflow:
             raise
 
 
+def _match_rules(index: DependencyIndex, rules: dict[str, tuple[str, ...]]) -> dict[str, list]:
+    """Repositories matching each rule, keeping only rules with at least one match"""
+    matches = {}
+    for name, needles in rules.items():
+        repos = index.repositories(index.containing(*needles))
+        if repos:
+            matches[name] = repos
+    return matches
+
+
 if __name__ == "__main__":
     # Run pattern mining workflow
     workflow = PatternAnalysisWorkflow(min_usage=3)
@@ -0,0 +1,118 @@
+"""
+Analysis Result Cache for Brookside BI Repository Analyzer
+
+Establishes a persistent cache of repository analyses keyed by (repository,
+default-branch head SHA, analyzer version), so repositories that have not changed
+since the last scan skip every content fetch and only refresh time-dependent
+fields such as commit activity.
+
+Best for: Weekly scans of organizations where most repositories are untouched
+between runs.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from src.models import RepoAnalysis
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCache:
+    """
+    On-disk store of analyses, one file per repository
+
+    Each repository keeps only its latest analysis; an entry recorded for a
+    different head SHA or analyzer version counts as an invalidation and is
+    overwritten by the next put.
+
+    Example:
+        >>> cache = AnalysisCache(Path(".cache"))
+        >>> analysis = cache.get("brookside-bi/repo-analyzer", head_sha, ANALYZER_VERSION)
+        >>> if analysis is None:
+        ...     analysis = await analyze(repo)
+        ...     cache.put(analysis, head_sha, ANALYZER_VERSION)
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize analysis cache
+
+        Args:
+            cache_dir: Root cache directory (entries go under cache_dir/analyses)
+        """
+        self.root = Path(cache_dir) / "analyses"
+        self.hits = 0
+        self.misses = 0  # Includes invalidations
+        self.invalidations = 0  # Entries found for an older head or analyzer version
+
+    def _path(self, full_name: str) -> Path:
+        return self.root / f"{full_name}.json"
+
+    def get(self, full_name: str, head_sha: str, version: str) -> RepoAnalysis | None:
+        """
+        Load the analysis recorded for a repository head
+
+        Args:
+            full_name: Full repository name (org/repo)
+            head_sha: Current commit SHA of the default branch
+            version: Current analyzer version
+
+        Returns:
+            Cached RepoAnalysis, or None if absent, stale, or unreadable
+        """
+        try:
+            data = json.loads(self._path(full_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if data.get("head_sha") != head_sha or data.get("version") != version:
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        try:
+            analysis = RepoAnalysis.model_validate(data["analysis"])
+        except (ValueError, KeyError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return analysis
+
+    def contains(self, full_name: str, head_sha: str | None, version: str) -> bool:
+        """Check for a current entry without loading it or counting a hit or miss"""
+        if not head_sha:
+            return False
+        try:
+            data = json.loads(self._path(full_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return data.get("head_sha") == head_sha and data.get("version") == version
+
+    def put(self, analysis: RepoAnalysis, head_sha: str, version: str) -> None:
+        """
+        Persist a repository's analysis
+
+        Args:
+            analysis: Completed analysis
+            head_sha: Commit SHA of the default branch the analysis describes
+            version: Analyzer version that produced it
+        """
+        full_name = analysis.repository.full_name
+        path = self._path(full_name)
+        payload = {
+            "head_sha": head_sha,
+            "version": version,
+            "analysis": analysis.model_dump(mode="json"),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to store analysis for {full_name}: {e}")
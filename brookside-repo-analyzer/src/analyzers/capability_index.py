@@ -0,0 +1,206 @@
+"""
+Claude Capability Index for Brookside BI Repository Analyzer
+
+Establishes a portfolio-wide inverted index from Claude agents, slash commands
+and MCP servers to the repositories configuring them, built from ClaudeConfig
+results and persisted between runs so questions such as "which repositories use
+the notion MCP server" or "which agents appear in 5+ repositories" are answered
+without rescanning.
+
+Best for: Tracking Claude Code adoption and reuse across hundreds of repositories.
+"""
+
+import json
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+from src.bitset_index import BitsetIndex
+from src.models import ClaudeConfig, RepoAnalysis
+
+logger = logging.getLogger(__name__)
+
+CapabilityKind = Literal["agent", "command", "mcp_server"]
+
+# Capability kinds indexed from each ClaudeConfig
+CAPABILITY_KINDS: tuple[CapabilityKind, ...] = ("agent", "command", "mcp_server")
+
+# A capability term: (kind, name), e.g. ("mcp_server", "notion")
+Capability = tuple[CapabilityKind, str]
+
+# File under the analysis cache directory holding the persisted index
+CAPABILITY_INDEX_FILE = "capabilities.json"
+
+
+class CapabilityIndex:
+    """
+    Inverted index of Claude capabilities over repositories
+
+    Example:
+        >>> index = CapabilityIndex.from_analyses(analyses)
+        >>> index.repositories_with("mcp_server", "notion")
+        {'brookside-bi/repo-analyzer'}
+        >>> index.common("agent", min_repositories=5)
+        {'cost-analyst': 7}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty capability index"""
+        self.index: BitsetIndex[Capability, str] = BitsetIndex()
+
+    def __len__(self) -> int:
+        """Number of indexed repositories"""
+        return len(self.index)
+
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[RepoAnalysis]) -> "CapabilityIndex":
+        """Build an index from analyses (those without Claude detection are skipped)"""
+        index = cls()
+        for analysis in analyses:
+            if analysis.claude_config is not None:
+                index.update(analysis.repository.full_name, analysis.claude_config)
+        return index
+
+    def update(self, full_name: str, config: ClaudeConfig) -> None:
+        """
+        Replace one repository's capabilities
+
+        Args:
+            full_name: Full repository name (org/repo)
+            config: Its current Claude configuration
+        """
+        capabilities: list[Capability] = [
+            *(("agent", name) for name in config.agents),
+            *(("command", name) for name in config.commands),
+            *(("mcp_server", name) for name in config.mcp_servers),
+        ]
+        self.index.update(full_name, capabilities)
+
+    def remove(self, full_name: str) -> None:
+        """Drop a repository (e.g. deleted or archived)"""
+        self.index.remove(full_name)
+
+    def repositories_with(self, kind: CapabilityKind, name: str) -> set[str]:
+        """Repositories configuring one capability"""
+        return self.index.decode(self.index.bits((kind, name)))
+
+    def query(
+        self,
+        all_of: Iterable[Capability] = (),
+        any_of: Iterable[Capability] = (),
+        none_of: Iterable[Capability] = (),
+    ) -> set[str]:
+        """
+        Select repositories by set algebra over capabilities
+
+        Args:
+            all_of: Capabilities every selected repository must have
+            any_of: Capabilities of which a selected repository needs at least one
+                (ignored if empty)
+            none_of: Capabilities no selected repository may have
+
+        Returns:
+            Full names of matching repositories
+
+        Example:
+            >>> index.query(all_of=[("mcp_server", "notion")], none_of=[("agent", "cost-analyst")])
+        """
+        bits = self.index.all_bits
+        for capability in all_of:
+            bits &= self.index.bits(capability)
+
+        any_of = list(any_of)
+        if any_of:
+            either = 0
+            for capability in any_of:
+                either |= self.index.bits(capability)
+            bits &= either
+
+        for capability in none_of:
+            bits &= ~self.index.bits(capability)
+
+        return self.index.decode(bits)
+
+    def common(self, kind: CapabilityKind, min_repositories: int = 2) -> dict[str, int]:
+        """
+        Capabilities of one kind configured in at least min_repositories repositories
+
+        Returns:
+            Mapping of capability name to repository count, most widespread first
+        """
+        counts = {
+            name: self.index.count((term_kind, name))
+            for term_kind, name in self.index.terms()
+            if term_kind == kind
+        }
+        return dict(
+            sorted(
+                ((name, count) for name, count in counts.items() if count >= min_repositories),
+                key=lambda item: (-item[1], item[0]),
+            )
+        )
+
+    def shared_sets(self, kind: CapabilityKind) -> list[tuple[frozenset[str], set[str]]]:
+        """
+        Groups of repositories configuring exactly the same (non-empty) set of one kind
+
+        Returns:
+            (capability names, repositories) pairs for sets shared by 2+ repositories,
+            largest groups first
+        """
+        groups: dict[frozenset[str], set[str]] = defaultdict(set)
+        for full_name in self.index.repositories():
+            names = frozenset(
+                name for term_kind, name in self.index.terms_of(full_name) if term_kind == kind
+            )
+            if names:
+                groups[names].add(full_name)
+
+        shared = [(names, repos) for names, repos in groups.items() if len(repos) > 1]
+        return sorted(shared, key=lambda group: (-len(group[1]), sorted(group[0])))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible structure (per-repository capabilities)"""
+        repositories: dict[str, dict[str, list[str]]] = {}
+        for full_name in self.index.repositories():
+            by_kind: dict[str, list[str]] = {kind: [] for kind in CAPABILITY_KINDS}
+            for kind, name in self.index.terms_of(full_name):
+                by_kind[kind].append(name)
+            repositories[full_name] = {kind: sorted(names) for kind, names in by_kind.items()}
+        return {"repositories": repositories}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CapabilityIndex":
+        """Deserialize from to_dict output"""
+        index = cls()
+        for full_name, by_kind in data.get("repositories", {}).items():
+            index.update(
+                full_name,
+                ClaudeConfig(
+                    agents=by_kind.get("agent", []),
+                    commands=by_kind.get("command", []),
+                    mcp_servers=by_kind.get("mcp_server", []),
+                ),
+            )
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> "CapabilityIndex":
+        """Load a persisted index (empty if absent or unreadable)"""
+        try:
+            return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, AttributeError):
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """Persist the index"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to store capability index: {e}")
@@ -8,23 +8,42 @@ Best for: Organizations using Claude Code across repositories, requiring visibil
 into configured agents, custom commands, and automation workflows.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import TypeVar
 
+from src.exceptions import GitHubAPIError, RateLimitError
 from src.github_mcp_client import GitHubMCPClient
 from src.models import ClaudeConfig, Repository
+from src.pipeline import Step
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Directories whose markdown files define agents and slash commands
+AGENTS_DIR = ".claude/agents"
+COMMANDS_DIR = ".claude/commands"
+
+# Code search qualifiers matching any Claude configuration (combined with org:<name>)
+CLAUDE_SEARCH_QUALIFIERS = (
+    "filename:CLAUDE.md",
+    "filename:.claude.json",
+    f"path:{AGENTS_DIR}",
+    f"path:{COMMANDS_DIR}",
+)
+
 
 class ClaudeCapabilitiesDetector:
     """
     Detector for Claude Code configurations
 
     Parses .claude/ directory to extract:
-    - Agent definitions (.claude/agents/*.md)
-    - Slash commands (.claude/commands/*.md)
+    - Agent definitions (.claude/agents/**/*.md)
+    - Slash commands (.claude/commands/**/*.md, namespaced as "<dir>:<name>")
     - MCP server configurations (.claude.json)
     - Project memory (CLAUDE.md)
     """
@@ -42,6 +61,9 @@ class ClaudeCapabilitiesDetector:
             >>> print(f"Found {config.agents_count} agents")
         """
         self.github_client = github_client
+        # Organization sweeps, started by the first repository of each organization
+        self._sweeps: dict[str, asyncio.Task[set[str] | None]] = {}
+        self.skipped = 0  # Repositories ruled out by a sweep without any request
 
     async def detect_claude_capabilities(self, repo: Repository) -> ClaudeConfig:
         """
@@ -60,80 +82,46 @@ class ClaudeCapabilitiesDetector:
             ...     print(f"Commands: {', '.join(config.commands)}")
             ...     print(f"MCPs: {', '.join(config.mcp_servers)}")
         """
-        logger.info(f"Detecting Claude configuration for: {repo.name}")
-
         config = ClaudeConfig()
-
-        # Check if .claude/ directory exists
         org, repo_name = repo.full_name.split("/")
 
-        # Try to get .claude.json (MCP and project-level config)
-        claude_json_content = await self.github_client._get_file_content(
-            org, repo_name, ".claude.json"
-        )
+        # Forks are not in the code search index, so they are always inspected
+        if not repo.is_fork:
+            candidates = await self.sweep_organization(org)
+            if candidates is not None and repo.full_name not in candidates:
+                self.skipped += 1
+                logger.debug(f"No Claude configuration indexed for {repo.name}; skipped")
+                return config
 
-        if claude_json_content:
-            config.has_claude_dir = True
-            mcp_servers = self._parse_claude_json(claude_json_content)
-            config.mcp_servers = mcp_servers
+        logger.info(f"Detecting Claude configuration for: {repo.name}")
 
-        # Check for CLAUDE.md
-        claude_md_content = await self.github_client._get_file_content(
-            org, repo_name, "CLAUDE.md"
+        # Existence checks and directory listings share the tree index and run concurrently
+        has_claude_json, has_claude_md, agent_paths, command_paths = await asyncio.gather(
+            self.github_client.check_file_exists(repo, ".claude.json"),
+            self.github_client.check_file_exists(repo, "CLAUDE.md"),
+            self.github_client.list_directory(repo, AGENTS_DIR, recursive=True),
+            self.github_client.list_directory(repo, COMMANDS_DIR, recursive=True),
         )
-        if claude_md_content:
-            config.has_claude_md = True
-
-        # Try to detect agents directory
-        # Note: GitHub API doesn't allow directory listing easily,
-        # so we'll use a heuristic approach
-
-        # Try common agent file patterns
-        potential_agents = [
-            "build-architect",
-            "cost-analyst",
-            "github-repo-analyst",
-            "ideas-capture",
-            "integration-specialist",
-            "knowledge-curator",
-            "markdown-expert",
-            "notion-mcp-specialist",
-            "research-coordinator",
-            "schema-manager",
-            "viability-assessor",
-            "workflow-router",
-            "archive-manager",
-            "mermaid-diagram-expert",
-        ]
-
-        detected_agents = []
-        for agent_name in potential_agents:
-            agent_file = f".claude/agents/{agent_name}.md"
-            content = await self.github_client._get_file_content(org, repo_name, agent_file)
-            if content:
-                detected_agents.append(agent_name)
-
-        config.agents = detected_agents
-        config.agents_count = len(detected_agents)
-
-        # Try common command patterns
-        potential_commands = [
-            "cost-analyze",
-            "innovation-new-idea",
-            "innovation-start-research",
-            "knowledge-archive",
-            "team-assign",
-        ]
-
-        detected_commands = []
-        for cmd_name in potential_commands:
-            cmd_file = f".claude/commands/{cmd_name}.md"
-            content = await self.github_client._get_file_content(org, repo_name, cmd_file)
-            if content:
-                detected_commands.append(cmd_name)
-
-        config.commands = detected_commands
-        config.commands_count = len(detected_commands)
+
+        # Parse .claude.json (MCP and project-level config), reusing identical files
+        if has_claude_json:
+            mcp_servers = await self._read_parsed(
+                repo, ".claude.json", "claude_json", self._parse_claude_json
+            )
+            if mcp_servers is not None:
+                config.has_claude_dir = True
+                config.mcp_servers = mcp_servers
+
+        config.has_claude_md = has_claude_md
+
+        config.agents = _markdown_names(agent_paths, AGENTS_DIR)
+        config.agents_count = len(config.agents)
+
+        config.commands = _markdown_names(command_paths, COMMANDS_DIR)
+        config.commands_count = len(config.commands)
+
+        if config.agents or config.commands:
+            config.has_claude_dir = True
 
         logger.info(
             f"Claude detection complete for {repo.name}: "
@@ -144,6 +132,64 @@ class ClaudeCapabilitiesDetector:
 
         return config
 
+    async def sweep_organization(self, org: str) -> set[str] | None:
+        """
+        Find an organization's repositories with Claude configuration via code search
+
+        Runs one paginated code search per qualifier in CLAUDE_SEARCH_QUALIFIERS,
+        once per organization; concurrent callers share the sweep.
+
+        Args:
+            org: Organization name
+
+        Returns:
+            Full names of candidate repositories, or None if the sweep is disabled,
+            failed, or was incomplete (every repository must then be inspected)
+
+        Example:
+            >>> candidates = await detector.sweep_organization("brookside-bi")
+            >>> print(f"{len(candidates)} repositories use Claude Code")
+        """
+        if not self.github_client.settings.analysis.claude_search_sweep_enabled:
+            return None
+        if org not in self._sweeps:
+            self._sweeps[org] = asyncio.create_task(self._run_sweep(org))
+        return await asyncio.shield(self._sweeps[org])
+
+    async def _run_sweep(self, org: str) -> set[str] | None:
+        """Union the code search hits of every Claude qualifier"""
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.github_client.search_code_repositories(f"org:{org} {qualifier}")
+                    for qualifier in CLAUDE_SEARCH_QUALIFIERS
+                )
+            )
+        except (GitHubAPIError, RateLimitError) as e:
+            logger.warning(f"Claude code search failed for {org}; inspecting every repository: {e}")
+            return None
+
+        if any(result is None for result in results):
+            logger.info(f"Claude code search incomplete for {org}; inspecting every repository")
+            return None
+
+        candidates = set().union(*results)
+        logger.info(f"Claude code search found {len(candidates)} candidate repositories in {org}")
+        return candidates
+
+    def pipeline_step(self) -> Step:
+        """
+        Claude detection as an analysis pipeline step
+
+        Returns:
+            Step producing the ClaudeConfig of the "repo" input; analyze_repository
+            assigns it to RepoAnalysis.claude_config
+
+        Example:
+            >>> analysis = await analyzer.analyze_repository(repo, steps=[detector.pipeline_step()])
+        """
+        return Step("claude_config", self.detect_claude_capabilities, ("repo",))
+
     def _parse_claude_json(self, content: str) -> list[str]:
         """
         Parse .claude.json to extract MCP server names
@@ -202,18 +248,110 @@ class ClaudeCapabilitiesDetector:
             >>> details = await detector.get_agent_details(repo, "cost-analyst")
             >>> print(details["description"])
         """
-        org, repo_name = repo.full_name.split("/")
-        agent_file = f".claude/agents/{agent_name}.md"
+        # Parse markdown frontmatter for agent metadata
+        return await self._read_parsed(
+            repo,
+            _markdown_path(AGENTS_DIR, agent_name),
+            "agent_frontmatter",
+            self._parse_agent_frontmatter,
+        )
 
-        content = await self.github_client._get_file_content(org, repo_name, agent_file)
+    async def get_all_agent_details(
+        self, repo: Repository, agent_names: list[str] | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Get metadata of every agent in a repository in one pass
 
-        if not content:
-            return None
+        Agent files are read concurrently; files whose blob SHA was parsed before
+        (in any repository) are not downloaded again.
 
-        # Parse markdown frontmatter for agent metadata
-        metadata = self._parse_agent_frontmatter(content)
+        Args:
+            repo: Repository containing the agents
+            agent_names: Agents to resolve (default: every agent in .claude/agents)
 
-        return metadata
+        Returns:
+            Mapping of agent name to metadata (agents not found are omitted)
+
+        Example:
+            >>> details = await detector.get_all_agent_details(repo)
+            >>> print(details["cost-analyst"]["description"])
+        """
+        if agent_names is None:
+            agent_names = _markdown_names(
+                await self.github_client.list_directory(repo, AGENTS_DIR, recursive=True),
+                AGENTS_DIR,
+            )
+
+        limit = asyncio.Semaphore(
+            self.github_client.settings.analysis.max_concurrent_fetches_per_repo
+        )
+
+        async def resolve(agent_name: str) -> dict[str, str] | None:
+            async with limit:
+                return await self.get_agent_details(repo, agent_name)
+
+        details = await asyncio.gather(*(resolve(name) for name in agent_names))
+        return {
+            name: metadata
+            for name, metadata in zip(agent_names, details)
+            if metadata is not None
+        }
+
+    async def get_portfolio_agent_details(
+        self, repos: list[Repository]
+    ) -> dict[str, dict[str, dict[str, str]]]:
+        """
+        Get metadata of every agent across many repositories
+
+        Repositories are resolved concurrently (bounded by max_concurrent_analyses)
+        and share one parse cache, so agent files vendored into several
+        repositories are parsed once.
+
+        Args:
+            repos: Repositories to resolve
+
+        Returns:
+            Mapping of full repository name to get_all_agent_details output
+            (repositories without agents are omitted)
+
+        Example:
+            >>> portfolio = await detector.get_portfolio_agent_details(repos)
+            >>> print(sum(len(agents) for agents in portfolio.values()))
+        """
+        limit = asyncio.Semaphore(self.github_client.settings.analysis.max_concurrent_analyses)
+
+        async def resolve(repo: Repository) -> dict[str, dict[str, str]]:
+            async with limit:
+                return await self.get_all_agent_details(repo)
+
+        details = await asyncio.gather(*(resolve(repo) for repo in repos))
+        return {repo.full_name: agents for repo, agents in zip(repos, details) if agents}
+
+    async def _read_parsed(
+        self, repo: Repository, path: str, kind: str, parser: Callable[[str], T]
+    ) -> T | None:
+        """
+        Read and parse a repository file through the parse cache
+
+        With a tree index the blob SHA is known up front, so a file parsed
+        before is not downloaded.
+
+        Returns:
+            Parse result, or None if the file is absent or unreadable
+        """
+        cache = self.github_client.parse_cache
+        tree = await self.github_client.get_repository_tree(repo)
+        entry = tree.get(path) if tree is not None else None
+        if entry is not None:
+            cached = cache.get(kind, entry.sha)
+            if cached is not None:
+                return cached
+
+        org, repo_name = repo.full_name.split("/")
+        content = await self.github_client._get_file_content(org, repo_name, path)
+        if not content:
+            return None
+        return cache.parse(kind, content, parser, sha=entry.sha if entry else None)
 
     def _parse_agent_frontmatter(self, content: str) -> dict[str, str]:
         """
@@ -321,3 +459,25 @@ class ClaudeCapabilitiesDetector:
                 "mcp_servers_count": len(config.mcp_servers),
             },
         }
+
+
+def _markdown_names(paths: list[str], directory: str) -> list[str]:
+    """
+    Names of the markdown definitions among the entries under a directory
+
+    Files in subdirectories are namespaced the way Claude Code invokes them
+    (".claude/commands/innovation/new-idea.md" is "innovation:new-idea"), and
+    README files documenting the directory are not definitions.
+    """
+    names = []
+    for path in paths:
+        relative = Path(path).relative_to(directory)
+        if relative.suffix != ".md" or relative.stem.lower() == "readme":
+            continue
+        names.append(":".join((*relative.parent.parts, relative.stem)))
+    return sorted(names)
+
+
+def _markdown_path(directory: str, name: str) -> str:
+    """Repository path of a (possibly namespaced) markdown definition"""
+    return f"{directory}/{name.replace(':', '/')}.md"
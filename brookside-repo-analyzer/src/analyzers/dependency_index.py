@@ -0,0 +1,169 @@
+"""
+Dependency Index for Brookside BI Repository Analyzer
+
+Establishes a per-scan inverted index from normalized dependency name to the
+repositories declaring it, stored as bitsets, plus a token index over
+dependency names for substring rules such as "azure-functions" or "event".
+Pattern extractors query the index instead of looping over every dependency of
+every repository, so mining cost follows the number of rules rather than
+repositories x dependencies x rules.
+
+Best for: Pattern mining across large portfolios where many rules are evaluated
+against the same dependency lists.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from src.bitset_index import BitsetIndex
+from src.models import RepoAnalysis
+
+# Alphanumeric runs of a normalized dependency name, e.g. "azure", "functions"
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_dependency(name: str) -> str:
+    """Normalize a dependency name for matching (case and surrounding whitespace)"""
+    return name.strip().lower()
+
+
+class DependencyIndex:
+    """
+    Inverted index of dependencies over one scan's repositories
+
+    Bit positions follow input order (the first repository is bit 0), so
+    bitsets from the index combine with bitsets callers build over the same
+    repository list, and repositories() returns names in input order.
+
+    Example:
+        >>> index = DependencyIndex.from_analyses(analyses)
+        >>> serverless = index.containing("azure-functions", "aws-lambda")
+        >>> index.repositories(serverless & ~index.exact("flask"))
+        ['ingest-service', 'cost-reporter']
+    """
+
+    def __init__(self, repositories: Iterable[tuple[str, Iterable[str]]]):
+        """
+        Build the index
+
+        Args:
+            repositories: (repository name, dependency names) pairs; repeated
+                dependencies within a repository count once
+        """
+        self.names: list[str] = []
+        self.index: BitsetIndex[str, int] = BitsetIndex()
+        # Normalized name -> first spelling seen, in first-seen order
+        self.spellings: dict[str, str] = {}
+
+        for position, (name, dependencies) in enumerate(repositories):
+            self.names.append(name)
+            normalized: set[str] = set()
+            for dependency in dependencies:
+                key = normalize_dependency(dependency)
+                if key:
+                    self.spellings.setdefault(key, dependency.strip())
+                    normalized.add(key)
+            self.index.update(position, normalized)
+
+        # Token -> dependency names containing it
+        self.tokens: dict[str, set[str]] = defaultdict(set)
+        for dependency in self.spellings:
+            for token in TOKEN_PATTERN.findall(dependency):
+                self.tokens[token].add(dependency)
+
+        self._containing: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed repositories"""
+        return len(self.names)
+
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[RepoAnalysis]) -> "DependencyIndex":
+        """Index repository analyses by repository name"""
+        return cls(
+            (analysis.repository.name, [dep.name for dep in analysis.dependencies])
+            for analysis in analyses
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "DependencyIndex":
+        """Index cached scan records ({"name": ..., "dependencies": [{"name": ...}]})"""
+        return cls(
+            (
+                record.get("name", "Unknown"),
+                [dep.get("name", "") for dep in record.get("dependencies", [])],
+            )
+            for record in records
+        )
+
+    @property
+    def all_bits(self) -> int:
+        """Bitset of every indexed repository"""
+        return (1 << len(self.names)) - 1
+
+    def exact(self, *names: str) -> int:
+        """Bitset of repositories declaring any of the dependencies (exact name)"""
+        bits = 0
+        for name in names:
+            bits |= self.index.bits(normalize_dependency(name))
+        return bits
+
+    def containing(self, *needles: str) -> int:
+        """
+        Bitset of repositories with a dependency whose name contains any needle
+
+        Candidates are narrowed through the token index and results are
+        memoized per needle, so repeated rules cost a dictionary lookup.
+
+        Args:
+            needles: Substrings matched case-insensitively
+
+        Returns:
+            Repository bitset
+        """
+        bits = 0
+        for needle in needles:
+            needle = normalize_dependency(needle)
+            if needle not in self._containing:
+                self._containing[needle] = self._match(needle)
+            bits |= self._containing[needle]
+        return bits
+
+    def _match(self, needle: str) -> int:
+        """Resolve one substring rule against the token index"""
+        needle_tokens = TOKEN_PATTERN.findall(needle)
+        if needle_tokens:
+            # Each alphanumeric run of the needle lies inside one token of a match
+            anchor = max(needle_tokens, key=len)
+            candidates: set[str] = set()
+            for token, dependencies in self.tokens.items():
+                if anchor in token:
+                    candidates |= dependencies
+        else:
+            candidates = set(self.spellings)
+
+        bits = 0
+        for dependency in candidates:
+            if needle in dependency:
+                bits |= self.index.bits(dependency)
+        return bits
+
+    def repositories(self, bits: int) -> list[str]:
+        """Repository names in a bitset, in input order"""
+        return [self.names[position] for position in self.index.members(bits)]
+
+    def shared(self, min_repositories: int) -> dict[str, int]:
+        """
+        Dependencies declared by at least min_repositories repositories
+
+        Returns:
+            Mapping of dependency (first spelling seen) to repository bitset, in
+            first-seen order
+        """
+        return {
+            spelling: bits
+            for key, spelling in self.spellings.items()
+            if (bits := self.index.bits(key)).bit_count() >= min_repositories
+        }
@@ -12,6 +12,7 @@ import logging
 from collections import Counter, defaultdict
 from typing import Any
 
+from src.analyzers.dependency_index import DependencyIndex
 from src.models import Component, Pattern, PatternType, RepoAnalysis
 
 logger = logging.getLogger(__name__)
@@ -32,12 +33,15 @@ class PatternMiner:
         """Initialize pattern miner"""
         pass
 
-    def extract_patterns(self, repos: list[RepoAnalysis]) -> list[Pattern]:
+    def extract_patterns(
+        self, repos: list[RepoAnalysis], index: DependencyIndex | None = None
+    ) -> list[Pattern]:
         """
         Extract patterns from repository analyses
 
         Args:
             repos: List of repository analyses
+            index: Dependency index over repos, in the same order (built if omitted)
 
         Returns:
             List of identified patterns
@@ -52,12 +56,15 @@ class PatternMiner:
 
         patterns: list[Pattern] = []
 
+        # Index dependencies once; extractors query it instead of rescanning
+        index = index or DependencyIndex.from_analyses(repos)
+
         # Extract architectural patterns
-        arch_patterns = self._extract_architectural_patterns(repos)
+        arch_patterns = self._extract_architectural_patterns(repos, index)
         patterns.extend(arch_patterns)
 
         # Extract shared dependency patterns
-        dep_patterns = self._extract_dependency_patterns(repos)
+        dep_patterns = self._extract_dependency_patterns(index)
         patterns.extend(dep_patterns)
 
         # Extract Microsoft ecosystem patterns
@@ -68,17 +75,13 @@ class PatternMiner:
         return patterns
 
     def _extract_architectural_patterns(
-        self, repos: list[RepoAnalysis]
+        self, repos: list[RepoAnalysis], index: DependencyIndex
     ) -> list[Pattern]:
         """Extract architectural patterns from repositories"""
         patterns: list[Pattern] = []
 
         # Detect serverless pattern (Azure Functions)
-        serverless_repos = [
-            r.repository.name
-            for r in repos
-            if any("azure-functions" in dep.name.lower() for dep in r.dependencies)
-        ]
+        serverless_repos = index.repositories(index.containing("azure-functions"))
 
         if len(serverless_repos) >= 2:
             patterns.append(
@@ -104,15 +107,11 @@ class PatternMiner:
             )
 
         # Detect API-first pattern
-        api_repos = [
-            r.repository.name
-            for r in repos
-            if r.repository.primary_language in ["TypeScript", "Python", "C#"]
-            and any(
-                "express" in dep.name.lower() or "fastapi" in dep.name.lower()
-                for dep in r.dependencies
-            )
-        ]
+        api_languages = 0
+        for position, r in enumerate(repos):
+            if r.repository.primary_language in ["TypeScript", "Python", "C#"]:
+                api_languages |= 1 << position
+        api_repos = index.repositories(api_languages & index.containing("express", "fastapi"))
 
         if len(api_repos) >= 2:
             patterns.append(
@@ -137,39 +136,32 @@ class PatternMiner:
 
         return patterns
 
-    def _extract_dependency_patterns(self, repos: list[RepoAnalysis]) -> list[Pattern]:
+    def _extract_dependency_patterns(self, index: DependencyIndex) -> list[Pattern]:
         """Extract patterns from shared dependencies"""
         patterns: list[Pattern] = []
 
-        # Count dependency usage across repos
-        dep_usage: dict[str, list[str]] = defaultdict(list)
-
-        for repo in repos:
-            for dep in repo.dependencies:
-                dep_usage[dep.name].append(repo.repository.name)
-
         # Find commonly used dependencies (3+ repos)
-        for dep_name, using_repos in dep_usage.items():
-            if len(using_repos) >= 3:
-                # Determine if it's a Microsoft technology
-                ms_tech = None
-                if "azure" in dep_name.lower():
-                    ms_tech = "Azure SDK"
-                elif "microsoft" in dep_name.lower():
-                    ms_tech = "Microsoft Library"
+        for dep_name, bits in index.shared(min_repositories=3).items():
+            using_repos = index.repositories(bits)
+            # Determine if it's a Microsoft technology
+            ms_tech = None
+            if "azure" in dep_name.lower():
+                ms_tech = "Azure SDK"
+            elif "microsoft" in dep_name.lower():
+                ms_tech = "Microsoft Library"
 
-                patterns.append(
-                    Pattern(
-                        name=f"Shared Dependency: {dep_name}",
-                        pattern_type=PatternType.INTEGRATION,
-                        description=f"Commonly used dependency across {len(using_repos)} repositories",
-                        repos_using=using_repos,
-                        reusability_score=70,
-                        microsoft_technology=ms_tech,
-                        benefits=[f"Proven in {len(using_repos)} production repositories"],
-                        considerations=["Version consistency across repos"],
-                    )
+            patterns.append(
+                Pattern(
+                    name=f"Shared Dependency: {dep_name}",
+                    pattern_type=PatternType.INTEGRATION,
+                    description=f"Commonly used dependency across {len(using_repos)} repositories",
+                    repos_using=using_repos,
+                    reusability_score=70,
+                    microsoft_technology=ms_tech,
+                    benefits=[f"Proven in {len(using_repos)} production repositories"],
+                    considerations=["Version consistency across repos"],
                 )
+            )
 
         return patterns
 
@@ -8,21 +8,61 @@ Best for: Organizations requiring systematic repository evaluation to drive
 informed decisions about maintenance, investment, and knowledge extraction.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from src.github_mcp_client import GitHubMCPClient
+from src.github_mcp_client import DEPENDENCY_MANIFESTS, GitHubMCPClient
+from src.graphql_fetcher import GraphQLSignalFetcher
 from src.models import (
+    CommitStats,
     RepoAnalysis,
     Repository,
+    RepoSignals,
     ReusabilityRating,
     ViabilityRating,
     ViabilityScore,
 )
+from src.pipeline import Pipeline, Step
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bump when scoring or detection logic changes so cached analyses are recomputed
+ANALYZER_VERSION = "1"
+
+# Paths probed for quality metrics (trailing "/" marks a directory)
+TEST_INDICATORS = ["tests/", "test/", "__tests__/", "spec/"]
+CI_INDICATORS = [
+    ".github/workflows/",
+    ".gitlab-ci.yml",
+    "azure-pipelines.yml",
+    ".circleci/config.yml",
+]
+DOCUMENTATION_INDICATORS = ["README.md"]
+
+# Values supplied to every analysis pipeline run
+ANALYSIS_INPUTS = ("repo", "signals", "file_signals", "limit")
+
+# Pipeline results combined into a RepoAnalysis (argument order of _assemble_analysis)
+ANALYSIS_FIELDS = (
+    "repo",
+    "languages",
+    "dependencies",
+    "viability",
+    "commit_stats",
+    "monthly_cost",
+    "reusability",
+    "microsoft_services",
+    "has_tests",
+    "test_coverage",
+    "has_ci_cd",
+    "has_documentation",
+)
+
 
 class RepositoryAnalyzer:
     """
@@ -48,16 +88,99 @@ class RepositoryAnalyzer:
             ...     analysis = await analyzer.analyze_repository(repo)
         """
         self.github_client = github_client
+        self.pipeline = self._build_pipeline()
+
+    async def prefetch_signals(self, repos: list[Repository]) -> dict[str, RepoSignals]:
+        """
+        Prefetch analysis inputs for many repositories via batched GraphQL queries
+
+        Args:
+            repos: Repositories to be analyzed
+
+        With the analysis cache enabled, head SHAs are fetched first and only
+        repositories without a current cached analysis have their manifests and
+        probe paths fetched; the others get signals with paths_probed False.
+
+        Returns:
+            Mapping of full repository name to RepoSignals (missing entries fall back to REST)
+
+        Example:
+            >>> signals = await analyzer.prefetch_signals(repos)
+            >>> analysis = await analyzer.analyze_repository(repo, signals=signals.get(repo.full_name))
+        """
+        settings = self.github_client.settings.github
+        if not settings.graphql_enabled:
+            return {}
+
+        existence_paths = TEST_INDICATORS + CI_INDICATORS + DOCUMENTATION_INDICATORS
+        content_paths = list(DEPENDENCY_MANIFESTS)
+        # Statistics endpoints and the commit ledger count commits more accurately
+        include_commit_activity = (
+            not settings.stats_endpoints_enabled and self.github_client.commit_ledger is None
+        )
+        cache = self.github_client.analysis_cache
+        if cache is None:
+            fetcher = GraphQLSignalFetcher(
+                self.github_client,
+                existence_paths=existence_paths,
+                content_paths=content_paths,
+                batch_size=settings.graphql_batch_size,
+                include_commit_activity=include_commit_activity,
+            )
+            return await fetcher.fetch(repos)
+
+        signals = await GraphQLSignalFetcher(
+            self.github_client,
+            [],
+            [],
+            batch_size=settings.graphql_batch_size,
+            include_commit_activity=include_commit_activity,
+        ).fetch(repos)
+        changed = [
+            repo
+            for repo in repos
+            if repo.full_name in signals
+            and not cache.contains(
+                repo.full_name, signals[repo.full_name].head_sha, ANALYZER_VERSION
+            )
+        ]
+        if not changed:
+            return signals
+
+        probes = await GraphQLSignalFetcher(
+            self.github_client,
+            existence_paths=existence_paths,
+            content_paths=content_paths,
+            batch_size=settings.graphql_batch_size,
+            include_fragment=False,
+        ).fetch(changed)
+        for full_name, probed in probes.items():
+            signals[full_name] = signals[full_name].model_copy(
+                update={
+                    "paths_present": probed.paths_present,
+                    "file_contents": probed.file_contents,
+                    "paths_probed": True,
+                }
+            )
+        return signals
 
     async def analyze_repository(
-        self, repo: Repository, deep_analysis: bool = True
+        self,
+        repo: Repository,
+        deep_analysis: bool = True,
+        signals: RepoSignals | None = None,
+        steps: Sequence[Step] = (),
     ) -> RepoAnalysis:
         """
         Perform comprehensive repository analysis
 
         Args:
             repo: Repository to analyze
-            deep_analysis: Enable deep code analysis (slower but more thorough)
+            deep_analysis: Enable deep code analysis; with snapshot analysis enabled,
+                files are read from a downloaded tarball instead of per-file requests
+            signals: Prefetched inputs (see prefetch_signals); fetched via REST if None
+            steps: Extra pipeline steps run alongside the analysis; results of steps
+                named after a RepoAnalysis field (e.g. "claude_config") are assigned to it
 
         Returns:
             Complete RepoAnalysis object
@@ -69,53 +192,208 @@ class RepositoryAnalyzer:
         """
         logger.info(f"Analyzing repository: {repo.name}")
 
-        # Gather repository data
-        languages = await self.github_client.get_repository_languages(repo)
-        dependencies = await self.github_client.get_repository_dependencies(repo)
-        commit_stats = await self.github_client.get_commit_activity(repo, days=90)
+        pipeline = self.pipeline.extend(steps) if steps else self.pipeline
+        extra_targets = [step.name for step in steps]
 
-        # Quality metrics
-        has_tests = await self._check_has_tests(repo)
-        has_ci_cd = await self._check_has_ci_cd(repo)
-        has_documentation = await self._check_has_documentation(repo)
+        # Independent fetches run concurrently; the limit bounds requests in flight
+        limit = asyncio.Semaphore(
+            self.github_client.settings.analysis.max_concurrent_fetches_per_repo
+        )
 
-        # Calculate test coverage (approximation based on file structure)
-        test_coverage = await self._estimate_test_coverage(repo) if has_tests else None
+        # Signals without probed paths leave file checks to REST or the snapshot
+        file_signals = signals if signals is not None and signals.paths_probed else None
+
+        # Unchanged repositories reuse their last analysis (see AnalysisCache)
+        cache = self.github_client.analysis_cache
+        head_sha = None
+        if cache:
+            head_sha = (signals.head_sha if signals else None) or (
+                await self.github_client.get_head_sha(repo)
+            )
+        if head_sha:
+            cached = cache.get(repo.full_name, head_sha, ANALYZER_VERSION)
+            if cached:
+                results = await pipeline.run(
+                    ["commit_stats", *extra_targets],
+                    repo=repo,
+                    signals=signals,
+                    file_signals=file_signals,
+                    limit=limit,
+                )
+                analysis = self._refresh_cached_analysis(cached, repo, results["commit_stats"])
+                return _apply_step_results(analysis, results, extra_targets)
+
+        # Deep analysis reads files from a local tarball snapshot when enabled
+        snapshot = None
+        if deep_analysis and self.github_client.settings.analysis.snapshot_analysis_enabled:
+            snapshot = await self.github_client.load_snapshot(repo)
+
+        try:
+            results = await pipeline.run(
+                ["analysis", *extra_targets],
+                repo=repo,
+                signals=signals,
+                # Snapshot files take precedence over prefetched file signals
+                file_signals=file_signals if snapshot is None else None,
+                limit=limit,
+            )
+        finally:
+            if snapshot:
+                self.github_client.release_snapshot(repo)
+
+        analysis = results["analysis"]
 
-        # Calculate viability score
-        viability = self.calculate_viability_score(
-            repo=repo,
-            has_tests=has_tests,
-            test_coverage=test_coverage,
-            has_documentation=has_documentation,
-            dependencies_count=len(dependencies),
-            commit_stats=commit_stats,
+        logger.info(
+            f"Analysis complete for {repo.name}: "
+            f"Viability={analysis.viability.rating.value}, "
+            f"Reusability={analysis.reusability_rating.value}"
         )
 
-        # Determine reusability rating
-        reusability = self._calculate_reusability_rating(
-            repo=repo,
-            viability_score=viability.total_score,
-            has_tests=has_tests,
-            has_documentation=has_documentation,
-        )
+        if head_sha:
+            cache.put(analysis, head_sha, ANALYZER_VERSION)
 
-        # Detect Microsoft services
-        microsoft_services = self._detect_microsoft_services(
-            dependencies=dependencies,
-            languages=languages,
-        )
+        return _apply_step_results(analysis, results, extra_targets)
 
-        # Calculate monthly cost (will be enhanced by cost_calculator module)
-        monthly_cost = sum(dep.estimated_monthly_cost for dep in dependencies)
+    def _build_pipeline(self) -> Pipeline:
+        """
+        Declare the analysis steps and the inputs each one needs
+
+        Providers answer from prefetched signals when present and fetch via REST
+        otherwise; scoring steps only combine provider results.
+        """
+
+        def fetched(
+            fn: Callable[[Repository], Awaitable[T]], prefetched: Callable[[RepoSignals], T]
+        ) -> Callable[..., Awaitable[T]]:
+            async def provide(repo: Repository, signals: RepoSignals | None, limit: Any) -> T:
+                if signals:
+                    return prefetched(signals)
+                return await _bounded(limit, fn, repo)
+
+            return provide
+
+        # Client methods are looked up on each call, not bound once here
+        return Pipeline(
+            [
+                # Providers
+                Step(
+                    "languages",
+                    fetched(
+                        lambda repo: self.github_client.get_repository_languages(repo),
+                        lambda s: s.languages,
+                    ),
+                    ("repo", "signals", "limit"),
+                ),
+                Step(
+                    "commit_stats",
+                    self._get_commit_stats,
+                    ("repo", "signals", "limit"),
+                ),
+                Step(
+                    "dependencies",
+                    fetched(
+                        lambda repo: self.github_client.get_repository_dependencies(repo),
+                        lambda s: self.github_client.parse_dependency_manifests(
+                            s.file_contents
+                        ),
+                    ),
+                    ("repo", "file_signals", "limit"),
+                ),
+                Step(
+                    "has_tests",
+                    self._check_has_tests,
+                    ("repo", "file_signals", "limit"),
+                ),
+                Step(
+                    "has_ci_cd",
+                    self._check_has_ci_cd,
+                    ("repo", "file_signals", "limit"),
+                ),
+                Step(
+                    "has_documentation",
+                    self._check_has_documentation,
+                    ("repo", "file_signals", "limit"),
+                ),
+                # Derived results
+                Step(
+                    "test_coverage",
+                    # Approximation based on file structure
+                    lambda has_tests, has_ci_cd: (
+                        self._estimate_test_coverage(has_ci_cd) if has_tests else None
+                    ),
+                    ("has_tests", "has_ci_cd"),
+                ),
+                Step(
+                    "viability",
+                    lambda repo, has_tests, coverage, has_docs, dependencies, commit_stats: (
+                        self.calculate_viability_score(
+                            repo=repo,
+                            has_tests=has_tests,
+                            test_coverage=coverage,
+                            has_documentation=has_docs,
+                            dependencies_count=len(dependencies),
+                            commit_stats=commit_stats,
+                        )
+                    ),
+                    (
+                        "repo",
+                        "has_tests",
+                        "test_coverage",
+                        "has_documentation",
+                        "dependencies",
+                        "commit_stats",
+                    ),
+                ),
+                Step(
+                    "reusability",
+                    lambda repo, viability, has_tests, has_docs: (
+                        self._calculate_reusability_rating(
+                            repo=repo,
+                            viability_score=viability.total_score,
+                            has_tests=has_tests,
+                            has_documentation=has_docs,
+                        )
+                    ),
+                    ("repo", "viability", "has_tests", "has_documentation"),
+                ),
+                Step(
+                    "microsoft_services",
+                    self._detect_microsoft_services,
+                    ("dependencies", "languages"),
+                ),
+                Step(
+                    # Will be enhanced by cost_calculator module
+                    "monthly_cost",
+                    lambda dependencies: sum(dep.estimated_monthly_cost for dep in dependencies),
+                    ("dependencies",),
+                ),
+                Step("analysis", self._assemble_analysis, ANALYSIS_FIELDS),
+            ],
+            inputs=ANALYSIS_INPUTS,
+        )
 
-        # Build analysis result
-        analysis = RepoAnalysis(
+    @staticmethod
+    def _assemble_analysis(
+        repo: Repository,
+        languages: dict[str, int],
+        dependencies: list[Any],
+        viability: ViabilityScore,
+        commit_stats: CommitStats,
+        monthly_cost: float,
+        reusability: ReusabilityRating,
+        microsoft_services: list[str],
+        has_tests: bool,
+        test_coverage: float | None,
+        has_ci_cd: bool,
+        has_documentation: bool,
+    ) -> RepoAnalysis:
+        """Build the RepoAnalysis from the pipeline results named in ANALYSIS_FIELDS"""
+        return RepoAnalysis(
             repository=repo,
             languages=languages,
             dependencies=dependencies,
             viability=viability,
-            claude_config=None,  # Will be populated by claude_detector if .claude/ exists
+            claude_config=None,  # Populated by a claude_config step when one is given
             commit_stats=commit_stats,
             monthly_cost=monthly_cost,
             reusability_rating=reusability,
@@ -126,12 +404,61 @@ class RepositoryAnalyzer:
             has_documentation=has_documentation,
         )
 
+    def _refresh_cached_analysis(
+        self, analysis: RepoAnalysis, repo: Repository, commit_stats: CommitStats
+    ) -> RepoAnalysis:
+        """
+        Bring a cached analysis of an unchanged repository up to date
+
+        Content-derived fields are kept; repository metadata and commit activity
+        (whose rolling windows move with time) are refreshed and the analysis re-scored.
+
+        Args:
+            analysis: Cached analysis for the repository's current head
+            repo: Freshly listed repository metadata
+            commit_stats: Current commit statistics
+
+        Returns:
+            The refreshed analysis
+        """
+        analysis.repository = repo
+        self.apply_commit_stats(analysis, commit_stats)
+
         logger.info(
-            f"Analysis complete for {repo.name}: "
-            f"Viability={viability.rating.value}, "
-            f"Reusability={reusability.value}"
+            f"Analysis reused for unchanged {repo.name}: "
+            f"Viability={analysis.viability.rating.value}"
         )
+        return analysis
+
+    def apply_commit_stats(self, analysis: RepoAnalysis, commit_stats: CommitStats) -> RepoAnalysis:
+        """
+        Replace an analysis's commit statistics and re-score it
+
+        Used when accurate statistics arrive after the analysis was built from
+        provisional counts (see GitHubMCPClient.deferred_stats).
+
+        Args:
+            analysis: Analysis to update in place
+            commit_stats: Accurate commit statistics
 
+        Returns:
+            The updated analysis
+        """
+        analysis.commit_stats = commit_stats
+        analysis.viability = self.calculate_viability_score(
+            repo=analysis.repository,
+            has_tests=analysis.has_tests,
+            test_coverage=analysis.test_coverage_percentage,
+            has_documentation=analysis.has_documentation,
+            dependencies_count=len(analysis.dependencies),
+            commit_stats=commit_stats,
+        )
+        analysis.reusability_rating = self._calculate_reusability_rating(
+            repo=analysis.repository,
+            viability_score=analysis.viability.total_score,
+            has_tests=analysis.has_tests,
+            has_documentation=analysis.has_documentation,
+        )
         return analysis
 
     def calculate_viability_score(
@@ -325,50 +652,115 @@ class RepositoryAnalyzer:
 
         return sorted(list(services))
 
-    async def _check_has_tests(self, repo: Repository) -> bool:
-        """Check if repository has test directory or files"""
-        test_indicators = ["tests/", "test/", "__tests__/", "spec/"]
+    async def _get_commit_stats(
+        self,
+        repo: Repository,
+        signals: RepoSignals | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> CommitStats:
+        """
+        Use prefetched commit statistics, or read them via get_commit_activity
 
-        for indicator in test_indicators:
-            if await self.github_client.check_file_exists(repo, indicator):
-                return True
+        Prefetched signals carry no statistics when the statistics endpoints or
+        the commit ledger are enabled, so those paths (and 202 deferral) still run.
+        """
+        if signals and signals.commit_stats is not None:
+            return signals.commit_stats
+        return await _bounded(limit, self.github_client.get_commit_activity, repo, 90)
 
-        return False
+    async def _check_has_tests(
+        self,
+        repo: Repository,
+        signals: RepoSignals | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> bool:
+        """Check if repository has test directory or files"""
+        return await self._any_path_exists(repo, TEST_INDICATORS, signals, limit)
 
-    async def _check_has_ci_cd(self, repo: Repository) -> bool:
+    async def _check_has_ci_cd(
+        self,
+        repo: Repository,
+        signals: RepoSignals | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> bool:
         """Check if repository has CI/CD configuration"""
-        ci_indicators = [
-            ".github/workflows/",
-            ".gitlab-ci.yml",
-            "azure-pipelines.yml",
-            ".circleci/config.yml",
-        ]
+        return await self._any_path_exists(repo, CI_INDICATORS, signals, limit)
 
-        for indicator in ci_indicators:
-            if await self.github_client.check_file_exists(repo, indicator):
-                return True
-
-        return False
-
-    async def _check_has_documentation(self, repo: Repository) -> bool:
+    async def _check_has_documentation(
+        self,
+        repo: Repository,
+        signals: RepoSignals | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> bool:
         """Check if repository has documentation"""
         # README is the primary indicator
-        return await self.github_client.check_file_exists(repo, "README.md")
+        return await self._any_path_exists(repo, DOCUMENTATION_INDICATORS, signals, limit)
+
+    async def _any_path_exists(
+        self,
+        repo: Repository,
+        paths: list[str],
+        signals: RepoSignals | None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> bool:
+        """
+        Check indicator paths against prefetched signals, or probe them via REST
 
-    async def _estimate_test_coverage(self, repo: Repository) -> float | None:
+        Probes run concurrently (bounded by limit); the first hit cancels the rest.
+        """
+        if signals:
+            return any(signals.exists(path) for path in paths)
+
+        probes = [
+            asyncio.create_task(_bounded(limit, self.github_client.check_file_exists, repo, path))
+            for path in paths
+        ]
+        try:
+            for probe in asyncio.as_completed(probes):
+                if await probe:
+                    return True
+            return False
+        finally:
+            for probe in probes:
+                probe.cancel()
+            # Let cancelled probes finish so none outlive the analysis
+            await asyncio.gather(*probes, return_exceptions=True)
+
+    def _estimate_test_coverage(self, has_ci_cd: bool) -> float | None:
         """
         Estimate test coverage based on available indicators
 
         This is an approximation. True coverage requires running tests
         or parsing coverage reports.
 
+        Args:
+            has_ci_cd: Whether CI/CD configuration was found
+
         Returns:
             Estimated coverage percentage (0-100) or None
         """
         # Simple heuristic: if tests exist and CI/CD is configured, assume decent coverage
-        has_ci_cd = await self._check_has_ci_cd(repo)
-
         if has_ci_cd:
             return 70.0  # Optimistic estimate for CI/CD repos
 
         return 40.0  # Conservative estimate for repos with tests but no CI/CD
+
+
+async def _bounded(
+    limit: asyncio.Semaphore | None, fn: Callable[..., Awaitable[T]], *args: Any
+) -> T:
+    """Await fn(*args) while holding a slot of limit (unbounded if None)"""
+    if limit is None:
+        return await fn(*args)
+    async with limit:
+        return await fn(*args)
+
+
+def _apply_step_results(
+    analysis: RepoAnalysis, results: dict[str, Any], names: list[str]
+) -> RepoAnalysis:
+    """Assign results of extra pipeline steps named after RepoAnalysis fields"""
+    for name in names:
+        if name in RepoAnalysis.model_fields:
+            setattr(analysis, name, results[name])
+    return analysis
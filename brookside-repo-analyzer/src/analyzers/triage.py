@@ -0,0 +1,193 @@
+"""
+Repository Triage for Brookside BI Repository Analyzer
+
+Establishes a cheap first pass that scores every repository from the metadata
+the organization listing already returns (push date, size, archived and fork
+flags, language, topics) and promotes only repositories that pass a policy to
+the expensive per-repository analysis.
+
+Best for: Organizations with thousands of repositories, where API spend should
+scale with active repositories rather than everything ever created.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from src.config import Settings
+from src.models import Repository
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 86400
+
+
+@dataclass(frozen=True)
+class TriagePolicy:
+    """Rules a repository must pass to be promoted to deep analysis"""
+
+    include_forks: bool = False
+    include_archived: bool = False
+    max_days_since_push: int = 730
+    min_size_kb: int = 1  # Skips empty repositories
+    min_score: int = 0
+    excluded_topics: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TriagePolicy":
+        """Build the policy from analysis settings"""
+        analysis = settings.analysis
+        return cls(
+            include_forks=analysis.triage_include_forks,
+            include_archived=analysis.triage_include_archived,
+            max_days_since_push=analysis.triage_max_days_since_push,
+            min_size_kb=analysis.triage_min_size_kb,
+            min_score=analysis.triage_min_score,
+            excluded_topics=frozenset(topic.lower() for topic in analysis.triage_excluded_topics),
+        )
+
+
+@dataclass
+class TriageResult:
+    """Triage outcome for one repository"""
+
+    repository: Repository
+    score: int
+    promoted: bool
+    reasons: list[str] = field(default_factory=list)  # Why the repository was not promoted
+
+
+class RepositoryTriage:
+    """
+    Metadata-only scoring and promotion of repositories
+
+    Scoring (0-100):
+    - Recency of last push (0-50)
+    - Size (0-15)
+    - Stars and forks (0-15)
+    - Primary language detected (0-10)
+    - Topics assigned (0-10)
+
+    Example:
+        >>> triage = RepositoryTriage(TriagePolicy(max_days_since_push=365))
+        >>> result = triage.assess(repo)
+        >>> if not result.promoted:
+        ...     print(f"Skipped {repo.name}: {', '.join(result.reasons)}")
+    """
+
+    def __init__(self, policy: TriagePolicy | None = None):
+        """
+        Initialize repository triage
+
+        Args:
+            policy: Promotion rules (defaults to TriagePolicy())
+        """
+        self.policy = policy or TriagePolicy()
+        self.promoted = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, enabled: bool | None = None
+    ) -> "RepositoryTriage | None":
+        """
+        Create triage from settings, or None if triage is disabled
+
+        Args:
+            settings: Analysis settings (policy thresholds and triage_enabled)
+            enabled: Override of triage_enabled (e.g. a CLI flag); None uses the setting
+        """
+        if not (settings.analysis.triage_enabled if enabled is None else enabled):
+            return None
+        return cls(TriagePolicy.from_settings(settings))
+
+    def score(self, repo: Repository, now: datetime | None = None) -> int:
+        """
+        Score a repository from listing metadata alone
+
+        Args:
+            repo: Repository listed by the organization
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Score from 0 to 100
+        """
+        days = _days_since_push(repo, now)
+        if days is None:
+            recency = 0
+        elif days <= 30:
+            recency = 50
+        elif days <= 90:
+            recency = 40
+        elif days <= 365:
+            recency = 25
+        elif days <= 730:
+            recency = 10
+        else:
+            recency = 0
+
+        if repo.size_kb >= 1_000:
+            size = 15
+        elif repo.size_kb >= 100:
+            size = 10
+        elif repo.size_kb > 0:
+            size = 5
+        else:
+            size = 0
+
+        popularity = min(15, repo.stars_count + 2 * repo.forks_count)
+        language = 10 if repo.primary_language else 0
+        topics = 10 if repo.topics else 0
+
+        return recency + size + popularity + language + topics
+
+    def assess(self, repo: Repository, now: datetime | None = None) -> TriageResult:
+        """
+        Score a repository and decide whether it is promoted to deep analysis
+
+        Args:
+            repo: Repository listed by the organization
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            TriageResult with the reasons it was held back, if any
+        """
+        policy = self.policy
+        reasons: list[str] = []
+
+        if repo.is_fork and not policy.include_forks:
+            reasons.append("fork")
+        if repo.is_archived and not policy.include_archived:
+            reasons.append("archived")
+
+        days = _days_since_push(repo, now)
+        if days is None or days > policy.max_days_since_push:
+            reasons.append(f"no push in {policy.max_days_since_push} days")
+        if repo.size_kb < policy.min_size_kb:
+            reasons.append(f"smaller than {policy.min_size_kb} KB")
+
+        excluded = policy.excluded_topics.intersection(topic.lower() for topic in repo.topics)
+        if excluded:
+            reasons.append(f"topic {', '.join(sorted(excluded))}")
+
+        score = self.score(repo, now)
+        if score < policy.min_score:
+            reasons.append(f"score {score} below {policy.min_score}")
+
+        promoted = not reasons
+        if promoted:
+            self.promoted += 1
+        else:
+            self.skipped += 1
+        return TriageResult(repository=repo, score=score, promoted=promoted, reasons=reasons)
+
+
+def _days_since_push(repo: Repository, now: datetime | None) -> float | None:
+    """Days since the last push (None if never pushed); naive times are read as UTC"""
+    if repo.pushed_at is None:
+        return None
+    pushed_at = repo.pushed_at
+    if pushed_at.tzinfo is None:
+        pushed_at = pushed_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return (now - pushed_at).total_seconds() / DAY_SECONDS
@@ -157,6 +157,7 @@ class CredentialManager:
         self.settings = settings
         self.kv_client = keyvault_client or get_keyvault_client(settings)
         self._github_token: str | None = None
+        self._github_app_private_key: str | None = None
         self._notion_api_key: str | None = None
 
     @property
@@ -198,6 +199,42 @@ class CredentialManager:
                 e.details,
             )
 
+    @property
+    def github_app_private_key(self) -> str:
+        """
+        Get GitHub App private key
+
+        Returns key from environment or retrieves from Key Vault. Only needed
+        when GitHub App installations are pooled (see CredentialPool).
+
+        Returns:
+            str: PEM-encoded private key
+
+        Raises:
+            AuthenticationError: If key retrieval fails
+        """
+        if self._github_app_private_key:
+            return self._github_app_private_key
+
+        # Try environment variable first
+        if self.settings.github.app_private_key:
+            logger.info("Using GitHub App private key from environment variable")
+            self._github_app_private_key = self.settings.github.app_private_key
+            return self._github_app_private_key
+
+        # Fallback to Key Vault
+        try:
+            logger.info("Retrieving GitHub App private key from Azure Key Vault")
+            self._github_app_private_key = self.kv_client.get_secret("github-app-private-key")
+            return self._github_app_private_key
+        except KeyVaultError as e:
+            raise AuthenticationError(
+                "GitHub App private key not found in environment or Key Vault. "
+                "Set GITHUB_APP_PRIVATE_KEY environment variable or "
+                "add 'github-app-private-key' to Key Vault.",
+                e.details,
+            ) from e
+
     @property
     def notion_api_key(self) -> str:
         """
@@ -0,0 +1,135 @@
+"""
+Bitset Inverted Index for Brookside BI Repository Analyzer
+
+Establishes an inverted index from terms (agents, MCP servers, dependencies) to
+the set of repositories carrying them, with each repository set stored as a
+Python int used as a bitset. Set algebra across terms is then a handful of
+integer AND/OR operations, and one repository's terms can be replaced without
+rebuilding the index.
+
+Best for: Portfolio queries ("which repositories use X and Y but not Z") over
+thousands of repositories, answered in microseconds after a scan.
+"""
+
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)  # Term
+R = TypeVar("R", bound=Hashable)  # Repository identifier
+
+
+class BitsetIndex(Generic[K, R]):
+    """
+    Term -> repository bitset index with incremental updates
+
+    Each repository is assigned the next bit position when first indexed;
+    positions of removed repositories are reused so bitsets stay compact.
+
+    Example:
+        >>> index = BitsetIndex()
+        >>> index.update("org/app", ["notion", "github"])
+        >>> index.update("org/api", ["github"])
+        >>> index.decode(index.bits("github") & ~index.bits("notion"))
+        {'org/api'}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index"""
+        self._positions: dict[R, int] = {}
+        self._repositories: list[R | None] = []  # Position -> repository
+        self._free: list[int] = []
+        self._postings: dict[K, int] = {}
+        self._terms: dict[R, frozenset[K]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed repositories"""
+        return len(self._positions)
+
+    def __contains__(self, repository: R) -> bool:
+        return repository in self._positions
+
+    @property
+    def all_bits(self) -> int:
+        """Bitset of every indexed repository"""
+        bits = 0
+        for position in self._positions.values():
+            bits |= 1 << position
+        return bits
+
+    def update(self, repository: R, terms: Iterable[K]) -> None:
+        """
+        Set a repository's terms, replacing any previous ones
+
+        Only postings of added or removed terms are touched.
+
+        Args:
+            repository: Repository identifier (e.g. full name)
+            terms: Terms the repository carries
+        """
+        new_terms = frozenset(terms)
+        old_terms = self._terms.get(repository, frozenset())
+        position = self._positions.get(repository)
+        if position is None:
+            position = self._free.pop() if self._free else len(self._repositories)
+            if position == len(self._repositories):
+                self._repositories.append(repository)
+            else:
+                self._repositories[position] = repository
+            self._positions[repository] = position
+
+        bit = 1 << position
+        for term in old_terms - new_terms:
+            remaining = self._postings[term] & ~bit
+            if remaining:
+                self._postings[term] = remaining
+            else:
+                del self._postings[term]
+        for term in new_terms - old_terms:
+            self._postings[term] = self._postings.get(term, 0) | bit
+
+        self._terms[repository] = new_terms
+
+    def remove(self, repository: R) -> None:
+        """Drop a repository and its terms (no-op if not indexed)"""
+        if repository not in self._positions:
+            return
+        self.update(repository, ())
+        position = self._positions.pop(repository)
+        self._repositories[position] = None
+        self._free.append(position)
+        del self._terms[repository]
+
+    def bits(self, term: K) -> int:
+        """Bitset of repositories carrying a term (0 if none)"""
+        return self._postings.get(term, 0)
+
+    def count(self, term: K) -> int:
+        """Number of repositories carrying a term"""
+        return self.bits(term).bit_count()
+
+    def terms(self) -> Iterator[K]:
+        """Every term carried by at least one repository"""
+        return iter(self._postings)
+
+    def terms_of(self, repository: R) -> frozenset[K]:
+        """Terms of one repository"""
+        return self._terms.get(repository, frozenset())
+
+    def repositories(self) -> Iterator[R]:
+        """Every indexed repository"""
+        return iter(self._positions)
+
+    def decode(self, bits: int) -> set[R]:
+        """Convert a bitset into repository identifiers"""
+        return set(self.members(bits))
+
+    def members(self, bits: int) -> list[R]:
+        """Convert a bitset into repository identifiers, in bit position order"""
+        repositories: list[R] = []
+        while bits:
+            low = bits & -bits
+            repository = self._repositories[low.bit_length() - 1]
+            if repository is not None:
+                repositories.append(repository)
+            bits ^= low
+        return repositories
@@ -11,6 +11,7 @@ manual or automated execution via CLI.
 import asyncio
 import logging
 import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import click
@@ -18,14 +19,18 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from src.analyzers.capability_index import CAPABILITY_INDEX_FILE, CapabilityIndex
 from src.analyzers.claude_detector import ClaudeCapabilitiesDetector
 from src.analyzers.cost_calculator import CostCalculator
 from src.analyzers.pattern_miner import PatternMiner
 from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.analyzers.triage import RepositoryTriage
 from src.auth import CredentialManager
 from src.config import get_settings
 from src.github_mcp_client import GitHubMCPClient
+from src.models import Repository
 from src.notion_client import NotionIntegrationClient
+from src.scanner import SCAN_ORDERS, RepositoryScanner
 
 # Establish Windows-compatible console output to avoid encoding errors
 console = Console(legacy_windows=False, no_color=False, force_terminal=True)
@@ -85,7 +90,25 @@ def cli(log_level: str) -> None:
     default=True,
     help="Sync results to Notion",
 )
-def scan(org: str | None, all_orgs: bool, full: bool, sync: bool) -> None:
+@click.option(
+    "--order",
+    type=click.Choice(list(SCAN_ORDERS)),
+    default=None,
+    help="Analysis order of queued repositories (defaults to ANALYSIS_SCAN_ORDER)",
+)
+@click.option(
+    "--triage/--no-triage",
+    default=None,
+    help="Analyze only repositories passing the metadata triage policy (defaults to ANALYSIS_TRIAGE_ENABLED)",
+)
+def scan(
+    org: str | None,
+    all_orgs: bool,
+    full: bool,
+    sync: bool,
+    order: str | None,
+    triage: bool | None,
+) -> None:
     """
     Scan entire GitHub organization
 
@@ -95,11 +118,20 @@ def scan(org: str | None, all_orgs: bool, full: bool, sync: bool) -> None:
       brookside-analyze scan --full --sync
       brookside-analyze scan --org my-org --full
       brookside-analyze scan --all-orgs --full
+      brookside-analyze scan --all-orgs --order largest
+      brookside-analyze scan --all-orgs --triage
     """
-    asyncio.run(_scan_organization(org, all_orgs, full, sync))
+    asyncio.run(_scan_organization(org, all_orgs, full, sync, order, triage))
 
 
-async def _scan_organization(org: str | None, all_orgs: bool, full: bool, sync: bool) -> None:
+async def _scan_organization(
+    org: str | None,
+    all_orgs: bool,
+    full: bool,
+    sync: bool,
+    order: str | None = None,
+    triage: bool | None = None,
+) -> None:
     """Async implementation of organization scan"""
     console.print("\n[bold blue]Brookside BI Repository Analyzer[/bold blue]")
     console.print("[dim]Scanning GitHub organization...[/dim]\n")
@@ -144,49 +176,55 @@ async def _scan_organization(org: str | None, all_orgs: bool, full: bool, sync:
                 # Single organization scan
                 orgs_to_scan = [org or settings.github.organization]
 
-            # Aggregate all repositories across organizations
-            all_repos = []
-
-            for idx, org_name in enumerate(orgs_to_scan, 1):
-                if len(orgs_to_scan) > 1:
-                    console.print(f"\n[yellow]Scanning organization {idx}/{len(orgs_to_scan)}: {org_name}[/yellow]")
-                else:
-                    console.print(f"\n[yellow]Scanning organization: {org_name}[/yellow]")
+            async def stream_repositories() -> AsyncIterator[Repository]:
+                """Yield repositories org by org so analysis starts with the first page"""
+                for idx, org_name in enumerate(orgs_to_scan, 1):
+                    if len(orgs_to_scan) > 1:
+                        console.print(f"\n[yellow]Scanning organization {idx}/{len(orgs_to_scan)}: {org_name}[/yellow]")
+                    else:
+                        console.print(f"\n[yellow]Scanning organization: {org_name}[/yellow]")
 
-                repos = await github_client.list_organization_repos(org_name)
-                all_repos.extend(repos)
-                console.print(f"[green]Found {len(repos)} repositories in {org_name}[/green]")
+                    async for repo in github_client.iter_organization_repos(org_name):
+                        yield repo
 
-            console.print(f"\n[bold green]Total repositories to analyze: {len(all_repos)}[/bold green]\n")
-
-            # Analyze repositories
+            # Analyze repositories as they are listed
             analyzer = RepositoryAnalyzer(github_client)
             claude_detector = ClaudeCapabilitiesDetector(github_client)
-
-            analyses = []
-
-            # Analyze repositories without spinner to avoid Windows encoding issues
-            console.print(f"\n[yellow]Analyzing {len(all_repos)} repositories...[/yellow]")
-
-            for idx, repo in enumerate(all_repos, 1):
-                console.print(f"  [{idx}/{len(all_repos)}] {repo.name}...")
-
-                # Analyze repository
-                analysis = await analyzer.analyze_repository(repo, deep_analysis=full)
-
-                # Detect Claude capabilities if requested
-                if settings.analysis.detect_claude_configs:
-                    analysis.claude_config = await claude_detector.detect_claude_capabilities(
-                        repo
-                    )
-
-                analyses.append(analysis)
+            scanner = RepositoryScanner(
+                analyzer,
+                claude_detector if settings.analysis.detect_claude_configs else None,
+                deep_analysis=full,
+                order=order,
+                triage=RepositoryTriage.from_settings(settings, enabled=triage),
+            )
+
+            # Print progress without spinner to avoid Windows encoding issues
+            result = await scanner.scan(
+                stream_repositories(),
+                on_start=lambda idx, repo: console.print(f"  [{idx}] {repo.name}..."),
+            )
+            analyses = result.analyses
+
+            console.print(f"\n[bold green]Analyzed {len(analyses)}/{result.scanned} repositories[/bold green]")
+            if result.skipped:
+                console.print(f"[dim]Triage skipped {len(result.skipped)} inactive repositories[/dim]")
 
             # Display results
             console.print("\n[bold green]Analysis Complete![/bold green]\n")
 
             _display_summary_table(analyses)
 
+            # Refresh the capability index so later queries need no rescan
+            if settings.analysis.detect_claude_configs:
+                index_path = settings.analysis.cache_dir / CAPABILITY_INDEX_FILE
+                capability_index = CapabilityIndex.load(index_path)
+                for analysis in analyses:
+                    if analysis.claude_config is not None:
+                        capability_index.update(
+                            analysis.repository.full_name, analysis.claude_config
+                        )
+                capability_index.save(index_path)
+
             # Pattern mining
             if full:
                 console.print("\n[yellow]Extracting patterns...[/yellow]")
@@ -354,6 +392,73 @@ def patterns() -> None:
     console.print("Run: [cyan]brookside-analyze scan --full[/cyan] first\n")
 
 
+@cli.command()
+@click.option("--agent", "agents", multiple=True, help="Require an agent (repeatable)")
+@click.option("--command", "commands", multiple=True, help="Require a command (repeatable)")
+@click.option(
+    "--mcp-server", "mcp_servers", multiple=True, help="Require an MCP server (repeatable)"
+)
+@click.option(
+    "--min-repos",
+    default=2,
+    help="Minimum repositories for a capability to be listed as common",
+)
+def capabilities(
+    agents: tuple[str, ...],
+    commands: tuple[str, ...],
+    mcp_servers: tuple[str, ...],
+    min_repos: int,
+) -> None:
+    """
+    Query Claude capabilities across previously scanned repositories
+
+    Without filters, lists widespread agents, commands and MCP servers and the
+    repositories sharing an identical command set.
+
+    Examples:
+      brookside-analyze capabilities --mcp-server notion
+      brookside-analyze capabilities --min-repos 5
+    """
+    settings = get_settings()
+    index = CapabilityIndex.load(settings.analysis.cache_dir / CAPABILITY_INDEX_FILE)
+    console.print("\n[bold blue]Claude Capabilities[/bold blue]\n")
+
+    if not len(index):
+        console.print("[yellow]No capability data found[/yellow]")
+        console.print("Run: [cyan]brookside-analyze scan[/cyan] first\n")
+        return
+
+    required = [
+        *(("agent", name) for name in agents),
+        *(("command", name) for name in commands),
+        *(("mcp_server", name) for name in mcp_servers),
+    ]
+    if required:
+        matches = sorted(index.query(all_of=required))
+        console.print(f"[green]{len(matches)} repositories match[/green]")
+        for full_name in matches:
+            console.print(f"  {full_name}")
+        return
+
+    labels = {"agent": "Agents", "command": "Commands", "mcp_server": "MCP Servers"}
+    for kind, label in labels.items():
+        common = index.common(kind, min_repositories=min_repos)
+        if not common:
+            continue
+        table = Table(title=f"{label} in {min_repos}+ repositories")
+        table.add_column("Name", style="cyan")
+        table.add_column("Repositories", justify="right")
+        for name, count in common.items():
+            table.add_row(name, str(count))
+        console.print(table)
+
+    for names, repos in index.shared_sets("command"):
+        console.print(
+            f"\n[bold]Shared command set[/bold] ({', '.join(sorted(names))}): "
+            f"{', '.join(sorted(repos))}"
+        )
+
+
 @cli.command()
 @click.option(
     "--threshold",
@@ -0,0 +1,149 @@
+"""
+Commit Ledger for Brookside BI Repository Analyzer
+
+Establishes a persistent per-repository record of recent commits (SHA, commit
+time, author) and the branch head they were recorded up to, so later runs fetch
+only the commits added since that head and update rolling 30/90-day counts and
+contributor sets incrementally.
+
+Best for: Daily activity analysis, where re-listing 90 days of history for every
+repository on every run would dominate API spend.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.models import CommitStats
+
+logger = logging.getLogger(__name__)
+
+# Commits older than this are pruned (covers the 30- and 90-day windows)
+COMMIT_LEDGER_RETENTION_DAYS = 90
+
+DAY_SECONDS = 86400
+
+
+@dataclass
+class CommitLedgerEntry:
+    """
+    Recent commits of one repository
+
+    covered_since is the earliest commit time from which the ledger is complete;
+    synced_at is when the repository was last listed; head is the default branch
+    commit the ledger was synced up to.
+    """
+
+    covered_since: float
+    synced_at: float = 0.0
+    commits: dict[str, tuple[float, str]] = field(default_factory=dict)  # sha -> (time, email)
+    head: str | None = None
+
+    def covers(self, since: float) -> bool:
+        """Check whether the ledger is complete back to a point in time"""
+        return self.covered_since <= since
+
+    def add(self, sha: str, committed_at: float, author: str) -> bool:
+        """Record a commit, returning False if it was already known"""
+        if sha in self.commits:
+            return False
+        self.commits[sha] = (committed_at, author)
+        return True
+
+    def prune(self, cutoff: float) -> None:
+        """Drop commits older than cutoff and mark the ledger complete from there"""
+        self.commits = {sha: c for sha, c in self.commits.items() if c[0] >= cutoff}
+        self.covered_since = max(self.covered_since, cutoff)
+
+    def stats(self, days: int, now: float) -> CommitStats:
+        """
+        Compute rolling commit statistics
+
+        Args:
+            days: Activity window in days (30-day counts are always computed)
+            now: Current time in epoch seconds
+
+        Returns:
+            CommitStats object
+        """
+        window_start = now - days * DAY_SECONDS
+        month_start = now - 30 * DAY_SECONDS
+
+        in_window = [
+            (time, author) for time, author in self.commits.values() if time >= window_start
+        ]
+        commits_30d = sum(1 for time, _ in in_window if time >= month_start)
+
+        weeks = days / 7
+        return CommitStats(
+            total_commits=len(in_window),  # Approximation, consistent with listing
+            commits_last_30_days=commits_30d,
+            commits_last_90_days=len(in_window),
+            unique_contributors=len({author for _, author in in_window}),
+            average_commits_per_week=len(in_window) / weeks if weeks > 0 else 0,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a compact JSON-compatible structure"""
+        return {
+            "covered_since": self.covered_since,
+            "synced_at": self.synced_at,
+            "head": self.head,
+            "commits": [[sha, time, author] for sha, (time, author) in self.commits.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CommitLedgerEntry":
+        """Deserialize from to_dict output"""
+        return cls(
+            covered_since=data["covered_since"],
+            synced_at=data.get("synced_at", 0.0),
+            commits={sha: (time, author) for sha, time, author in data["commits"]},
+            head=data.get("head"),
+        )
+
+
+class CommitLedger:
+    """
+    On-disk store of commit ledger entries, one file per repository
+
+    Example:
+        >>> ledger = CommitLedger(Path(".cache"))
+        >>> entry = ledger.get("brookside-bi/repo-analyzer")
+        >>> stats = entry.stats(days=90, now=time.time()) if entry else None
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize commit ledger
+
+        Args:
+            cache_dir: Root cache directory (entries go under cache_dir/commits)
+        """
+        self.root = Path(cache_dir) / "commits"
+        self.hits = 0  # Repositories answered without listing any commits
+
+    def _path(self, full_name: str) -> Path:
+        return self.root / f"{full_name}.json"
+
+    def get(self, full_name: str) -> CommitLedgerEntry | None:
+        """Load a repository's entry, or None if absent or unreadable"""
+        try:
+            data = json.loads(self._path(full_name).read_text(encoding="utf-8"))
+            return CommitLedgerEntry.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, full_name: str, entry: CommitLedgerEntry) -> None:
+        """Persist a repository's entry"""
+        path = self._path(full_name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry.to_dict()), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to store commit ledger for {full_name}: {e}")
@@ -11,7 +11,7 @@ development flexibility.
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,6 +27,81 @@ class GitHubSettings(BaseSettings):
     exclude_repos: list[str] = Field(
         default_factory=list, description="Repository names to exclude from analysis"
     )
+    additional_tokens: list[str] = Field(
+        default_factory=list,
+        description="Extra PATs pooled with the primary token for more rate-limit budget",
+    )
+    app_id: str | None = Field(
+        default=None, description="GitHub App ID whose installation tokens join the pool"
+    )
+    app_private_key: str | None = Field(
+        default=None, description="GitHub App private key PEM (retrieved from Key Vault if not set)"
+    )
+    app_installation_ids: list[int] = Field(
+        default_factory=list, description="GitHub App installations pooled (one credential each)"
+    )
+    installation_token_refresh_seconds: int = Field(
+        default=300, description="Refresh installation tokens this long before they expire", ge=0
+    )
+    requests_per_second: float = Field(
+        default=10.0, description="Sustained GitHub API request rate", gt=0
+    )
+    burst_size: int = Field(
+        default=20, description="Requests released without pacing after idle time", ge=1
+    )
+    max_rate_limit_wait_seconds: int = Field(
+        default=3900,
+        description="Longest rate-limit pause before failing (default: one window plus margin)",
+        ge=0,
+    )
+    max_rate_limit_retries: int = Field(
+        default=3, description="Retries of a request rejected by a rate limit", ge=0
+    )
+    max_retries: int = Field(
+        default=3, description="Retries of an idempotent request after a transient failure", ge=0
+    )
+    retry_base_delay_seconds: float = Field(
+        default=0.5, description="Backoff ceiling for the first retry (doubles per retry)", ge=0
+    )
+    retry_max_delay_seconds: float = Field(
+        default=8.0, description="Upper bound of a single retry backoff", ge=0
+    )
+    retry_budget_ratio: float = Field(
+        default=0.2, description="Retries allowed per request issued (caps retry load)", ge=0
+    )
+    circuit_failure_threshold: int = Field(
+        default=5, description="Consecutive transient failures that open an endpoint circuit", ge=1
+    )
+    circuit_reset_seconds: float = Field(
+        default=30.0, description="Seconds an open circuit fails fast before probing again", gt=0
+    )
+    graphql_enabled: bool = Field(
+        default=True, description="Prefetch per-repository signals via batched GraphQL queries"
+    )
+    graphql_batch_size: int = Field(
+        default=25, description="Repositories per GraphQL signal query", ge=1, le=100
+    )
+    max_concurrent_pages: int = Field(
+        default=4, description="Paginated listing pages fetched in parallel", ge=1
+    )
+    max_commit_pages: int = Field(
+        default=10, description="Commit history pages (100 commits each) read per repository", ge=1
+    )
+    stats_endpoints_enabled: bool = Field(
+        default=True,
+        description="Read commit activity from GitHub's precomputed repository statistics",
+    )
+    stats_poll_rounds: int = Field(
+        default=3, description="Passes over repositories whose statistics were still computing", ge=0
+    )
+    stats_poll_interval_seconds: float = Field(
+        default=10.0, description="Pause before each pass over deferred statistics", ge=0
+    )
+    request_memo_size: int = Field(
+        default=1024,
+        description="Identical GET responses remembered per scan (0 only coalesces in-flight calls)",
+        ge=0,
+    )
 
     model_config = SettingsConfigDict(env_prefix="GITHUB_")
 
@@ -82,15 +157,100 @@ class AnalysisSettings(BaseSettings):
     cache_ttl_hours: int = Field(
         default=168, description="Cache TTL in hours (default: 1 week)", ge=1
     )
+    cache_dir: Path = Field(
+        default=Path(".cache/brookside-repo-analyzer"),
+        description="Directory for persistent caches (use a writable path such as /tmp in Azure Functions)",
+    )
+    http_cache_enabled: bool = Field(
+        default=True, description="Replay GitHub GET requests as conditional requests"
+    )
+    tree_index_enabled: bool = Field(
+        default=True, description="Answer file-existence checks from a recursive tree listing"
+    )
+    commit_ledger_enabled: bool = Field(
+        default=True, description="Keep recent commits per repository and list only newer ones"
+    )
+    analysis_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse analyses of repositories whose default-branch head is unchanged",
+    )
+    negative_cache_enabled: bool = Field(
+        default=True, description="Remember missing paths per repository until its content changes"
+    )
     max_concurrent_analyses: int = Field(
         default=10, description="Maximum concurrent repository analyses", ge=1, le=50
     )
+    scan_order: Literal["listing", "recently_pushed", "largest"] = Field(
+        default="listing",
+        description="Order queued repositories are analyzed in (listing order, newest push, largest first)",
+    )
+    triage_enabled: bool = Field(
+        default=False,
+        description="Deep-analyze only repositories whose listing metadata passes the triage policy",
+    )
+    triage_include_forks: bool = Field(default=False, description="Promote forks past triage")
+    triage_include_archived: bool = Field(
+        default=False, description="Promote archived repositories past triage"
+    )
+    triage_max_days_since_push: int = Field(
+        default=730, description="Repositories pushed longer ago than this are not promoted", ge=0
+    )
+    triage_min_size_kb: int = Field(
+        default=1, description="Smallest repository (KB) promoted (skips empty repositories)", ge=0
+    )
+    triage_min_score: int = Field(
+        default=0, description="Minimum metadata triage score (0-100) to promote", ge=0, le=100
+    )
+    triage_excluded_topics: list[str] = Field(
+        default_factory=list, description="Repositories tagged with any of these topics are not promoted"
+    )
+    max_concurrent_fetches_per_repo: int = Field(
+        default=6, description="GitHub requests in flight at once within one repository analysis", ge=1
+    )
+    http2_enabled: bool = Field(
+        default=True, description="Multiplex GitHub requests over HTTP/2 (requires the h2 package)"
+    )
+    max_connections: int = Field(
+        default=20, description="Maximum open connections to the GitHub API", ge=1
+    )
+    max_keepalive_connections: int = Field(
+        default=10, description="Idle connections kept open for reuse", ge=0
+    )
+    connect_timeout_seconds: float = Field(
+        default=10.0, description="Timeout for establishing a connection", gt=0
+    )
+    read_timeout_seconds: float = Field(
+        default=30.0, description="Timeout waiting for response data", gt=0
+    )
+    pool_timeout_seconds: float = Field(
+        default=30.0, description="Timeout waiting for a free pooled connection", gt=0
+    )
     deep_analysis_enabled: bool = Field(
         default=True, description="Enable deep code analysis (slower but more comprehensive)"
     )
+    snapshot_analysis_enabled: bool = Field(
+        default=False,
+        description="In deep analysis, read files from a downloaded tarball instead of per-file API calls",
+    )
+    snapshot_max_size_kb: int = Field(
+        default=200_000, description="Largest repository (KB) downloaded as a snapshot", ge=0
+    )
+    max_file_size_kb: int = Field(
+        default=20_000, description="Largest single file (KB) read from a repository", ge=1
+    )
     detect_claude_configs: bool = Field(
         default=True, description="Detect and parse .claude/ configurations"
     )
+    claude_search_sweep_enabled: bool = Field(
+        default=True,
+        description="Find repositories with Claude configuration via org-wide code search first",
+    )
+    parse_cache_size: int = Field(
+        default=4096, description="Parsed agent and .claude.json files remembered by blob SHA", ge=0
+    )
+    parse_cache_persist: bool = Field(
+        default=True, description="Keep parsed file results on disk between runs"
+    )
     calculate_costs: bool = Field(
         default=True, description="Calculate dependency costs via Software Tracker"
     )
@@ -0,0 +1,435 @@
+"""
+GitHub Credential Pool for Brookside BI Repository Analyzer
+
+Establishes a pool of GitHub credentials (personal access tokens and GitHub App
+installation tokens), each with its own rate-limit scheduler, and routes every
+request to the credential with the most remaining budget among those that can
+access the owner being requested.
+
+Best for: Multi-organization scans that need more than one 5,000 request/hour
+window to finish in a single pass.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import datetime
+
+import httpx
+
+from src.auth import CredentialManager
+from src.config import Settings
+from src.exceptions import AuthenticationError
+from src.http_cache import credential_identity
+from src.rate_limiter import RateLimitScheduler, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Lifetime of the JWT used to mint installation tokens (GitHub allows 10 minutes)
+APP_JWT_TTL_SECONDS = 540
+
+# Backdating of the JWT issue time to absorb clock skew with GitHub
+APP_JWT_CLOCK_SKEW_SECONDS = 60
+
+# Owner segment of owner-scoped REST endpoints
+_OWNER_PATTERN = re.compile(r"^/?(?:repos|orgs|users)/([^/?]+)")
+
+
+def app_auth_available() -> bool:
+    """Check whether PyJWT (with RSA support) is installed for GitHub App auth"""
+    return importlib.util.find_spec("jwt") is not None
+
+
+def endpoint_owner(endpoint: str) -> str | None:
+    """
+    Extract the account an endpoint is scoped to
+
+    Args:
+        endpoint: API endpoint (with or without leading slash)
+
+    Returns:
+        Owner login for /repos/{owner}/..., /orgs/{owner}/... and /users/{owner}/...
+        endpoints; None for endpoints not scoped to one account (e.g. /graphql)
+    """
+    match = _OWNER_PATTERN.match(endpoint)
+    return match.group(1) if match else None
+
+
+def _resolve(value: str | Callable[[], str]) -> str:
+    """Resolve a secret given directly or as a lazy provider (e.g. Key Vault lookup)"""
+    return value() if callable(value) else value
+
+
+class GitHubCredential(ABC):
+    """
+    One GitHub identity with its own rate-limit state
+
+    Subclasses supply the identity and the Authorization header value.
+    """
+
+    def __init__(self, settings: Settings, rate_limiter: RateLimitScheduler | None = None):
+        """
+        Initialize credential
+
+        Args:
+            settings: Application configuration
+            rate_limiter: Scheduler for this credential (defaults to the process-wide
+                instance for its identity)
+        """
+        self.settings = settings
+        self._rate_limiter = rate_limiter
+        self.requests = 0
+
+    @property
+    @abstractmethod
+    def identity(self) -> str:
+        """Stable, non-secret name of the credential"""
+
+    @property
+    def owners(self) -> frozenset[str] | None:
+        """Lowercased owner logins this credential can read (None for any owner)"""
+        return None
+
+    def can_access(self, owner: str | None) -> bool:
+        """
+        Check whether requests scoped to an owner may be sent with this credential
+
+        Requests not scoped to an owner only match credentials without restriction.
+        """
+        owners = self.owners
+        if owners is None:
+            return True
+        return owner is not None and owner.lower() in owners
+
+    @property
+    def rate_limiter(self) -> RateLimitScheduler:
+        """Scheduler tracking this credential's rate-limit windows"""
+        if self._rate_limiter is None:
+            self._rate_limiter = get_rate_limiter(self.settings, key=self.identity)
+        return self._rate_limiter
+
+    @abstractmethod
+    async def authorization(self, client: httpx.AsyncClient, base_url: str) -> str:
+        """
+        Get the Authorization header value for the next request
+
+        Args:
+            client: HTTP client (used to refresh short-lived tokens)
+            base_url: GitHub API base URL
+
+        Returns:
+            Header value such as "Bearer <token>"
+        """
+
+
+class TokenCredential(GitHubCredential):
+    """Long-lived token credential (personal access token)"""
+
+    def __init__(
+        self,
+        settings: Settings,
+        token: str | Callable[[], str],
+        rate_limiter: RateLimitScheduler | None = None,
+    ):
+        """
+        Initialize token credential
+
+        Args:
+            settings: Application configuration
+            token: Token, or a provider called on first use
+            rate_limiter: Scheduler for this credential
+        """
+        super().__init__(settings, rate_limiter)
+        self._token = token
+
+    @property
+    def token(self) -> str:
+        self._token = _resolve(self._token)
+        return self._token
+
+    @property
+    def identity(self) -> str:
+        return f"pat:{credential_identity(self.token)}"
+
+    async def authorization(self, client: httpx.AsyncClient, base_url: str) -> str:
+        return f"Bearer {self.token}"
+
+
+class AppInstallationCredential(GitHubCredential):
+    """
+    GitHub App installation credential
+
+    Installation tokens expire after one hour; a fresh token is minted with an
+    app JWT whenever the current one is within refresh_margin of expiring. The
+    token only covers the account the app is installed on, which is looked up
+    once (see resolve_account) unless given.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        app_id: str,
+        private_key: str | Callable[[], str],
+        installation_id: int,
+        refresh_margin: float = 300.0,
+        rate_limiter: RateLimitScheduler | None = None,
+        clock: Callable[[], float] = time.time,
+        account: str | None = None,
+    ):
+        """
+        Initialize installation credential
+
+        Args:
+            settings: Application configuration
+            app_id: GitHub App ID
+            private_key: App private key PEM, or a provider called on first use
+            installation_id: Installation to mint tokens for
+            refresh_margin: Seconds before expiry at which the token is replaced
+            rate_limiter: Scheduler for this credential
+            clock: Wall-clock source in epoch seconds (injectable for tests)
+            account: Login of the account the app is installed on (looked up if None)
+
+        Example:
+            >>> credential = AppInstallationCredential(settings, "12345", pem, 678)
+            >>> header = await credential.authorization(client, "https://api.github.com")
+        """
+        super().__init__(settings, rate_limiter)
+        self.app_id = app_id
+        self.installation_id = installation_id
+        self.refresh_margin = refresh_margin
+        self._private_key = private_key
+        self._clock = clock
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.refreshes = 0
+        self.account = account
+        self.account_resolved = account is not None
+
+    @property
+    def identity(self) -> str:
+        return f"app:{self.app_id}:{self.installation_id}"
+
+    @property
+    def owners(self) -> frozenset[str]:
+        # Until the installation account is known, no owner is routed here
+        return frozenset({self.account.lower()}) if self.account else frozenset()
+
+    async def resolve_account(self, client: httpx.AsyncClient, base_url: str) -> None:
+        """
+        Look up the account the app is installed on
+
+        A failed lookup is logged and not retried; the credential then only
+        serves requests when no other credential can.
+        """
+        self.account_resolved = True
+        try:
+            response = await client.get(
+                f"{base_url}/app/installations/{self.installation_id}",
+                headers={
+                    "Authorization": f"Bearer {self._app_jwt()}",
+                    "Accept": "application/vnd.github+json",
+                },
+            )
+            response.raise_for_status()
+            self.account = response.json()["account"]["login"]
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                f"Failed to look up the account of GitHub App installation "
+                f"{self.installation_id}: {str(e)}"
+            )
+
+    def _needs_refresh(self) -> bool:
+        return self._token is None or self._clock() >= self._expires_at - self.refresh_margin
+
+    async def authorization(self, client: httpx.AsyncClient, base_url: str) -> str:
+        if self._needs_refresh():
+            async with self._lock:
+                # Another request may have refreshed while this one waited
+                if self._needs_refresh():
+                    await self._refresh(client, base_url)
+        return f"Bearer {self._token}"
+
+    def _app_jwt(self) -> str:
+        """Sign the short-lived JWT identifying the app itself"""
+        import jwt
+
+        now = int(self._clock())
+        payload = {
+            "iat": now - APP_JWT_CLOCK_SKEW_SECONDS,
+            "exp": now + APP_JWT_TTL_SECONDS,
+            "iss": str(self.app_id),
+        }
+        return jwt.encode(payload, _resolve(self._private_key), algorithm="RS256")
+
+    async def _refresh(self, client: httpx.AsyncClient, base_url: str) -> None:
+        """
+        Mint a new installation access token
+
+        Raises:
+            AuthenticationError: If GitHub rejects the app JWT or the installation
+        """
+        details = {"app_id": self.app_id, "installation_id": self.installation_id}
+        try:
+            response = await client.post(
+                f"{base_url}/app/installations/{self.installation_id}/access_tokens",
+                headers={
+                    "Authorization": f"Bearer {self._app_jwt()}",
+                    "Accept": "application/vnd.github+json",
+                },
+            )
+            response.raise_for_status()
+            payload = response.json()
+            token = payload["token"]
+            expires_at = datetime.fromisoformat(payload["expires_at"].replace("Z", "+00:00"))
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            raise AuthenticationError(
+                f"Failed to mint GitHub App installation token: {str(e)}", details
+            ) from e
+
+        self._token = token
+        self._expires_at = expires_at.timestamp()
+        self.refreshes += 1
+        logger.info(
+            f"Refreshed installation token for GitHub App {self.app_id} "
+            f"(installation {self.installation_id}, expires {payload['expires_at']})"
+        )
+
+
+class CredentialPool:
+    """
+    Routes requests across credentials by remaining rate-limit budget
+
+    Each credential keeps its own scheduler, so an exhausted or paused credential
+    simply stops being selected while the others carry the scan. Credentials with
+    equal budget are used in turn. Only credentials that can access the requested
+    owner are considered, so an installation token never receives a request for
+    an account it is not installed on.
+    """
+
+    def __init__(self, credentials: list[GitHubCredential]):
+        """
+        Initialize credential pool
+
+        Args:
+            credentials: Pooled credentials; the first is the primary
+
+        Raises:
+            AuthenticationError: If no credentials are given
+        """
+        if not credentials:
+            raise AuthenticationError("Credential pool requires at least one GitHub credential")
+        self.credentials = credentials
+        self._accounts_resolved = False
+        self._accounts_lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        credential_manager: CredentialManager,
+        rate_limiter: RateLimitScheduler | None = None,
+    ) -> "CredentialPool":
+        """
+        Build the pool from the primary PAT plus any configured extra credentials
+
+        Secrets are resolved on first use, so building the pool does not touch
+        Key Vault.
+
+        Args:
+            settings: Application configuration
+            credential_manager: Source of the primary PAT and the app private key
+            rate_limiter: Scheduler for the primary PAT (defaults to process-wide)
+
+        Returns:
+            CredentialPool
+        """
+        github = settings.github
+        credentials: list[GitHubCredential] = [
+            TokenCredential(settings, lambda: credential_manager.github_token, rate_limiter)
+        ]
+        credentials.extend(TokenCredential(settings, token) for token in github.additional_tokens)
+
+        if github.app_id and github.app_installation_ids:
+            if app_auth_available():
+                credentials.extend(
+                    AppInstallationCredential(
+                        settings,
+                        github.app_id,
+                        lambda: credential_manager.github_app_private_key,
+                        installation_id,
+                        refresh_margin=github.installation_token_refresh_seconds,
+                    )
+                    for installation_id in github.app_installation_ids
+                )
+            else:
+                logger.warning(
+                    "GitHub App credentials configured but PyJWT is not installed; "
+                    "install PyJWT[crypto] to pool installation tokens"
+                )
+
+        return cls(credentials)
+
+    @property
+    def primary(self) -> GitHubCredential:
+        """First credential (the CredentialManager PAT)"""
+        return self.credentials[0]
+
+    async def resolve_accounts(self, client: httpx.AsyncClient, base_url: str) -> None:
+        """
+        Look up the accounts of installation credentials (once per pool)
+
+        Args:
+            client: HTTP client
+            base_url: GitHub API base URL
+        """
+        if self._accounts_resolved:
+            return
+        async with self._accounts_lock:
+            if self._accounts_resolved:
+                return
+            await asyncio.gather(
+                *(
+                    credential.resolve_account(client, base_url)
+                    for credential in self.credentials
+                    if isinstance(credential, AppInstallationCredential)
+                    and not credential.account_resolved
+                )
+            )
+            self._accounts_resolved = True
+
+    def select(self, resource: str = "core", owner: str | None = None) -> GitHubCredential:
+        """
+        Choose the credential for the next request against a resource
+
+        Among credentials that can access the owner, prefers the most remaining
+        budget; when every one is exhausted, the one whose window lifts soonest.
+        If no credential is known to cover the owner, all are considered.
+
+        Args:
+            resource: Rate-limit resource (see rate_limit_resource)
+            owner: Account the request is scoped to (see endpoint_owner)
+
+        Returns:
+            Selected credential
+        """
+        candidates = [c for c in self.credentials if c.can_access(owner)] or self.credentials
+        credential = max(
+            candidates,
+            key=lambda c: (
+                c.rate_limiter.available(resource),
+                -c.rate_limiter.ready_in(resource),
+                -c.requests,
+            ),
+        )
+        credential.requests += 1
+        return credential
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Requests routed to each credential"""
+        return {credential.identity: credential.requests for credential in self.credentials}
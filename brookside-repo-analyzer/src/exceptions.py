@@ -75,3 +75,20 @@ class RateLimitError(RepositoryAnalyzerError):
     def __init__(self, message: str, retry_after: int | None = None):
         super().__init__(message, {"retry_after": retry_after})
         self.retry_after = retry_after
+
+
+class CircuitOpenError(GitHubAPIError):
+    """Raised when a GitHub endpoint family is failing and requests are short-circuited"""
+
+    def __init__(self, message: str, family: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.details.update({"family": family, "retry_after": retry_after})
+        self.family = family
+        self.retry_after = retry_after
+
+
+class StatisticsPendingError(GitHubAPIError):
+    """Raised when GitHub is still computing repository statistics (202 Accepted)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=202)
@@ -8,19 +8,193 @@ Best for: Organizations using Model Context Protocol for GitHub integration,
 requiring repository scanning, metadata extraction, and activity analysis.
 """
 
+import asyncio
+import io
+import json
 import logging
-from datetime import datetime, timedelta
+import re
+import tarfile
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 import httpx
 
+from src.analysis_cache import AnalysisCache
 from src.auth import CredentialManager
+from src.commit_ledger import COMMIT_LEDGER_RETENTION_DAYS, CommitLedger, CommitLedgerEntry
 from src.config import Settings
-from src.exceptions import GitHubAPIError, RateLimitError
+from src.credential_pool import CredentialPool, GitHubCredential, endpoint_owner
+from src.exceptions import GitHubAPIError, RateLimitError, StatisticsPendingError
+from src.http_cache import ConditionalRequestCache
 from src.models import CommitStats, Dependency, Repository
+from src.negative_cache import MissingPathCache
+from src.parse_cache import ParseCache
+from src.resilience import IDEMPOTENT_METHODS, RetryPolicy, endpoint_family, is_transient
+from src.rate_limiter import RateLimitScheduler, rate_limit_resource
+from src.singleflight import SingleFlight
+from src.snapshot import (
+    AsyncChunkReader,
+    RepositorySnapshot,
+    extract_tarball,
+    snapshots_supported,
+)
+from src.tree_index import RepoTreeIndex, TreeIndexStore
 
 logger = logging.getLogger(__name__)
 
+# Dependency manifests parsed by get_repository_dependencies
+DEPENDENCY_MANIFESTS = ("package.json", "requirements.txt")
+
+# Files probed in nearly every repository (compactly tracked by the missing-path cache)
+COMMON_PROBE_PATHS = DEPENDENCY_MANIFESTS + (".claude.json", "CLAUDE.md")
+
+# Media type returning file content unwrapped (no JSON envelope or base64)
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+# Raw file bodies remembered per client (kept small; bodies can be megabytes)
+RAW_MEMO_SIZE = 32
+
+# Tree indexes kept in memory per client (most recently used repositories)
+TREE_MEMO_SIZE = 64
+
+# Items per page for paginated REST listings (GitHub maximum)
+PAGE_SIZE = 100
+
+# Code search returns at most this many results per query
+CODE_SEARCH_MAX_RESULTS = 1000
+
+_LAST_PAGE_LINK = re.compile(r'<([^>]+)>\s*;\s*rel="last"')
+
+
+def parse_last_page(link_header: str | None) -> int | None:
+    """
+    Extract the last page number from a GitHub Link header
+
+    Args:
+        link_header: Value of the Link response header
+
+    Returns:
+        Page number of the rel="last" link, or None if absent
+
+    Example:
+        >>> parse_last_page('<https://api.github.com/orgs/x/repos?page=5>; rel="last"')
+        5
+    """
+    match = _LAST_PAGE_LINK.search(link_header or "")
+    if not match:
+        return None
+    page = httpx.URL(match.group(1)).params.get("page")
+    return int(page) if page and page.isdigit() else None
+
+
+def commit_stats_from_statistics(
+    commit_activity: list[dict[str, Any]] | dict[str, Any],
+    contributors: list[dict[str, Any]] | dict[str, Any],
+    days: int,
+    now: float,
+) -> CommitStats:
+    """
+    Build CommitStats from GitHub's precomputed repository statistics
+
+    /stats/commit_activity gives daily commit counts for the last year, so window
+    counts are exact; /stats/contributors gives weekly counts per author (top 100
+    contributors). total_commits counts the window, like every other path.
+
+    Args:
+        commit_activity: Payload of /stats/commit_activity (empty for empty repos)
+        contributors: Payload of /stats/contributors (empty for empty repos)
+        days: Activity window in days (30-day counts are always computed)
+        now: Current time in epoch seconds
+
+    Returns:
+        CommitStats object
+    """
+    day_seconds = 86400
+    window_start = now - days * day_seconds
+    month_start = now - 30 * day_seconds
+
+    commits_window = 0
+    commits_30d = 0
+    for week in commit_activity if isinstance(commit_activity, list) else []:
+        for offset, count in enumerate(week.get("days", [])):
+            day = week["week"] + offset * day_seconds
+            if day >= window_start:
+                commits_window += count
+            if day >= month_start:
+                commits_30d += count
+
+    authors = contributors if isinstance(contributors, list) else []
+    active_authors = sum(
+        1
+        for author in authors
+        if any(
+            week.get("c", 0) > 0 and week["w"] + 7 * day_seconds > window_start
+            for week in author.get("weeks", [])
+        )
+    )
+
+    weeks = days / 7
+    return CommitStats(
+        total_commits=commits_window,
+        commits_last_30_days=commits_30d,
+        commits_last_90_days=commits_window,
+        unique_contributors=active_authors,
+        average_commits_per_week=commits_window / weeks if weeks > 0 else 0,
+    )
+
+
+def _record_commit(entry: CommitLedgerEntry, commit: dict[str, Any]) -> float:
+    """Add a listed or compared commit to a ledger entry, returning its commit time"""
+    committed_at = datetime.fromisoformat(
+        commit["commit"]["committer"]["date"].replace("Z", "+00:00")
+    ).timestamp()
+    entry.add(commit["sha"], committed_at, commit["commit"]["author"]["email"])
+    return committed_at
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client(settings: Settings, headers: dict[str, str]) -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP client used for GitHub API calls
+
+    Args:
+        settings: Application configuration (pool, timeout and HTTP/2 options)
+        headers: Default request headers
+
+    Returns:
+        Configured httpx.AsyncClient (HTTP/1.1 if HTTP/2 is disabled or unavailable)
+    """
+    analysis = settings.analysis
+    http2 = analysis.http2_enabled and http2_available()
+    if analysis.http2_enabled and not http2:
+        logger.warning("HTTP/2 enabled but the h2 package is not installed; using HTTP/1.1")
+
+    return httpx.AsyncClient(
+        headers=headers,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=analysis.max_connections,
+            max_keepalive_connections=analysis.max_keepalive_connections,
+        ),
+        timeout=httpx.Timeout(
+            connect=analysis.connect_timeout_seconds,
+            read=analysis.read_timeout_seconds,
+            write=analysis.read_timeout_seconds,
+            pool=analysis.pool_timeout_seconds,
+        ),
+    )
+
 
 class GitHubMCPClient:
     """
@@ -30,13 +204,22 @@ class GitHubMCPClient:
     Implements rate limiting, error handling, and retry logic.
     """
 
-    def __init__(self, settings: Settings, credentials: CredentialManager):
+    def __init__(
+        self,
+        settings: Settings,
+        credentials: CredentialManager,
+        rate_limiter: RateLimitScheduler | None = None,
+        credential_pool: CredentialPool | None = None,
+    ):
         """
         Initialize GitHub MCP client
 
         Args:
             settings: Application configuration
             credentials: Credential manager for GitHub token
+            rate_limiter: Scheduler for the primary token (defaults to the process-wide instance)
+            credential_pool: Credentials requests are spread across (defaults to the
+                primary token plus any configured extra tokens / app installations)
 
         Example:
             >>> from src.config import get_settings
@@ -49,33 +232,144 @@ class GitHubMCPClient:
         self.credentials = credentials
         self.base_url = "https://api.github.com"
         self._client: httpx.AsyncClient | None = None
+        self.credential_pool = credential_pool or CredentialPool.from_settings(
+            settings, credentials, rate_limiter
+        )
+        self.retry_policy = RetryPolicy.from_settings(settings)
+        self.http_cache: ConditionalRequestCache | None = None
+        self.analysis_cache: AnalysisCache | None = None
+        self.tree_store: TreeIndexStore | None = None
+        self.commit_ledger: CommitLedger | None = None
+        self.missing_paths: MissingPathCache | None = None
+        # Parsed configuration files by blob SHA (persisted between runs when enabled)
+        self.parse_cache = ParseCache(max_entries=settings.analysis.parse_cache_size)
+        self.head_shas: dict[str, str] = {}
+        self.tree_shas: dict[str, str] = {}
+        # Repositories whose statistics GitHub was still computing (revisited by the scanner)
+        self.deferred_stats: dict[str, Repository] = {}
+        self._trees: OrderedDict[str, RepoTreeIndex | None] = OrderedDict()
+        # Concurrent probes of one repository share a single tree fetch and parse
+        self._tree_flight: SingleFlight[RepoTreeIndex | None] = SingleFlight(memo_size=0)
+        self._snapshots: dict[str, RepositorySnapshot] = {}
+        # Identical GETs within a scan share one request; 404s are definitive too
+        self.singleflight: SingleFlight[
+            tuple[dict[str, Any] | list[Any], httpx.Headers]
+        ] = SingleFlight(
+            memo_size=settings.github.request_memo_size,
+            remember_error=lambda e: isinstance(e, GitHubAPIError) and e.status_code == 404,
+        )
+        self._raw_flight: SingleFlight[bytes] = SingleFlight(
+            memo_size=RAW_MEMO_SIZE,
+            remember_error=lambda e: isinstance(e, GitHubAPIError) and e.status_code == 404,
+        )
 
     async def __aenter__(self) -> "GitHubMCPClient":
         """Async context manager entry"""
-        self._client = httpx.AsyncClient(
+        if self.settings.analysis.tree_index_enabled:
+            self.tree_store = TreeIndexStore(self.settings.analysis.cache_dir)
+
+        if self.settings.analysis.commit_ledger_enabled:
+            self.commit_ledger = CommitLedger(self.settings.analysis.cache_dir)
+
+        if self.settings.analysis.parse_cache_persist:
+            self.parse_cache.path = self.settings.analysis.cache_dir / "parsed.json"
+            self.parse_cache.load()
+
+        if self.settings.analysis.analysis_cache_enabled:
+            self.analysis_cache = AnalysisCache(self.settings.analysis.cache_dir)
+
+        if self.settings.analysis.negative_cache_enabled:
+            self.missing_paths = MissingPathCache(
+                self.settings.analysis.cache_dir, probe_paths=COMMON_PROBE_PATHS
+            )
+
+        if self.settings.analysis.http_cache_enabled:
+            self.http_cache = ConditionalRequestCache(
+                cache_dir=self.settings.analysis.cache_dir,
+                ttl_hours=self.settings.analysis.cache_ttl_hours,
+            )
+
+        self._client = build_http_client(
+            self.settings,
             headers={
                 "Authorization": f"Bearer {self.credentials.github_token}",
                 "Accept": "application/vnd.github+json",
                 "X-GitHub-Api-Version": "2022-11-28",
             },
-            timeout=30.0,
         )
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit"""
+        for full_name in list(self._snapshots):
+            self._snapshots.pop(full_name).remove()
+
+        if self.missing_paths:
+            self.missing_paths.save()
+            if self.missing_paths.hits:
+                logger.info(f"Skipped {self.missing_paths.hits} probes of known-missing paths")
+
+        self.parse_cache.save()
+        if self.parse_cache.hits:
+            logger.info(f"Reused {self.parse_cache.hits} parsed configuration files")
+
+        if self.commit_ledger and self.commit_ledger.hits:
+            logger.info(f"Commit ledger answered {self.commit_ledger.hits} unchanged repositories")
+
+        if self.analysis_cache and (self.analysis_cache.hits or self.analysis_cache.misses):
+            logger.info(
+                f"Analysis cache: {self.analysis_cache.hits} hits, "
+                f"{self.analysis_cache.misses} misses "
+                f"({self.analysis_cache.invalidations} invalidated by new commits or analyzer)"
+            )
+
+        if self.singleflight.hits:
+            logger.info(
+                f"Request coalescing saved {self.singleflight.hits} GitHub calls "
+                f"({self.singleflight.coalesced} in flight, {self.singleflight.memoized} repeated)"
+            )
+
+        if len(self.credential_pool.credentials) > 1:
+            routed = ", ".join(
+                f"{identity}: {count}" for identity, count in self.credential_pool.stats.items()
+            )
+            logger.info(f"Requests per credential: {routed}")
+
         if self._client:
             await self._client.aclose()
 
+    async def _authorize(
+        self, headers: httpx.Headers | dict[str, str], resource: str, owner: str | None = None
+    ) -> GitHubCredential:
+        """
+        Route a request to the pooled credential with the most budget
+
+        Only credentials that can access the owner are considered. Sets the
+        credential's Authorization header and waits for its rate limiter.
+
+        Returns:
+            The selected credential (its scheduler observes the response, and its
+            identity keys the HTTP cache)
+        """
+        await self.credential_pool.resolve_accounts(self._client, self.base_url)
+        credential = self.credential_pool.select(resource, owner)
+        headers["Authorization"] = await credential.authorization(self._client, self.base_url)
+        await credential.rate_limiter.acquire(resource)
+        return credential
+
     async def _request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self, method: str, endpoint: str, idempotent: bool | None = None, **kwargs: Any
     ) -> dict[str, Any] | list[Any]:
         """
         Make authenticated request to GitHub API
 
+        Transient failures (timeouts, 5xx) of idempotent requests are retried with
+        jittered backoff; an endpoint family that keeps failing is short-circuited.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (without base URL)
+            idempotent: Whether the request may be retried (default: by method)
             **kwargs: Additional request parameters
 
         Returns:
@@ -83,41 +377,330 @@ class GitHubMCPClient:
 
         Raises:
             GitHubAPIError: If request fails
+            CircuitOpenError: If the endpoint family is failing
             RateLimitError: If rate limit exceeded
         """
+        data, _ = await self._request_with_headers(method, endpoint, idempotent, **kwargs)
+        return data
+
+    async def _request_with_headers(
+        self, method: str, endpoint: str, idempotent: bool | None = None, **kwargs: Any
+    ) -> tuple[dict[str, Any] | list[Any], httpx.Headers]:
+        """
+        Make authenticated request and return response headers alongside the data
+
+        Headers of a 304 revalidation are those stored with the cached entry, so
+        pagination links survive conditional requests. GETs are coalesced: an
+        identical GET already in flight or completed earlier in the scan is
+        answered from that call.
+
+        Raises:
+            GitHubAPIError: If request fails
+            RateLimitError: If rate limit exceeded
+        """
+        async def send() -> tuple[dict[str, Any] | list[Any], httpx.Headers]:
+            body, headers = await self._send_request(
+                method, endpoint, idempotent=idempotent, **kwargs
+            )
+            # Some endpoints (e.g. statistics of an empty repository) answer 204
+            return (json.loads(body) if body else {}), headers
+
+        if method.upper() != "GET":
+            return await send()
+
+        url = httpx.URL(f"{self.base_url}/{endpoint.lstrip('/')}", params=kwargs.get("params"))
+        accept = (kwargs.get("headers") or {}).get("Accept", "")
+        return await self.singleflight.do((str(url), accept), send)
+
+    async def _request_raw(self, endpoint: str, max_bytes: int | None = None) -> bytes:
+        """
+        GET an endpoint with the raw media type and return the body bytes
+
+        Identical concurrent or repeated reads share one request.
+
+        Raises:
+            GitHubAPIError: If request fails or the body exceeds max_bytes
+            RateLimitError: If rate limit exceeded
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        async def send() -> bytes:
+            body, _ = await self._send_request(
+                "GET", endpoint, max_bytes=max_bytes, headers={"Accept": RAW_MEDIA_TYPE}
+            )
+            return body
+
+        return await self._raw_flight.do((url, RAW_MEDIA_TYPE), send)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        max_bytes: int | None = None,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> tuple[bytes, httpx.Headers]:
+        """
+        Send a request under the retry policy of its endpoint family
+
+        The body is streamed and returned as bytes; decoding is left to the caller.
+        """
         if not self._client:
             raise GitHubAPIError("Client not initialized. Use async context manager.")
 
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        return await self.retry_policy.call(
+            endpoint_family(endpoint),
+            lambda: self._send_once(method, endpoint, max_bytes, **kwargs),
+            idempotent=idempotent,
+        )
+
+    async def _send_once(
+        self, method: str, endpoint: str, max_bytes: int | None, **kwargs: Any
+    ) -> tuple[bytes, httpx.Headers]:
+        """Send one attempt through the HTTP cache and rate limiter"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        resource = rate_limit_resource(endpoint)
+        owner = endpoint_owner(endpoint)
 
         try:
-            response = await self._client.request(method, url, **kwargs)
-
-            # Check rate limiting
-            if response.status_code == 403:
-                rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
-                if rate_limit_remaining == "0":
-                    reset_time = response.headers.get("X-RateLimit-Reset")
-                    retry_after = (
-                        int(reset_time) - int(datetime.now().timestamp()) if reset_time else 3600
-                    )
-                    raise RateLimitError(
-                        "GitHub API rate limit exceeded",
-                        retry_after=retry_after,
-                    )
+            request = self._client.build_request(method, url, **kwargs)
+
+            # Retry rate-limit rejections on the credential with the most budget left,
+            # pausing only when every pooled credential is exhausted
+            cached = None
+            cacheable = self.http_cache is not None and method.upper() == "GET"
+            for _ in range(self.settings.github.max_rate_limit_retries + 1):
+                credential = await self._authorize(request.headers, resource, owner)
+
+                # Replay GETs as conditional requests (304s are free against the rate
+                # limit), using only entries stored for the credential sending this one
+                if cacheable:
+                    cached = self.http_cache.get(request, credential.identity)
+                    self.http_cache.apply_validators(request, cached)
+
+                response = await self._client.send(request, stream=True)
+
+                if credential.rate_limiter.observe(
+                    response.headers, response.status_code, resource
+                ) is None:
+                    break
+                await response.aclose()
+            else:
+                raise RateLimitError(
+                    "GitHub API rate limit exceeded",
+                    retry_after=int(self.settings.github.max_rate_limit_wait_seconds),
+                )
 
-            response.raise_for_status()
-            return response.json()
+            try:
+                if response.status_code == 304 and cached:
+                    self.http_cache.record_hit(request, credential.identity)
+                    return cached.body, httpx.Headers(cached.headers)
+
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                if response.status_code == 202:
+                    # Statistics are being computed in the background; ask again later
+                    raise StatisticsPendingError(f"GitHub is still computing {endpoint}")
+
+                body = await self._read_body(response, max_bytes)
+            finally:
+                await response.aclose()
+
+            if cacheable:
+                self.http_cache.put(request, response, body, credential.identity)
+
+            return body, response.headers
 
         except httpx.HTTPStatusError as e:
+            try:
+                response_data = e.response.json() if e.response.text else None
+            except ValueError:
+                response_data = None  # Gateway errors often carry an HTML body
             raise GitHubAPIError(
                 f"GitHub API request failed: {str(e)}",
                 status_code=e.response.status_code,
-                response_data=e.response.json() if e.response.text else None,
+                response_data=response_data,
             )
         except httpx.RequestError as e:
             raise GitHubAPIError(f"GitHub API request error: {str(e)}")
 
+    @staticmethod
+    async def _read_body(response: httpx.Response, max_bytes: int | None) -> bytes:
+        """Stream a response body, refusing bodies larger than max_bytes"""
+        declared = response.headers.get("Content-Length")
+        if max_bytes is not None and declared and declared.isdigit() and int(declared) > max_bytes:
+            raise GitHubAPIError(
+                f"Response body of {declared} bytes exceeds {max_bytes} bytes", status_code=413
+            )
+
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                raise GitHubAPIError(f"Response body exceeds {max_bytes} bytes", status_code=413)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def graphql(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Execute a GitHub GraphQL query
+
+        Partial failures (e.g. one aliased repository not found) are logged and the
+        available data is returned; missing aliases come back as None.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The "data" object of the GraphQL response
+
+        Raises:
+            GitHubAPIError: If the query fails entirely
+        """
+        # Queries are read-only, so the POST is safe to retry
+        payload = await self._request(
+            "POST",
+            "/graphql",
+            idempotent=True,
+            json={"query": query, "variables": variables or {}},
+        )
+
+        if not isinstance(payload, dict):
+            raise GitHubAPIError("Unexpected GraphQL response")
+
+        errors = payload.get("errors") or []
+        data = payload.get("data")
+
+        if data is None:
+            message = errors[0].get("message") if errors else "no data returned"
+            raise GitHubAPIError(f"GitHub GraphQL query failed: {message}")
+
+        for error in errors:
+            logger.warning(f"GraphQL partial error at {error.get('path')}: {error.get('message')}")
+
+        return data
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Yield pages of a paginated list endpoint in page order
+
+        Page 1 is fetched first; if its Link header names a last page, the
+        remaining pages are fetched concurrently (bounded by
+        max_concurrent_pages) and yielded in order. Without a Link header pages
+        are walked sequentially until a short page.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            params: Query parameters (page and per_page are added)
+            max_pages: Stop after this many pages
+
+        Yields:
+            Non-empty lists of items, one per page
+
+        Raises:
+            GitHubAPIError: If any page fails
+        """
+        params = {**(params or {}), "per_page": PAGE_SIZE}
+        data, headers = await self._request_with_headers(
+            "GET", endpoint, params={**params, "page": 1}
+        )
+        if not isinstance(data, list) or not data:
+            return
+        yield data
+
+        last_page = parse_last_page(headers.get("Link"))
+        if max_pages is not None:
+            last_page = min(last_page, max_pages) if last_page else None
+            if max_pages <= 1:
+                return
+
+        if last_page is None:
+            page = 2
+            while len(data) == PAGE_SIZE and (max_pages is None or page <= max_pages):
+                data = await self._request("GET", endpoint, params={**params, "page": page})
+                if not isinstance(data, list) or not data:
+                    return
+                yield data
+                page += 1
+            return
+
+        semaphore = asyncio.Semaphore(self.settings.github.max_concurrent_pages)
+
+        async def fetch_page(page: int) -> dict[str, Any] | list[Any]:
+            async with semaphore:
+                return await self._request("GET", endpoint, params={**params, "page": page})
+
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(2, last_page + 1)]
+        try:
+            for task in tasks:
+                data = await task
+                if isinstance(data, list) and data:
+                    yield data
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_pages: int | None = None,
+    ) -> list[Any]:
+        """Collect every item of a paginated list endpoint (see _iter_pages)"""
+        items: list[Any] = []
+        async for page in self._iter_pages(endpoint, params, max_pages=max_pages):
+            items.extend(page)
+        return items
+
+    async def search_code_repositories(self, query: str) -> set[str] | None:
+        """
+        Find the repositories containing files that match a code search query
+
+        Pages are read sequentially (code search has its own, small rate limit).
+
+        Args:
+            query: Code search query (e.g. "org:brookside-bi filename:CLAUDE.md")
+
+        Returns:
+            Full names of matching repositories, or None if GitHub reported the
+            results as incomplete or the query matched more than can be paged
+
+        Raises:
+            GitHubAPIError: If the search fails
+
+        Example:
+            >>> query = "org:brookside-bi path:.claude/agents"
+            >>> repos = await client.search_code_repositories(query)
+        """
+        repositories: set[str] = set()
+        for page in range(1, CODE_SEARCH_MAX_RESULTS // PAGE_SIZE + 1):
+            data = await self._request(
+                "GET", "/search/code", params={"q": query, "per_page": PAGE_SIZE, "page": page}
+            )
+            total = data.get("total_count", 0)
+            if data.get("incomplete_results") or total > CODE_SEARCH_MAX_RESULTS:
+                return None
+            items = data.get("items", [])
+            repositories.update(item["repository"]["full_name"] for item in items)
+            if len(items) < PAGE_SIZE:
+                break
+        return repositories
+
     async def list_organization_repos(
         self, org: str | None = None, include_private: bool = True
     ) -> list[Repository]:
@@ -139,37 +722,38 @@ class GitHubMCPClient:
         org = org or self.settings.github.organization
         logger.info(f"Scanning organization: {org}")
 
-        all_repos: list[Repository] = []
-        page = 1
-        per_page = 100
+        all_repos = [repo async for repo in self.iter_organization_repos(org, include_private)]
 
-        # Try organization repos first, fall back to user repos if 404
-        is_org = True
+        logger.info(f"Found {len(all_repos)} repositories in {org}")
+        return all_repos
 
-        while True:
-            try:
-                endpoint = f"/orgs/{org}/repos" if is_org else f"/users/{org}/repos"
-                data = await self._request(
-                    "GET",
-                    endpoint,
-                    params={"page": page, "per_page": per_page, "type": "all"},
-                )
-            except GitHubAPIError as e:
-                # If first page and 404, try user endpoint instead
-                if "404" in str(e) and page == 1 and is_org:
-                    logger.info(f"Not an organization, trying user repos for: {org}")
-                    is_org = False
-                    continue
-                else:
-                    raise
+    async def iter_organization_repos(
+        self, org: str | None = None, include_private: bool = True
+    ) -> AsyncIterator[Repository]:
+        """
+        Yield repositories in organization or user account as listing pages arrive
 
-            if not isinstance(data, list):
-                break
+        Args:
+            org: Organization or username (defaults to config value)
+            include_private: Include private repositories
 
-            if not data:
-                break
+        Yields:
+            Repository objects in listing order
+
+        Example:
+            >>> async for repo in client.iter_organization_repos("brookside-bi"):
+            ...     analysis = await analyzer.analyze_repository(repo)
+        """
+        org = org or self.settings.github.organization
+        seen: set[str] = set()
+
+        async for page in self._iter_repository_pages(org):
+            for repo_data in page:
+                # Pages fetched in parallel can overlap if the listing shifts mid-scan
+                if repo_data["full_name"] in seen:
+                    continue
+                seen.add(repo_data["full_name"])
 
-            for repo_data in data:
                 # Filter private repos if requested
                 if not include_private and repo_data.get("private", False):
                     continue
@@ -179,45 +763,52 @@ class GitHubMCPClient:
                     logger.debug(f"Skipping excluded repository: {repo_data['name']}")
                     continue
 
-                # Parse repository data
-                repo = Repository(
-                    name=repo_data["name"],
-                    full_name=repo_data["full_name"],
-                    url=repo_data["html_url"],
-                    description=repo_data.get("description"),
-                    primary_language=repo_data.get("language"),
-                    is_private=repo_data.get("private", False),
-                    is_fork=repo_data.get("fork", False),
-                    is_archived=repo_data.get("archived", False),
-                    default_branch=repo_data.get("default_branch", "main"),
-                    created_at=datetime.fromisoformat(
-                        repo_data["created_at"].replace("Z", "+00:00")
-                    ),
-                    updated_at=datetime.fromisoformat(
-                        repo_data["updated_at"].replace("Z", "+00:00")
-                    ),
-                    pushed_at=(
-                        datetime.fromisoformat(repo_data["pushed_at"].replace("Z", "+00:00"))
-                        if repo_data.get("pushed_at")
-                        else None
-                    ),
-                    size_kb=repo_data.get("size", 0),
-                    stars_count=repo_data.get("stargazers_count", 0),
-                    forks_count=repo_data.get("forks_count", 0),
-                    open_issues_count=repo_data.get("open_issues_count", 0),
-                    topics=repo_data.get("topics", []),
-                )
-
-                all_repos.append(repo)
-
-            # Check if there are more pages
-            if len(data) < per_page:
-                break
+                yield self._parse_repository(repo_data)
 
-            page += 1
-
-        logger.info(f"Found {len(all_repos)} repositories in {org}")
-        return all_repos
+    async def _iter_repository_pages(self, org: str) -> AsyncIterator[list[Any]]:
+        """Yield repository listing pages, falling back to the user endpoint on 404"""
+        first_page = True
+        try:
+            async for page in self._iter_pages(f"/orgs/{org}/repos", {"type": "all"}):
+                first_page = False
+                yield page
+            return
+        except GitHubAPIError as e:
+            # A non-organization account 404s on page 1; a later 404 is a real failure
+            # that must not be papered over by listing a user's repositories instead
+            if e.status_code != 404 or not first_page:
+                raise
+
+        logger.info(f"Not an organization, trying user repos for: {org}")
+        async for page in self._iter_pages(f"/users/{org}/repos", {"type": "all"}):
+            yield page
+
+    @staticmethod
+    def _parse_repository(repo_data: dict[str, Any]) -> Repository:
+        """Convert a REST repository payload into a Repository"""
+        return Repository(
+            name=repo_data["name"],
+            full_name=repo_data["full_name"],
+            url=repo_data["html_url"],
+            description=repo_data.get("description"),
+            primary_language=repo_data.get("language"),
+            is_private=repo_data.get("private", False),
+            is_fork=repo_data.get("fork", False),
+            is_archived=repo_data.get("archived", False),
+            default_branch=repo_data.get("default_branch", "main"),
+            created_at=datetime.fromisoformat(repo_data["created_at"].replace("Z", "+00:00")),
+            updated_at=datetime.fromisoformat(repo_data["updated_at"].replace("Z", "+00:00")),
+            pushed_at=(
+                datetime.fromisoformat(repo_data["pushed_at"].replace("Z", "+00:00"))
+                if repo_data.get("pushed_at")
+                else None
+            ),
+            size_kb=repo_data.get("size", 0),
+            stars_count=repo_data.get("stargazers_count", 0),
+            forks_count=repo_data.get("forks_count", 0),
+            open_issues_count=repo_data.get("open_issues_count", 0),
+            topics=repo_data.get("topics", []),
+        )
 
     async def get_repository_languages(self, repo: Repository) -> dict[str, int]:
         """
@@ -247,6 +838,11 @@ class GitHubMCPClient:
         """
         Get commit activity statistics
 
+        Reads GitHub's precomputed statistics, which count every commit in the
+        window. While GitHub is still computing them (202 Accepted) the repository
+        is queued in deferred_stats and provisional counts are streamed from the
+        commit listing; the scanner revisits the queue at the end of the scan.
+
         Args:
             repo: Repository object
             days: Number of days to analyze
@@ -258,56 +854,147 @@ class GitHubMCPClient:
             >>> stats = await client.get_commit_activity(repo, days=90)
             >>> print(f"Commits (90d): {stats.commits_last_90_days}")
         """
-        org, repo_name = repo.full_name.split("/")
-
-        # Get commits since date
-        since_date = datetime.now() - timedelta(days=days)
-        since_str = since_date.isoformat()
-
-        try:
-            data = await self._request(
-                "GET",
-                f"/repos/{org}/{repo_name}/commits",
-                params={"since": since_str, "per_page": 100},
-            )
+        if self.settings.github.stats_endpoints_enabled:
+            try:
+                return await self.get_commit_statistics(repo, days)
+            except StatisticsPendingError:
+                self.deferred_stats[repo.full_name] = repo
+                logger.debug(f"Commit statistics for {repo.name} pending; deferring")
+            except GitHubAPIError as e:
+                if is_transient(e):
+                    raise
+                logger.debug(f"Commit statistics unavailable for {repo.name}: {e.message}")
 
-            if not isinstance(data, list):
-                return CommitStats()
+        return await self._list_commit_activity(repo, days)
 
-            commits_90d = len(data)
+    async def get_commit_statistics(self, repo: Repository, days: int = 90) -> CommitStats:
+        """
+        Get commit activity from /stats/commit_activity and /stats/contributors
 
-            # Use timezone-aware datetime for comparison
-            from datetime import timezone
-            now_aware = datetime.now(timezone.utc)
+        Args:
+            repo: Repository object
+            days: Number of days to analyze
 
-            commits_30d = sum(
-                1
-                for commit in data
-                if datetime.fromisoformat(
-                    commit["commit"]["author"]["date"].replace("Z", "+00:00")
-                )
-                >= now_aware - timedelta(days=30)
-            )
+        Returns:
+            CommitStats object
 
-            # Get unique contributors
-            unique_authors = {commit["commit"]["author"]["email"] for commit in data}
+        Raises:
+            StatisticsPendingError: If GitHub is still computing the statistics
+            GitHubAPIError: If the statistics cannot be read
+        """
+        org, repo_name = repo.full_name.split("/")
+        commit_activity, contributors = await asyncio.gather(
+            self._request("GET", f"/repos/{org}/{repo_name}/stats/commit_activity"),
+            self._request("GET", f"/repos/{org}/{repo_name}/stats/contributors"),
+        )
+        return commit_stats_from_statistics(
+            commit_activity, contributors, days, now=datetime.now(timezone.utc).timestamp()
+        )
 
-            # Calculate weekly average
-            weeks = days / 7
-            avg_commits_per_week = commits_90d / weeks if weeks > 0 else 0
+    async def _list_commit_activity(self, repo: Repository, days: int) -> CommitStats:
+        """
+        Count commit activity from the commit listing
+
+        With the commit ledger enabled, a repository seen before is synced by
+        comparing the last recorded head SHA with the default branch, which returns
+        exactly the commits added since, whatever their commit dates. Repositories
+        not pushed since the last sync are answered without any request. Otherwise
+        the window is listed, bounded by max_commit_pages, so very busy
+        repositories may be undercounted.
+        """
+        org, repo_name = repo.full_name.split("/")
+        now = datetime.now(timezone.utc).timestamp()
+        window_start = now - max(days, COMMIT_LEDGER_RETENTION_DAYS) * 86400
 
-            return CommitStats(
-                total_commits=commits_90d,  # Approximation
-                commits_last_30_days=commits_30d,
-                commits_last_90_days=commits_90d,
-                unique_contributors=len(unique_authors),
-                average_commits_per_week=avg_commits_per_week,
-            )
+        entry = self.commit_ledger.get(repo.full_name) if self.commit_ledger else None
+        if entry is not None and entry.covers(window_start):
+            if repo.pushed_at and repo.pushed_at.timestamp() <= entry.synced_at:
+                self.commit_ledger.hits += 1
+                return entry.stats(days, now)
+        else:
+            entry = None
 
+        try:
+            if entry is None or not await self._compare_commit_activity(repo, entry):
+                entry = await self._list_commit_window(repo, window_start, now)
         except GitHubAPIError as e:
+            # An outage must not read as an inactive repository
+            if is_transient(e):
+                raise
             logger.warning(f"Failed to get commit stats for {repo.name}: {e.message}")
             return CommitStats()
 
+        entry.prune(window_start)
+        entry.synced_at = now
+
+        if self.commit_ledger:
+            self.commit_ledger.put(repo.full_name, entry)
+        return entry.stats(days, now)
+
+    async def _compare_commit_activity(self, repo: Repository, entry: CommitLedgerEntry) -> bool:
+        """
+        Add the commits made since the ledger's head SHA
+
+        Returns:
+            False if the ledger cannot be brought up to date this way (no head
+            recorded, history rewritten, or more commits than one comparison lists)
+        """
+        if entry.head is None:
+            return False
+
+        org, repo_name = repo.full_name.split("/")
+        try:
+            comparison = await self._request(
+                "GET", f"/repos/{org}/{repo_name}/compare/{entry.head}...{repo.default_branch}"
+            )
+        except GitHubAPIError as e:
+            if is_transient(e):
+                raise
+            # The recorded head is gone (e.g. force-push)
+            return False
+
+        if not isinstance(comparison, dict):
+            return False
+        commits = comparison.get("commits", [])
+        if comparison.get("status") not in ("ahead", "identical") or (
+            comparison.get("total_commits", 0) > len(commits)
+        ):
+            return False
+
+        for commit in commits:
+            _record_commit(entry, commit)
+        if commits:
+            entry.head = commits[-1]["sha"]  # Compared commits are oldest first
+        return True
+
+    async def _list_commit_window(
+        self, repo: Repository, window_start: float, now: float
+    ) -> CommitLedgerEntry:
+        """List the default branch commits of the window into a fresh ledger entry"""
+        org, repo_name = repo.full_name.split("/")
+        entry = CommitLedgerEntry(covered_since=window_start)
+        max_pages = self.settings.github.max_commit_pages
+        pages = 0
+        oldest = now
+        last_page_size = 0
+
+        async for page in self._iter_pages(
+            f"/repos/{org}/{repo_name}/commits",
+            params={"since": datetime.fromtimestamp(window_start, timezone.utc).isoformat()},
+            max_pages=max_pages,
+        ):
+            if pages == 0 and page:
+                entry.head = page[0]["sha"]  # The listing starts at the branch head
+            pages += 1
+            last_page_size = len(page)
+            for commit in page:
+                oldest = min(oldest, _record_commit(entry, commit))
+
+        if pages == max_pages and last_page_size == PAGE_SIZE:
+            # Listing was cut off; only the fetched span is known to be complete
+            entry.prune(oldest)
+        return entry
+
     async def get_repository_dependencies(
         self, repo: Repository
     ) -> list[Dependency]:
@@ -333,14 +1020,30 @@ class GitHubMCPClient:
             ...     print(f"{dep.name} ({dep.package_manager})")
         """
         org, repo_name = repo.full_name.split("/")
+
+        contents = await asyncio.gather(
+            *(self.get_file_bytes(org, repo_name, path) for path in DEPENDENCY_MANIFESTS)
+        )
+        return self.parse_dependency_manifests(dict(zip(DEPENDENCY_MANIFESTS, contents)))
+
+    def parse_dependency_manifests(
+        self, manifests: dict[str, str | bytes | None]
+    ) -> list[Dependency]:
+        """
+        Parse dependency manifests already fetched from a repository
+
+        Args:
+            manifests: Manifest path (see DEPENDENCY_MANIFESTS) to file content (text or raw bytes)
+
+        Returns:
+            List of Dependency objects
+        """
         dependencies: list[Dependency] = []
 
-        # Try to get package.json for npm dependencies
+        # package.json for npm dependencies
         try:
-            package_json = await self._get_file_content(org, repo_name, "package.json")
+            package_json = manifests.get("package.json")
             if package_json:
-                import json
-
                 pkg_data = json.loads(package_json)
 
                 # Production dependencies
@@ -367,9 +1070,11 @@ class GitHubMCPClient:
         except Exception as e:
             logger.debug(f"No package.json or parse error: {e}")
 
-        # Try to get requirements.txt for pip dependencies
+        # requirements.txt for pip dependencies
         try:
-            requirements = await self._get_file_content(org, repo_name, "requirements.txt")
+            requirements = manifests.get("requirements.txt")
+            if isinstance(requirements, bytes):
+                requirements = requirements.decode("utf-8", errors="replace")
             if requirements:
                 for line in requirements.split("\n"):
                     line = line.strip()
@@ -402,20 +1107,115 @@ class GitHubMCPClient:
             file_path: Path to file
 
         Returns:
-            File content as string, or None if not found
+            File content as string, or None if not found or not valid UTF-8
         """
+        data = await self.get_file_bytes(org, repo_name, file_path)
+        if data is None:
+            return None
         try:
-            data = await self._request("GET", f"/repos/{org}/{repo_name}/contents/{file_path}")
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    async def get_file_bytes(
+        self, org: str, repo_name: str, file_path: str
+    ) -> bytes | None:
+        """
+        Get raw file content from repository
 
-            if isinstance(data, dict) and data.get("content"):
-                import base64
+        Files are streamed with the raw media type, so content arrives without a
+        JSON envelope or base64 encoding. Files the contents API refuses as too
+        large are read from the Git blobs API by SHA. Files larger than
+        max_file_size_kb are skipped.
 
-                return base64.b64decode(data["content"]).decode("utf-8")
+        Args:
+            org: Organization name
+            repo_name: Repository name
+            file_path: Path to file
+
+        Returns:
+            File bytes (wrap in memoryview for zero-copy slicing), or None if not found
 
+        Example:
+            >>> data = await client.get_file_bytes("brookside-bi", "repo", "package-lock.json")
+            >>> lock = json.loads(data) if data else None
+        """
+        full_name = f"{org}/{repo_name}"
+        snapshot = self._snapshots.get(full_name)
+        if snapshot:
+            return snapshot.read_bytes(file_path)
+
+        max_bytes = self.settings.analysis.max_file_size_kb * 1024
+
+        # A complete tree listing already proves absence and knows the blob size
+        entry = None
+        tree = self._trees.get(full_name)
+        if tree is not None:
+            entry = tree.get(file_path)
+            if entry is None and not tree.truncated:
+                return None
+            if entry is not None and (entry.type != "blob" or (entry.size or 0) > max_bytes):
+                return None
+
+        tree_sha = None
+        if self.missing_paths:
+            tree_sha = await self._get_tree_sha(org, repo_name)
+            if tree_sha and self.missing_paths.is_missing(full_name, tree_sha, file_path):
+                return None
+
+        try:
+            return await self._request_raw(
+                f"/repos/{org}/{repo_name}/contents/{file_path}", max_bytes=max_bytes
+            )
+        except GitHubAPIError as e:
+            # An outage must not read as a missing file
+            if is_transient(e):
+                raise
+            if e.status_code == 404:
+                if tree_sha:
+                    self.missing_paths.record_missing(full_name, tree_sha, file_path)
+                return None
+            if e.status_code != 403:
+                logger.debug(f"Could not read {full_name}/{file_path}: {e.message}")
+                return None
+
+        # 403 from the contents API means the file is too large for it
+        blob_sha = entry.sha if entry else await self._find_blob_sha(org, repo_name, file_path)
+        if not blob_sha:
+            return None
+        try:
+            return await self._request_raw(
+                f"/repos/{org}/{repo_name}/git/blobs/{blob_sha}", max_bytes=max_bytes
+            )
+        except GitHubAPIError as e:
+            if is_transient(e):
+                raise
+            logger.debug(f"Could not read blob for {full_name}/{file_path}: {e.message}")
             return None
 
-        except GitHubAPIError:
+    async def _find_blob_sha(self, org: str, repo_name: str, file_path: str) -> str | None:
+        """Look up a file's blob SHA from its parent directory listing"""
+        parent, _, name = file_path.rpartition("/")
+        try:
+            listing = await self._request("GET", f"/repos/{org}/{repo_name}/contents/{parent}")
+        except GitHubAPIError as e:
+            if is_transient(e):
+                raise
+            return None
+        if not isinstance(listing, list):
             return None
+        return next((item["sha"] for item in listing if item.get("name") == name), None)
+
+    async def _get_tree_sha(self, org: str, repo_name: str) -> str | None:
+        """Resolve the root tree SHA of the repository head (None for empty repositories)"""
+        full_name = f"{org}/{repo_name}"
+        if full_name not in self.tree_shas:
+            try:
+                data = await self._request("GET", f"/repos/{org}/{repo_name}/git/trees/HEAD")
+                self.tree_shas[full_name] = data["sha"]
+            except (GitHubAPIError, KeyError, TypeError):
+                return None
+        return self.tree_shas[full_name]
 
     async def check_file_exists(
         self, repo: Repository, file_path: str
@@ -434,10 +1234,256 @@ class GitHubMCPClient:
             >>> has_tests = await client.check_file_exists(repo, "tests/")
             >>> has_docs = await client.check_file_exists(repo, "README.md")
         """
+        snapshot = self._snapshots.get(repo.full_name)
+        if snapshot:
+            return snapshot.exists(file_path)
+
+        tree = await self.get_repository_tree(repo)
+        if tree is not None:
+            found = tree.exists(file_path)
+            # A truncated listing cannot prove absence; probe the API instead
+            if found or not tree.truncated:
+                return found
+
         org, repo_name = repo.full_name.split("/")
-        content = await self._get_file_content(org, repo_name, file_path)
+
+        if file_path.endswith("/"):
+            try:
+                data = await self._request(
+                    "GET", f"/repos/{org}/{repo_name}/contents/{file_path.rstrip('/')}"
+                )
+                return isinstance(data, list)
+            except GitHubAPIError as e:
+                if is_transient(e):
+                    raise
+                return False
+
+        content = await self.get_file_bytes(org, repo_name, file_path)
         return content is not None
 
+    async def list_directory(
+        self, repo: Repository, path: str, recursive: bool = False
+    ) -> list[str]:
+        """
+        List the children of a repository directory
+
+        Answered from a loaded snapshot or a complete tree index when available,
+        otherwise with one contents API call per listed directory.
+
+        Args:
+            repo: Repository object
+            path: Directory path
+            recursive: Include entries of nested directories, not only direct children
+
+        Returns:
+            Repository paths of the files and directories inside, sorted (empty if absent)
+
+        Example:
+            >>> agents = await client.list_directory(repo, ".claude/agents")
+            >>> print(agents)  # ['.claude/agents/cost-analyst.md', ...]
+        """
+        snapshot = self._snapshots.get(repo.full_name)
+        if snapshot:
+            return snapshot.list_dir(path, recursive)
+
+        tree = await self.get_repository_tree(repo)
+        if tree is not None and not tree.truncated:
+            return [entry.path for entry in tree.list_dir(path, recursive)]
+
+        org, repo_name = repo.full_name.split("/")
+        try:
+            listing = await self._request(
+                "GET", f"/repos/{org}/{repo_name}/contents/{path.strip('/')}"
+            )
+        except GitHubAPIError as e:
+            if is_transient(e):
+                raise
+            return []
+        if not isinstance(listing, list):
+            return []  # A file, not a directory
+
+        paths = [item["path"] for item in listing]
+        if recursive:
+            nested = await asyncio.gather(
+                *(
+                    self.list_directory(repo, item["path"], recursive=True)
+                    for item in listing
+                    if item.get("type") == "dir"
+                )
+            )
+            paths.extend(path for children in nested for path in children)
+        return sorted(paths)
+
+    async def load_snapshot(self, repo: Repository) -> RepositorySnapshot | None:
+        """
+        Download and extract the repository tarball for local file access
+
+        While a snapshot is loaded, _get_file_content and check_file_exists for the
+        repository are served from disk. Release it with release_snapshot.
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            RepositorySnapshot, or None if skipped (too large, unsupported) or failed
+
+        Example:
+            >>> snapshot = await client.load_snapshot(repo)
+            >>> try:
+            ...     deps = await client.get_repository_dependencies(repo)
+            ... finally:
+            ...     client.release_snapshot(repo)
+        """
+        if repo.full_name in self._snapshots:
+            return self._snapshots[repo.full_name]
+
+        if not self._client:
+            raise GitHubAPIError("Client not initialized. Use async context manager.")
+
+        max_size_kb = self.settings.analysis.snapshot_max_size_kb
+        if repo.size_kb > max_size_kb:
+            logger.info(
+                f"Skipping snapshot for {repo.name}: {repo.size_kb} KB exceeds {max_size_kb} KB"
+            )
+            return None
+
+        if not snapshots_supported():
+            logger.warning("Tarball snapshots require Python 3.11.4+; using per-file requests")
+            return None
+
+        org, repo_name = repo.full_name.split("/")
+        url = f"{self.base_url}/repos/{org}/{repo_name}/tarball/{repo.default_branch}"
+        destination = Path(self.settings.analysis.cache_dir) / "snapshots" / org / repo_name
+
+        try:
+            headers: dict[str, str] = {}
+            credential = await self._authorize(headers, "core", org)
+            async with self._client.stream(
+                "GET", url, headers=headers, follow_redirects=True
+            ) as response:
+                credential.rate_limiter.observe(response.headers, response.status_code)
+                response.raise_for_status()
+
+                if destination.exists():
+                    RepositorySnapshot(repo.full_name, destination).remove()
+                # Extract while downloading; the tarball is never held whole
+                reader = AsyncChunkReader(response.aiter_bytes(), asyncio.get_running_loop())
+                await asyncio.to_thread(
+                    extract_tarball, io.BufferedReader(reader), destination
+                )
+
+        except (httpx.HTTPError, tarfile.TarError, OSError) as e:
+            logger.warning(f"Snapshot download failed for {repo.name}, using per-file requests: {e}")
+            RepositorySnapshot(repo.full_name, destination).remove()
+            return None
+
+        snapshot = RepositorySnapshot(repo.full_name, destination)
+        self._snapshots[repo.full_name] = snapshot
+        logger.debug(f"Loaded snapshot for {repo.name}")
+        return snapshot
+
+    def release_snapshot(self, repo: Repository) -> None:
+        """Delete a loaded snapshot and return to API-backed file access"""
+        snapshot = self._snapshots.pop(repo.full_name, None)
+        if snapshot:
+            snapshot.remove()
+
+    async def get_head_sha(self, repo: Repository) -> str | None:
+        """
+        Resolve the commit SHA at the head of the repository's default branch
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            Commit SHA, or None if the branch is unavailable (e.g. empty repo)
+        """
+        if repo.full_name not in self.head_shas:
+            org, repo_name = repo.full_name.split("/")
+            try:
+                branch = await self._request(
+                    "GET", f"/repos/{org}/{repo_name}/branches/{repo.default_branch}"
+                )
+                commit = branch["commit"]
+                self.head_shas[repo.full_name] = commit["sha"]
+                self.tree_shas[repo.full_name] = commit["commit"]["tree"]["sha"]
+            except (GitHubAPIError, KeyError, TypeError) as e:
+                if isinstance(e, GitHubAPIError) and is_transient(e):
+                    raise
+                logger.debug(f"No head commit for {repo.name}: {e}")
+                return None
+
+        return self.head_shas[repo.full_name]
+
+    async def get_repository_tree(self, repo: Repository) -> RepoTreeIndex | None:
+        """
+        Get an index of every path on the repository's default branch
+
+        Resolves the branch head to its tree SHA, then loads the index from the
+        on-disk store or a single recursive Git Trees call.
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            RepoTreeIndex, or None if disabled or the tree is unavailable (e.g. empty repo)
+
+        Example:
+            >>> tree = await client.get_repository_tree(repo)
+            >>> tree.exists(".github/workflows/")
+        """
+        if not self.settings.analysis.tree_index_enabled:
+            return None
+
+        if repo.full_name in self._trees:
+            self._trees.move_to_end(repo.full_name)
+            return self._trees[repo.full_name]
+
+        return await self._tree_flight.do(
+            repo.full_name, lambda: self._load_repository_tree(repo)
+        )
+
+    async def _load_repository_tree(self, repo: Repository) -> RepoTreeIndex | None:
+        """Fetch (or load from the store) and remember one repository's tree index"""
+        org, repo_name = repo.full_name.split("/")
+        index: RepoTreeIndex | None = None
+
+        try:
+            branch = await self._request(
+                "GET", f"/repos/{org}/{repo_name}/branches/{repo.default_branch}"
+            )
+            commit = branch["commit"]
+            tree_sha = commit["commit"]["tree"]["sha"]
+            self.head_shas[repo.full_name] = commit["sha"]
+            self.tree_shas[repo.full_name] = tree_sha
+
+            index = self.tree_store.get(tree_sha) if self.tree_store else None
+            if index is None:
+                payload = await self._request(
+                    "GET",
+                    f"/repos/{org}/{repo_name}/git/trees/{tree_sha}",
+                    params={"recursive": "1"},
+                )
+                index = RepoTreeIndex.from_api(payload)
+                if self.tree_store:
+                    self.tree_store.put(index)
+
+            if index.truncated:
+                logger.info(f"Tree listing truncated for {repo.name}; missing paths will be probed")
+
+        except (GitHubAPIError, KeyError, TypeError) as e:
+            # Do not remember a missing index for a repository GitHub failed to serve
+            if isinstance(e, GitHubAPIError) and is_transient(e):
+                raise
+            logger.debug(f"No tree index for {repo.name}: {e}")
+            index = None
+
+        self._trees[repo.full_name] = index
+        if len(self._trees) > TREE_MEMO_SIZE:
+            self._trees.popitem(last=False)
+
+        return index
+
     async def get_repository_topics(self, repo: Repository) -> list[str]:
         """
         Get repository topics/tags
@@ -462,7 +1508,9 @@ class GitHubMCPClient:
 
             return []
 
-        except GitHubAPIError:
+        except GitHubAPIError as e:
+            if is_transient(e):
+                raise
             return []
 
     async def list_user_organizations(self) -> list[dict[str, Any]]:
@@ -479,22 +1527,21 @@ class GitHubMCPClient:
             ...         print(f"{org['login']}: {org.get('description', 'No description')}")
         """
         try:
-            data = await self._request("GET", "/user/orgs")
-
-            if isinstance(data, list):
-                return [
-                    {
-                        "login": org["login"],
-                        "description": org.get("description"),
-                        "url": org.get("html_url"),
-                        "repos_url": org.get("repos_url"),
-                    }
-                    for org in data
-                ]
-
-            return []
+            data = await self._paginate("/user/orgs")
+
+            return [
+                {
+                    "login": org["login"],
+                    "description": org.get("description"),
+                    "url": org.get("html_url"),
+                    "repos_url": org.get("repos_url"),
+                }
+                for org in data
+            ]
 
         except GitHubAPIError as e:
+            if is_transient(e):
+                raise
             logger.warning(f"Failed to list organizations: {e.message}")
             return []
 
@@ -0,0 +1,264 @@
+"""
+GraphQL Batch Signal Fetcher for Brookside BI Repository Analyzer
+
+Establishes bulk retrieval of per-repository analysis inputs (languages, commit
+activity, file existence and manifest contents) through aliased GitHub GraphQL
+queries, replacing a dozen REST calls per repository with a few queries per scan.
+
+Best for: Organization-wide scans where per-repository REST probing dominates
+API spend and wall-clock time.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from src.exceptions import GitHubAPIError
+from src.github_mcp_client import GitHubMCPClient
+from src.models import CommitStats, Repository, RepoSignals
+
+logger = logging.getLogger(__name__)
+
+# Commit authors sampled for contributor counts (matches the REST page size)
+AUTHOR_SAMPLE_SIZE = 100
+
+
+class GraphQLSignalFetcher:
+    """
+    Fetches RepoSignals for many repositories per GraphQL query
+
+    Each repository becomes one aliased `repository(...)` field. Paths are probed
+    with `object(expression: "HEAD:<path>")`, which resolves to a Blob or Tree
+    when present and null otherwise.
+    """
+
+    def __init__(
+        self,
+        github_client: GitHubMCPClient,
+        existence_paths: list[str],
+        content_paths: list[str],
+        batch_size: int = 25,
+        days: int = 90,
+        include_fragment: bool = True,
+        include_commit_activity: bool = True,
+    ):
+        """
+        Initialize GraphQL signal fetcher
+
+        Args:
+            github_client: GitHub client used to execute queries
+            existence_paths: Paths whose presence is checked (trailing "/" for directories)
+            content_paths: Text files whose content is fetched
+            batch_size: Repositories per query
+            days: Commit activity window in days
+            include_fragment: Fetch languages, commit activity and head SHA
+                (False fetches only the probed paths)
+            include_commit_activity: Count default branch history in the fragment
+                (False leaves commit_stats None for get_commit_activity to answer)
+
+        Example:
+            >>> fetcher = GraphQLSignalFetcher(client, ["README.md"], ["package.json"])
+            >>> signals = await fetcher.fetch(repos)
+            >>> signals["brookside-bi/repo-analyzer"].exists("README.md")
+        """
+        self.github_client = github_client
+        self.existence_paths = list(existence_paths)
+        self.content_paths = list(content_paths)
+        self.batch_size = max(1, batch_size)
+        self.days = days
+        self.include_fragment = include_fragment
+        self.include_commit_activity = include_fragment and include_commit_activity
+
+    async def fetch(self, repos: list[Repository]) -> dict[str, RepoSignals]:
+        """
+        Fetch signals for repositories in batches
+
+        Repositories whose batch fails, or which GraphQL cannot resolve, are left
+        out of the result so callers fall back to REST for them.
+
+        Args:
+            repos: Repositories to fetch
+
+        Returns:
+            Mapping of full repository name to RepoSignals
+        """
+        signals: dict[str, RepoSignals] = {}
+
+        for start in range(0, len(repos), self.batch_size):
+            batch = repos[start : start + self.batch_size]
+            query, variables = self.build_query(batch)
+
+            try:
+                data = await self.github_client.graphql(query, variables)
+            except GitHubAPIError as e:
+                logger.warning(
+                    f"GraphQL batch of {len(batch)} repositories failed, "
+                    f"falling back to REST: {e.message}"
+                )
+                continue
+
+            for index, repo in enumerate(batch):
+                repo_data = data.get(f"r{index}")
+                if repo_data:
+                    signals[repo.full_name] = self.parse_repository(repo.full_name, repo_data)
+
+        logger.info(f"Prefetched signals for {len(signals)}/{len(repos)} repositories via GraphQL")
+        return signals
+
+    def build_query(self, repos: list[Repository]) -> tuple[str, dict[str, Any]]:
+        """
+        Build an aliased GraphQL query for a batch of repositories
+
+        Args:
+            repos: Repositories in the batch
+
+        Returns:
+            Tuple of (query document, variables)
+        """
+        variables: dict[str, Any] = {}
+        declarations: list[str] = []
+        fields = []
+        if self.include_commit_activity:
+            now = datetime.now(timezone.utc)
+            variables["since90"] = (now - timedelta(days=self.days)).isoformat()
+            variables["since30"] = (now - timedelta(days=30)).isoformat()
+            declarations += ["$since90: GitTimestamp!", "$since30: GitTimestamp!"]
+        spread = "...RepoSignals " if self.include_fragment else ""
+
+        probes = self._probe_fields()
+
+        for index, repo in enumerate(repos):
+            owner, name = repo.full_name.split("/")
+            variables[f"o{index}"] = owner
+            variables[f"n{index}"] = name
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            fields.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) {{ "
+                f"{spread}{probes} }}"
+            )
+
+        query = (
+            f"query RepoSignals({', '.join(declarations)}) {{\n"
+            + "\n".join(fields)
+            + "\n}\n"
+            + (repo_signals_fragment(self.include_commit_activity) if self.include_fragment else "")
+        )
+        return query, variables
+
+    def _probe_fields(self) -> str:
+        """Build the object(expression:) fields for probed paths"""
+        parts = []
+        for index, path in enumerate(self.content_paths):
+            expression = json.dumps(f"HEAD:{path.rstrip('/')}")
+            parts.append(
+                f"c{index}: object(expression: {expression}) "
+                "{ __typename ... on Blob { text isBinary } }"
+            )
+        for index, path in enumerate(self.existence_paths):
+            expression = json.dumps(f"HEAD:{path.rstrip('/')}")
+            parts.append(f"e{index}: object(expression: {expression}) {{ __typename }}")
+        return " ".join(parts)
+
+    def parse_repository(self, full_name: str, data: dict[str, Any]) -> RepoSignals:
+        """
+        Convert one aliased repository result into RepoSignals
+
+        Args:
+            full_name: Full repository name
+            data: GraphQL data for the repository alias
+
+        Returns:
+            RepoSignals bundle
+        """
+        languages = {
+            edge["node"]["name"]: edge["size"]
+            for edge in (data.get("languages") or {}).get("edges", [])
+        }
+
+        paths_present: dict[str, bool] = {}
+        file_contents: dict[str, str | None] = {}
+
+        for index, path in enumerate(self.content_paths):
+            obj = data.get(f"c{index}")
+            paths_present[path] = self._matches(obj, path)
+            if obj and obj.get("__typename") == "Blob" and not obj.get("isBinary"):
+                file_contents[path] = obj.get("text")
+            else:
+                file_contents[path] = None
+
+        for index, path in enumerate(self.existence_paths):
+            paths_present[path] = self._matches(data.get(f"e{index}"), path)
+
+        target = (data.get("defaultBranchRef") or {}).get("target") or {}
+        return RepoSignals(
+            full_name=full_name,
+            languages=languages,
+            commit_stats=(
+                self._parse_commit_stats(data) if self.include_commit_activity else None
+            ),
+            paths_present=paths_present,
+            file_contents=file_contents,
+            paths_probed=bool(self.content_paths or self.existence_paths),
+            head_sha=target.get("oid"),
+        )
+
+    def _matches(self, obj: dict[str, Any] | None, path: str) -> bool:
+        """Check a resolved object against the probed path kind (file or directory)"""
+        if not obj:
+            return False
+        if path.endswith("/"):
+            return obj.get("__typename") == "Tree"
+        return True
+
+    def _parse_commit_stats(self, data: dict[str, Any]) -> CommitStats:
+        """Build CommitStats from the default branch history fields"""
+        target = (data.get("defaultBranchRef") or {}).get("target") or {}
+        if not target:
+            # Empty repository
+            return CommitStats()
+
+        commits_90d = (target.get("history90") or {}).get("totalCount", 0)
+        commits_30d = (target.get("history30") or {}).get("totalCount", 0)
+        authors = {
+            (node.get("author") or {}).get("email")
+            for node in (target.get("authors") or {}).get("nodes", [])
+        }
+        authors.discard(None)
+
+        weeks = self.days / 7
+        return CommitStats(
+            total_commits=commits_90d,  # Commits in the window, as on the REST paths
+            commits_last_30_days=commits_30d,
+            commits_last_90_days=commits_90d,
+            unique_contributors=len(authors),
+            average_commits_per_week=commits_90d / weeks if weeks > 0 else 0,
+        )
+
+
+# Default branch history counts and a sample of commit authors
+COMMIT_ACTIVITY_FIELDS = f"""
+      ... on Commit {{
+        history90: history(since: $since90) {{ totalCount }}
+        history30: history(since: $since30) {{ totalCount }}
+        authors: history(since: $since90, first: {AUTHOR_SAMPLE_SIZE}) {{
+          nodes {{ author {{ email }} }}
+        }}
+      }}"""
+
+
+def repo_signals_fragment(include_commit_activity: bool = True) -> str:
+    """Build the RepoSignals fragment, with or without commit activity fields"""
+    activity = COMMIT_ACTIVITY_FIELDS if include_commit_activity else ""
+    return f"""
+fragment RepoSignals on Repository {{
+  languages(first: 50, orderBy: {{field: SIZE, direction: DESC}}) {{
+    edges {{ size node {{ name }} }}
+  }}
+  defaultBranchRef {{
+    target {{
+      oid{activity}
+    }}
+  }}
+}}
+"""
@@ -0,0 +1,228 @@
+"""
+Conditional Request Cache for Brookside BI Repository Analyzer
+
+Establishes a persistent ETag / Last-Modified cache so repeated scans replay GET
+requests as conditional requests and serve unchanged payloads from disk.
+
+Best for: Weekly scans that re-read mostly unchanged repository metadata, where
+GitHub's 304 Not Modified responses do not count against the rate limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Response headers persisted alongside the body (needed to replay a 304 faithfully)
+REPLAYED_HEADERS = ("Content-Type", "Link")
+
+
+@dataclass
+class CachedResponse:
+    """Validators and body of a previously fetched GET response"""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    stored_at: float
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> dict | list:
+        """Decode the cached body as JSON"""
+        return json.loads(self.body)
+
+
+def credential_identity(token: str) -> str:
+    """
+    Derive a non-reversible cache identity for a credential
+
+    Args:
+        token: API token
+
+    Returns:
+        Short hex digest identifying the credential without storing it
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class ConditionalRequestCache:
+    """
+    On-disk cache of GET responses keyed by URL, Accept header and auth identity
+
+    Entries older than the TTL are discarded and refetched unconditionally;
+    fresher entries are revalidated with If-None-Match / If-Modified-Since.
+    With pooled credentials, pass the identity of the credential sending each
+    request so one token's view is never replayed for another.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_hours: int, identity: str = ""):
+        """
+        Initialize conditional request cache
+
+        Args:
+            cache_dir: Root cache directory (entries go under cache_dir/http)
+            ttl_hours: Maximum age of an entry before it is discarded
+            identity: Default credential identity (see credential_identity) for
+                lookups that do not pass one
+
+        Example:
+            >>> cache = ConditionalRequestCache(Path(".cache"), 168)
+            >>> entry = cache.get(request, identity=credential.identity)
+        """
+        self.root = Path(cache_dir) / "http"
+        self.ttl_seconds = ttl_hours * 3600
+        self.identity = identity
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.expired = 0
+
+    def key(self, request: httpx.Request, identity: str | None = None) -> str:
+        """Compute cache key for a request sent with a credential identity"""
+        accept = request.headers.get("Accept", "")
+        identity = self.identity if identity is None else identity
+        material = f"{identity}\n{request.url}\n{accept}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        directory = self.root / key[:2]
+        return directory / f"{key}.json", directory / f"{key}.body"
+
+    def get(self, request: httpx.Request, identity: str | None = None) -> CachedResponse | None:
+        """
+        Look up a fresh cache entry for a request
+
+        Args:
+            request: Outgoing GET request
+            identity: Identity of the credential sending it (default: the cache's)
+
+        Returns:
+            CachedResponse, or None if absent, expired or unreadable
+        """
+        meta_path, body_path = self._paths(self.key(request, identity))
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if time.time() - meta.get("stored_at", 0) > self.ttl_seconds:
+            self.expired += 1
+            self.misses += 1
+            self._remove(meta_path, body_path)
+            return None
+
+        return CachedResponse(
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            body=body,
+            stored_at=meta["stored_at"],
+            headers=meta.get("headers", {}),
+        )
+
+    def apply_validators(self, request: httpx.Request, entry: CachedResponse | None) -> None:
+        """Turn a request into a conditional request using the cached validators"""
+        # Drop validators of an earlier attempt (possibly sent with another credential)
+        request.headers.pop("If-None-Match", None)
+        request.headers.pop("If-Modified-Since", None)
+        if entry is None:
+            return
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+    def put(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        body: bytes | None = None,
+        identity: str | None = None,
+    ) -> None:
+        """
+        Store a successful response if it carries a validator
+
+        Args:
+            request: Request that produced the response
+            response: 200 response with ETag and/or Last-Modified
+            body: Body already read from a streamed response (defaults to response.content)
+            identity: Identity of the credential that sent it (default: the cache's)
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(self.key(request, identity))
+        meta = {
+            "url": str(request.url),
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "headers": {
+                name: response.headers[name]
+                for name in REPLAYED_HEADERS
+                if name in response.headers
+            },
+        }
+
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(body_path, response.content if body is None else body)
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+            self.stores += 1
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache entry: {e}")
+
+    def record_hit(self, request: httpx.Request, identity: str | None = None) -> None:
+        """
+        Record a 304 response served from the cache
+
+        The entry was just revalidated, so its age restarts: entries that keep
+        revalidating are not discarded by the TTL and refetched in full.
+
+        Args:
+            request: Request that was answered with 304
+            identity: Identity of the credential that sent it (default: the cache's)
+        """
+        self.hits += 1
+
+        meta_path, _ = self._paths(self.key(request, identity))
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["stored_at"] = time.time()
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to refresh HTTP cache entry: {e}")
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, *paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache counters for scan summaries"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "expired": self.expired,
+        }
@@ -117,13 +117,41 @@ class ClaudeConfig(BaseModel):
 class CommitStats(BaseModel):
     """Repository commit statistics"""
 
-    total_commits: int = Field(default=0, description="Total number of commits")
+    total_commits: int = Field(default=0, description="Commits in the analysis window")
     commits_last_30_days: int = Field(default=0, description="Commits in last 30 days")
     commits_last_90_days: int = Field(default=0, description="Commits in last 90 days")
     unique_contributors: int = Field(default=0, description="Number of unique contributors")
     average_commits_per_week: float = Field(default=0.0, description="Average weekly commits")
 
 
+class RepoSignals(BaseModel):
+    """Per-repository analysis inputs prefetched in bulk (e.g. one GraphQL query per batch)"""
+
+    full_name: str = Field(..., description="Full repository name (org/repo)")
+    languages: dict[str, int] = Field(
+        default_factory=dict, description="Language breakdown (bytes)"
+    )
+    commit_stats: CommitStats | None = Field(
+        default=None, description="Commit statistics (None if left to the REST paths)"
+    )
+    paths_present: dict[str, bool] = Field(
+        default_factory=dict, description="Existence of probed files and directories"
+    )
+    file_contents: dict[str, str | None] = Field(
+        default_factory=dict, description="Text of fetched files (None if absent or binary)"
+    )
+    paths_probed: bool = Field(
+        default=True, description="Whether paths_present and file_contents were fetched"
+    )
+    head_sha: str | None = Field(
+        default=None, description="Commit SHA at the head of the default branch"
+    )
+
+    def exists(self, path: str) -> bool:
+        """Check whether a probed path (file or trailing-slash directory) exists"""
+        return self.paths_present.get(path, False)
+
+
 class ViabilityScore(BaseModel):
     """Repository viability assessment"""
 
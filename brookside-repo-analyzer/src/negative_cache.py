@@ -0,0 +1,202 @@
+"""
+Missing-Path Cache for Brookside BI Repository Analyzer
+
+Establishes a persistent negative cache of repository paths known to be absent,
+keyed by (repository, tree SHA, path), so files most repositories lack
+(.claude.json, package.json, agent definitions) are not re-probed with a 404
+round-trip until the repository's content changes.
+
+Best for: Repeated scans of mostly-unchanged organizations where missing-file
+probes dominate rate-limit spend.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Target false-positive rate of the per-repository filter (collisions are corrected exactly)
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings"""
+
+    def __init__(self, size_bits: int, hash_count: int, bits: bytes | None = None):
+        """
+        Initialize Bloom filter
+
+        Args:
+            size_bits: Number of bits
+            hash_count: Hash functions per item
+            bits: Existing bit array (from to_hex)
+        """
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bytearray(bits) if bits else bytearray((size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float) -> "BloomFilter":
+        """Size a filter for an expected item count and false-positive rate"""
+        capacity = max(1, capacity)
+        size_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        hash_count = max(1, round(size_bits / capacity * math.log(2)))
+        return cls(size_bits, hash_count)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size_bits for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self.bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p // 8] & (1 << (p % 8)) for p in self._positions(item))
+
+    def to_hex(self) -> str:
+        """Serialize the bit array"""
+        return self.bits.hex()
+
+
+class MissingPathCache:
+    """
+    Persistent per-repository record of absent paths
+
+    Paths in the common probe set are stored in a compact Bloom filter per
+    repository. Because the probe set is known, probe paths that collide with
+    the filter without being missing are kept as exceptions, so lookups never
+    report an existing path as missing. Other paths are stored exactly. A
+    repository's entry is discarded as soon as its tree SHA changes.
+    """
+
+    def __init__(self, cache_dir: Path, probe_paths: Iterable[str]):
+        """
+        Initialize missing-path cache
+
+        Args:
+            cache_dir: Root cache directory (data goes under cache_dir/negative)
+            probe_paths: Paths commonly probed in every repository
+
+        Example:
+            >>> cache = MissingPathCache(Path(".cache"), ["package.json", ".claude.json"])
+            >>> cache.record_missing("org/repo", tree_sha, "package.json")
+            >>> cache.is_missing("org/repo", tree_sha, "package.json")
+            True
+        """
+        self.path = Path(cache_dir) / "negative" / "missing_paths.json"
+        self.probe_paths = sorted(set(probe_paths))
+        self._probe_set = set(self.probe_paths)
+        self._fingerprint = hashlib.sha256("\n".join(self.probe_paths).encode()).hexdigest()[:16]
+        self._repos: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self._load()
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter.for_capacity(len(self.probe_paths), BLOOM_FALSE_POSITIVE_RATE)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        same_probes = data.get("probe_set") == self._fingerprint
+        for full_name, entry in data.get("repos", {}).items():
+            if not same_probes:
+                # Filters were built for another probe set; keep only exact paths
+                entry = {"tree": entry["tree"], "paths": entry.get("paths", [])}
+            self._repos[full_name] = entry
+
+    def _entry(self, full_name: str, tree_sha: str) -> dict[str, Any] | None:
+        entry = self._repos.get(full_name)
+        if entry is None or entry["tree"] != tree_sha:
+            return None
+        return entry
+
+    def _filter(self, entry: dict[str, Any]) -> BloomFilter | None:
+        if "bloom" not in entry:
+            return None
+        template = self._new_filter()
+        return BloomFilter(template.size_bits, template.hash_count, bytes.fromhex(entry["bloom"]))
+
+    def is_missing(self, full_name: str, tree_sha: str, path: str) -> bool:
+        """
+        Check whether a path is known to be absent at a tree SHA
+
+        Args:
+            full_name: Full repository name (org/repo)
+            tree_sha: Root tree SHA of the repository head
+            path: Repository path
+
+        Returns:
+            True only if the path was recorded missing at this tree SHA
+        """
+        entry = self._entry(full_name, tree_sha)
+        if entry is None:
+            return False
+
+        if path in self._probe_set:
+            bloom = self._filter(entry)
+            missing = bloom is not None and path in bloom and path not in entry["exceptions"]
+        else:
+            missing = path in entry["paths"]
+
+        if missing:
+            self.hits += 1
+        return missing
+
+    def record_missing(self, full_name: str, tree_sha: str, path: str) -> None:
+        """
+        Record that a path is absent at a tree SHA
+
+        Args:
+            full_name: Full repository name (org/repo)
+            tree_sha: Root tree SHA of the repository head
+            path: Repository path
+        """
+        entry = self._entry(full_name, tree_sha)
+        if entry is None:
+            entry = {"tree": tree_sha, "paths": []}
+            self._repos[full_name] = entry
+
+        if path not in self._probe_set:
+            if path not in entry["paths"]:
+                entry["paths"].append(path)
+                self._dirty = True
+            return
+
+        bloom = self._filter(entry) or self._new_filter()
+        exceptions = set(entry.get("exceptions", []))
+        missing = {p for p in self.probe_paths if p in bloom and p not in exceptions} | {path}
+
+        bloom.add(path)
+        entry["bloom"] = bloom.to_hex()
+        entry["exceptions"] = [p for p in self.probe_paths if p in bloom and p not in missing]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist changes (atomic replace)"""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"probe_set": self._fingerprint, "repos": self._repos}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save missing-path cache: {e}")
@@ -0,0 +1,141 @@
+"""
+Parse Result Cache for Brookside BI Repository Analyzer
+
+Establishes a bounded LRU of parsed file contents (agent frontmatter, MCP server
+lists) keyed by the file's Git blob SHA, optionally persisted to disk. Files
+vendored into many repositories are parsed once, and with a tree index the
+blob SHA is known before the file is downloaded, so cached files are not
+fetched at all.
+
+Best for: Portfolios where the same agent definitions and .claude.json blocks
+are copied across many repositories.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def blob_sha(content: str | bytes) -> str:
+    """
+    Compute the Git blob SHA of file content (as listed in Git trees)
+
+    Args:
+        content: File content (text is encoded as UTF-8)
+
+    Returns:
+        Hex SHA-1 of the Git blob object
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class ParseCache:
+    """
+    Least-recently-used map of (parser kind, blob SHA) to parse result
+
+    Results must be JSON-compatible and not None.
+
+    Example:
+        >>> cache = ParseCache(max_entries=4096)
+        >>> servers = cache.parse("claude_json", content, parse_claude_json)
+        >>> cache.get("claude_json", blob_sha(content))
+        ['github', 'notion']
+    """
+
+    def __init__(self, max_entries: int = 4096, path: Path | None = None):
+        """
+        Initialize parse cache
+
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+            path: JSON file loaded by load() and written by save() (None keeps it in memory)
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, sha: str) -> Any | None:
+        """Get a cached result (counted as a hit), or None if absent"""
+        key = f"{kind}:{sha}"
+        if key not in self._entries:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, kind: str, sha: str, value: Any) -> None:
+        """Store a result, evicting the least recently used beyond max_entries"""
+        key = f"{kind}:{sha}"
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def parse(
+        self,
+        kind: str,
+        content: str,
+        parser: Callable[[str], T],
+        sha: str | None = None,
+    ) -> T:
+        """
+        Parse content, reusing the result for identical content
+
+        Args:
+            kind: Parser name (results of different parsers never mix)
+            content: File content
+            parser: Function parsing the content
+            sha: Blob SHA of the content if already known (computed otherwise)
+
+        Returns:
+            Parse result
+        """
+        sha = sha or blob_sha(content)
+        cached = self.get(kind, sha)
+        if cached is not None:
+            return cached
+
+        self.misses += 1
+        value = parser(content)
+        self.put(kind, sha, value)
+        return value
+
+    def load(self) -> None:
+        """Load persisted results (missing or unreadable files are ignored)"""
+        if self.path is None:
+            return
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(entries, dict):
+            items = list(entries.items())
+            for key, value in items[max(0, len(items) - self.max_entries) :]:
+                self._entries[key] = value
+
+    def save(self) -> None:
+        """Persist results, least recently used first"""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to store parse cache: {e}")
@@ -0,0 +1,159 @@
+"""
+Analysis Pipeline for Brookside BI Repository Analyzer
+
+Establishes a small dataflow engine in which each analysis step declares the
+named inputs it needs. A run computes only the steps its targets depend on,
+computes each step once, and runs steps concurrently as soon as their inputs are
+ready, so data shared by several analyses (languages, commits, manifests) is
+fetched a single time per repository.
+
+Best for: Adding a new repository signal as one declared step instead of another
+round of per-analyzer API calls.
+"""
+
+import asyncio
+import inspect
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.exceptions import ConfigurationError
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    One named node of a pipeline
+
+    run is called with the values of requires as positional arguments, in order,
+    and may return a value or an awaitable.
+    """
+
+    name: str
+    run: Callable[..., Any]
+    requires: tuple[str, ...] = ()
+
+
+class Pipeline:
+    """
+    Dependency graph of steps resolved concurrently per run
+
+    Inputs are values supplied to every run (e.g. the repository); steps are
+    computed from inputs and other steps. The graph is validated on construction.
+
+    Example:
+        >>> pipeline = Pipeline(
+        ...     [
+        ...         Step("languages", client.get_repository_languages, ("repo",)),
+        ...         Step("primary", lambda languages: max(languages, key=languages.get), ("languages",)),
+        ...     ],
+        ...     inputs=["repo"],
+        ... )
+        >>> results = await pipeline.run(["primary"], repo=repo)
+    """
+
+    def __init__(self, steps: Iterable[Step], inputs: Iterable[str] = ()):
+        """
+        Initialize pipeline
+
+        Args:
+            steps: Pipeline steps (names must be unique)
+            inputs: Names supplied to each run rather than computed
+
+        Raises:
+            ConfigurationError: If names repeat, a step requires an unknown name,
+                or steps depend on each other in a cycle
+        """
+        self.inputs = frozenset(inputs)
+        self.steps: dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps or step.name in self.inputs:
+                raise ConfigurationError(f"Duplicate pipeline step: {step.name}")
+            self.steps[step.name] = step
+        self.plan(self.steps)
+
+    def extend(self, steps: Iterable[Step]) -> "Pipeline":
+        """Return a new pipeline with additional steps"""
+        return Pipeline([*self.steps.values(), *steps], self.inputs)
+
+    def plan(self, targets: Iterable[str]) -> list[str]:
+        """
+        List the steps needed for targets, dependencies first
+
+        Args:
+            targets: Step names to compute
+
+        Returns:
+            Step names in an order where every step follows its requirements
+
+        Raises:
+            ConfigurationError: If a name is unknown or the steps form a cycle
+        """
+        order: list[str] = []
+        visiting: set[str] = set()
+        planned: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in planned or name in self.inputs:
+                return
+            if name in visiting:
+                raise ConfigurationError(f"Pipeline steps form a cycle through: {name}")
+            if name not in self.steps:
+                raise ConfigurationError(f"Unknown pipeline step: {name}")
+
+            visiting.add(name)
+            for requirement in self.steps[name].requires:
+                visit(requirement)
+            visiting.discard(name)
+            planned.add(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    async def run(self, targets: Iterable[str], **inputs: Any) -> dict[str, Any]:
+        """
+        Compute targets and everything they depend on
+
+        Steps start as soon as their requirements resolve. If a step fails the
+        remaining steps are cancelled and its exception is raised.
+
+        Args:
+            targets: Step names to compute
+            **inputs: Value of every declared input
+
+        Returns:
+            Mapping of each input and computed step name to its value
+
+        Raises:
+            ConfigurationError: If a declared input is not supplied
+        """
+        missing = self.inputs - inputs.keys()
+        if missing:
+            raise ConfigurationError(f"Missing pipeline inputs: {', '.join(sorted(missing))}")
+
+        loop = asyncio.get_running_loop()
+        results: dict[str, asyncio.Future[Any]] = {}
+        for name, value in inputs.items():
+            results[name] = loop.create_future()
+            results[name].set_result(value)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for name in self.plan(targets):
+                    results[name] = group.create_task(_run_step(self.steps[name], results))
+        except ExceptionGroup as e:
+            # Surface the failing step itself rather than the task group wrapper
+            raise e.exceptions[0] from None
+
+        return {name: future.result() for name, future in results.items()}
+
+
+async def _run_step(step: Step, results: dict[str, asyncio.Future[Any]]) -> Any:
+    """Wait for a step's requirements, then run it"""
+    args = [await results[name] for name in step.requires]
+    value = step.run(*args)
+    if inspect.isawaitable(value):
+        value = await value
+    return value
@@ -0,0 +1,312 @@
+"""
+Adaptive Rate-Limit Scheduler for Brookside BI Repository Analyzer
+
+Establishes process-wide pacing of GitHub API requests so long multi-organization
+scans pause and resume around exhausted rate-limit windows instead of failing.
+
+Best for: Scans that issue thousands of requests against a single credential and
+must finish even when a primary or secondary rate limit is reached mid-run.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+
+from src.config import Settings
+from src.exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Safety margin added to reset timestamps to absorb clock skew with GitHub
+RESET_MARGIN_SECONDS = 1.0
+
+# Default pause when GitHub signals a secondary limit without Retry-After
+SECONDARY_LIMIT_DEFAULT_SECONDS = 60.0
+
+
+@dataclass
+class RateLimitWindow:
+    """Last observed state of one GitHub rate-limit resource (core, search, graphql)"""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None  # Unix epoch seconds
+
+
+def rate_limit_resource(endpoint: str) -> str:
+    """
+    Map an API endpoint to the GitHub rate-limit resource it is charged against
+
+    Args:
+        endpoint: API endpoint (with or without leading slash)
+
+    Returns:
+        Resource name as reported in the X-RateLimit-Resource header
+    """
+    path = endpoint.lstrip("/")
+    if path.startswith("search/code"):
+        return "code_search"
+    if path.startswith("search/"):
+        return "search"
+    if path.startswith("graphql"):
+        return "graphql"
+    return "core"
+
+
+class RateLimitScheduler:
+    """
+    Token-bucket request pacer driven by GitHub rate-limit headers
+
+    Every response feeds X-RateLimit-Remaining/Reset and Retry-After back into the
+    scheduler. Requests then wait for a token, for an exhausted window to reset,
+    or for a secondary-limit cooldown before being sent.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 10.0,
+        burst_size: int = 20,
+        max_wait_seconds: float = 3900.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """
+        Initialize rate-limit scheduler
+
+        Args:
+            requests_per_second: Sustained request rate when budget is plentiful
+            burst_size: Maximum number of requests released without pacing
+            max_wait_seconds: Longest pause tolerated before raising RateLimitError
+            clock: Wall-clock source in epoch seconds (injectable for tests)
+            sleep: Async sleep function (injectable for tests)
+
+        Example:
+            >>> scheduler = RateLimitScheduler(requests_per_second=5, burst_size=10)
+            >>> await scheduler.acquire("core")
+        """
+        self.requests_per_second = requests_per_second
+        self.burst_size = burst_size
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = float(burst_size)
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self.windows: dict[str, RateLimitWindow] = {}
+
+        self.requests_released = 0
+        self.pauses = 0
+        self.total_wait_seconds = 0.0
+
+    def _window(self, resource: str) -> RateLimitWindow:
+        if resource not in self.windows:
+            self.windows[resource] = RateLimitWindow()
+        return self.windows[resource]
+
+    def _effective_rate(self, window: RateLimitWindow, now: float) -> float:
+        """Slow down so the remaining budget lasts until the window resets"""
+        rate = self.requests_per_second
+        if window.remaining is not None and window.reset_at is not None:
+            seconds_left = window.reset_at - now
+            if seconds_left > 0 and window.remaining > 0:
+                rate = min(rate, window.remaining / seconds_left)
+        return rate
+
+    def _reserve(self, resource: str) -> float:
+        """
+        Reserve a request slot and return how long the caller must wait for it
+
+        Runs without awaiting, so concurrent callers on one event loop reserve
+        distinct slots without needing a lock.
+        """
+        now = self._clock()
+        window = self._window(resource)
+
+        wait = max(0.0, self._paused_until - now)
+
+        # Exhausted primary window: hold everything until it resets
+        if window.remaining is not None and window.remaining <= 0:
+            if window.reset_at is not None and window.reset_at > now:
+                wait = max(wait, window.reset_at - now + RESET_MARGIN_SECONDS)
+            else:
+                window.remaining = None
+
+        # Token bucket pacing, adapted to the remaining budget
+        rate = self._effective_rate(window, now)
+        self._tokens = min(
+            float(self.burst_size), self._tokens + (now - self._last_refill) * rate
+        )
+        self._last_refill = now
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            wait = max(wait, -self._tokens / rate)
+
+        if window.remaining is not None:
+            window.remaining -= 1
+
+        return wait
+
+    async def acquire(self, resource: str = "core") -> None:
+        """
+        Wait until a request against the given resource may be sent
+
+        Args:
+            resource: Rate-limit resource (see rate_limit_resource)
+
+        Raises:
+            RateLimitError: If the required pause exceeds max_wait_seconds
+        """
+        wait = self._reserve(resource)
+        if wait <= 0:
+            self.requests_released += 1
+            return
+
+        if wait > self.max_wait_seconds:
+            # Give the slot back; the caller is not going to use it
+            self._tokens += 1.0
+            raise RateLimitError(
+                f"GitHub API rate limit requires a {int(wait)}s pause "
+                f"(limit {int(self.max_wait_seconds)}s)",
+                retry_after=int(wait),
+            )
+
+        if wait >= 1.0:
+            logger.info(f"Rate limit pacing: pausing {wait:.1f}s before next {resource} request")
+        self.total_wait_seconds += wait
+        await self._sleep(wait)
+        self.requests_released += 1
+
+    def observe(
+        self, headers: Mapping[str, str], status_code: int, resource: str = "core"
+    ) -> float | None:
+        """
+        Record rate-limit headers from a response
+
+        Args:
+            headers: Response headers
+            status_code: Response HTTP status
+            resource: Resource the request was charged against (header value wins)
+
+        Returns:
+            Pause in seconds if the response was rejected by a rate limit and the
+            request should be retried, otherwise None
+        """
+        now = self._clock()
+        resource = headers.get("X-RateLimit-Resource", resource)
+        window = self._window(resource)
+
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+
+        if limit is not None and limit.isdigit():
+            window.limit = int(limit)
+        if reset is not None and reset.isdigit():
+            new_reset = float(reset)
+            if window.reset_at is None or new_reset != window.reset_at:
+                # A new window started; the server count is authoritative
+                window.remaining = None
+            window.reset_at = new_reset
+        if remaining is not None and remaining.isdigit():
+            observed = int(remaining)
+            # Responses can arrive out of order; keep the most pessimistic count
+            window.remaining = (
+                observed if window.remaining is None else min(window.remaining, observed)
+            )
+
+        if status_code not in (403, 429):
+            return None
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            pause = float(retry_after)
+        elif remaining == "0" and window.reset_at is not None:
+            pause = max(0.0, window.reset_at - now) + RESET_MARGIN_SECONDS
+        elif status_code == 429:
+            pause = SECONDARY_LIMIT_DEFAULT_SECONDS
+        else:
+            # Plain 403 (permissions, blocked repo) is not a rate limit
+            return None
+
+        self._paused_until = max(self._paused_until, now + pause)
+        self.pauses += 1
+        logger.warning(
+            f"GitHub {resource} rate limit reached, pausing scan for {pause:.0f}s"
+        )
+        return pause
+
+    def available(self, resource: str = "core") -> float:
+        """
+        Estimate requests this scheduler can release before its window resets
+
+        An unobserved or already-reset window counts as unlimited; a rate-limit
+        pause counts as empty.
+
+        Args:
+            resource: Rate-limit resource (see rate_limit_resource)
+
+        Returns:
+            Remaining request budget (math.inf if unknown)
+        """
+        now = self._clock()
+        if self._paused_until > now:
+            return 0.0
+        window = self.windows.get(resource)
+        if window is None or window.remaining is None:
+            return math.inf
+        if window.reset_at is not None and window.reset_at <= now:
+            return math.inf
+        return float(max(window.remaining, 0))
+
+    def ready_in(self, resource: str = "core") -> float:
+        """Seconds until a pause or exhausted window on this resource lifts"""
+        now = self._clock()
+        wait = max(0.0, self._paused_until - now)
+        window = self.windows.get(resource)
+        if (
+            window is not None
+            and window.remaining is not None
+            and window.remaining <= 0
+            and window.reset_at is not None
+        ):
+            wait = max(wait, window.reset_at - now)
+        return wait
+
+    @property
+    def stats(self) -> dict[str, float | int]:
+        """Scheduler counters for scan summaries"""
+        return {
+            "requests_released": self.requests_released,
+            "pauses": self.pauses,
+            "total_wait_seconds": round(self.total_wait_seconds, 1),
+        }
+
+
+_shared_schedulers: dict[str, RateLimitScheduler] = {}
+
+
+def get_rate_limiter(settings: Settings, key: str = "default") -> RateLimitScheduler:
+    """
+    Get the process-wide scheduler for a credential
+
+    All GitHubMCPClient instances in the process share one scheduler per key, so
+    parallel scans draw from the same budget.
+
+    Args:
+        settings: Application configuration
+        key: Scheduler identity (one per credential)
+
+    Returns:
+        Shared RateLimitScheduler
+    """
+    if key not in _shared_schedulers:
+        _shared_schedulers[key] = RateLimitScheduler(
+            requests_per_second=settings.github.requests_per_second,
+            burst_size=settings.github.burst_size,
+            max_wait_seconds=settings.github.max_rate_limit_wait_seconds,
+        )
+    return _shared_schedulers[key]
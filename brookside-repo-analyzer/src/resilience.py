@@ -0,0 +1,318 @@
+"""
+Request Resilience for Brookside BI Repository Analyzer
+
+Establishes retries with bounded, jittered exponential backoff, a retry budget
+that caps retries to a fraction of overall traffic, and per-endpoint-family
+circuit breakers that fail fast while GitHub is degraded.
+
+Best for: Keeping scan results accurate through transient GitHub 5xx responses
+and timeouts without amplifying load during an outage.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from src.config import Settings
+from src.exceptions import CircuitOpenError, GitHubAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Responses worth retrying: GitHub is overloaded or a proxy timed out
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Methods safe to repeat without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Group an API endpoint into the family used for circuit breaking
+
+    Repository sub-resources share a family across repositories, so a degraded
+    /commits backend does not trip the breaker for /contents.
+
+    Args:
+        endpoint: API endpoint (with or without leading slash)
+
+    Returns:
+        Family name such as "commits", "contents", "git" or "graphql"
+
+    Example:
+        >>> endpoint_family("/repos/brookside-bi/app/contents/package.json")
+        'contents'
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    if parts[0] == "repos":
+        return parts[3] if len(parts) > 3 else "repos"
+    return parts[0]
+
+
+def is_transient(error: GitHubAPIError) -> bool:
+    """
+    Check whether an API error reflects GitHub health rather than the request
+
+    Transport failures (no status code), 5xx gateway errors and open circuits are
+    transient; 4xx answers such as 404 are definitive.
+    """
+    if isinstance(error, CircuitOpenError):
+        return True
+    return error.status_code is None or error.status_code in RETRYABLE_STATUS_CODES
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of requests
+
+    Every request deposits `ratio` tokens and every retry spends one, so under a
+    broad outage retries add at most `ratio` extra load instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        """
+        Initialize retry budget
+
+        Args:
+            ratio: Retry tokens earned per request
+            min_tokens: Starting balance (allows retries before traffic builds up)
+            max_tokens: Balance cap
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(min_tokens, max_tokens)
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        """Deposit tokens for one request"""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry token if available"""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.exhausted += 1
+        return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one endpoint family
+
+    Closed: requests flow. Open: requests fail fast until reset_timeout elapses.
+    Half-open: one probe request is let through; success closes the circuit,
+    failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        family: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            family: Endpoint family name (for errors and logs)
+            failure_threshold: Consecutive transient failures that open the circuit
+            reset_timeout: Seconds to stay open before probing
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """
+        Admit a request or fail fast
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or its probe is in flight)
+        """
+        if self.state == self.CLOSED:
+            return
+
+        remaining = self._opened_at + self.reset_timeout - self._clock()
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+
+        raise CircuitOpenError(
+            f"GitHub {self.family} endpoints are failing; skipping request",
+            family=self.family,
+            retry_after=max(0.0, remaining),
+        )
+
+    def record_success(self) -> None:
+        """Record a healthy response (including definitive 4xx answers)"""
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for GitHub {self.family} endpoints closed")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """End a request without judging endpoint health (e.g. rate limited or cancelled)"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a transient failure"""
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Circuit for GitHub {self.family} endpoints opened after "
+                    f"{self._failures} consecutive failures"
+                )
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+
+class RetryPolicy:
+    """
+    Retry transient GitHub failures with jittered backoff behind circuit breakers
+
+    Only idempotent calls are retried, retries are drawn from a shared budget,
+    and each endpoint family has its own breaker.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        budget: RetryBudget | None = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff ceiling for the first retry (seconds)
+            max_delay: Upper bound of any single backoff (seconds)
+            budget: Retry budget (default: 20% of requests)
+            failure_threshold: Consecutive failures that open a family's circuit
+            reset_timeout: Seconds a circuit stays open before probing
+            sleep: Async sleep (injectable for tests)
+            rng: Uniform [0, 1) source for jitter (injectable for tests)
+            clock: Monotonic time source for circuit breakers
+
+        Example:
+            >>> policy = RetryPolicy.from_settings(settings)
+            >>> data = await policy.call("commits", lambda: fetch_commits())
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._sleep = sleep
+        self._rng = rng
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.retries = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RetryPolicy":
+        """Build a policy from GitHub settings"""
+        github = settings.github
+        return cls(
+            max_retries=github.max_retries,
+            base_delay=github.retry_base_delay_seconds,
+            max_delay=github.retry_max_delay_seconds,
+            budget=RetryBudget(ratio=github.retry_budget_ratio),
+            failure_threshold=github.circuit_failure_threshold,
+            reset_timeout=github.circuit_reset_seconds,
+        )
+
+    def breaker(self, family: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for an endpoint family"""
+        if family not in self._breakers:
+            self._breakers[family] = CircuitBreaker(
+                family, self.failure_threshold, self.reset_timeout, clock=self._clock
+            )
+        return self._breakers[family]
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (0-based)"""
+        return self._rng() * min(self.max_delay, self.base_delay * 2**attempt)
+
+    async def call(
+        self, family: str, fn: Callable[[], Awaitable[T]], idempotent: bool = True
+    ) -> T:
+        """
+        Run a request with circuit breaking and retries
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+            fn: Zero-argument coroutine factory performing one attempt
+            idempotent: Whether the request may be repeated safely
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            CircuitOpenError: If the family's circuit is open
+            GitHubAPIError: Definitive errors immediately; transient ones once retries run out
+        """
+        breaker = self.breaker(family)
+        self.budget.record_request()
+
+        attempt = 0
+        while True:
+            breaker.before_request()
+            try:
+                result = await fn()
+            except GitHubAPIError as e:
+                if not is_transient(e):
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if (
+                    not idempotent
+                    or attempt == self.max_retries
+                    or breaker.state == CircuitBreaker.OPEN
+                    or not self.budget.try_spend()
+                ):
+                    raise
+                delay = self.backoff(attempt)
+                logger.info(
+                    f"Transient GitHub {family} failure ({e.message}); "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                self.retries += 1
+                attempt += 1
+                await self._sleep(delay)
+            except BaseException:
+                # Rate limits, cancellation, etc. say nothing about endpoint health
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
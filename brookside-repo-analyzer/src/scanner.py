@@ -0,0 +1,261 @@
+"""
+Streaming Repository Scanner for Brookside BI Repository Analyzer
+
+Establishes a producer/consumer scan loop that starts analyzing repositories as
+soon as listing pages arrive, instead of collecting every repository up front,
+with a bounded worker pool and pluggable ordering of queued repositories.
+
+Best for: Multi-organization scans where listing latency should overlap analysis
+and memory should stay flat regardless of how many repositories are listed.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.analyzers.claude_detector import ClaudeCapabilitiesDetector
+from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.analyzers.triage import RepositoryTriage
+from src.exceptions import GitHubAPIError, StatisticsPendingError
+from src.models import RepoAnalysis, Repository, RepoSignals
+
+logger = logging.getLogger(__name__)
+
+# Sort keys for queued repositories (smaller first); None keeps listing order
+SCAN_ORDERS: dict[str, Callable[[Repository], Any] | None] = {
+    "listing": None,
+    "recently_pushed": lambda repo: -repo.pushed_at.timestamp() if repo.pushed_at else 0.0,
+    "largest": lambda repo: -repo.size_kb,
+}
+
+# Queue item: (is_sentinel, sort key, position, repository, signals)
+_QueueItem = tuple[int, Any, int, Repository | None, RepoSignals | None]
+
+
+@dataclass
+class ScanResult:
+    """Outcome of a repository scan"""
+
+    analyses: list[RepoAnalysis] = field(default_factory=list)
+    failures: dict[str, str] = field(default_factory=dict)  # full_name -> error
+    skipped: dict[str, str] = field(default_factory=dict)  # full_name -> triage reasons
+
+    @property
+    def scanned(self) -> int:
+        """Number of repositories attempted (excludes those held back by triage)"""
+        return len(self.analyses) + len(self.failures)
+
+
+class RepositoryScanner:
+    """
+    Stream repositories from a listing into analysis workers
+
+    A producer drains the repository stream, holds back repositories that fail
+    triage (when configured), prefetches GraphQL signals one batch at a time,
+    and feeds a bounded priority queue; a pool of workers
+    analyzes queued repositories in the configured order, and one repository's
+    failure never stops the others. Analyses are returned in listing order. Repositories whose
+    commit statistics GitHub was still computing are re-scored in a final pass.
+    """
+
+    def __init__(
+        self,
+        analyzer: RepositoryAnalyzer,
+        claude_detector: ClaudeCapabilitiesDetector | None = None,
+        deep_analysis: bool = True,
+        workers: int | None = None,
+        order: str | Callable[[Repository], Any] | None = None,
+        triage: RepositoryTriage | None = None,
+    ):
+        """
+        Initialize repository scanner
+
+        Args:
+            analyzer: Repository analyzer
+            claude_detector: Claude detector (None skips Claude detection)
+            deep_analysis: Run deep analysis for each repository
+            workers: Repositories analyzed concurrently (default: max_concurrent_analyses)
+            order: Name in SCAN_ORDERS or a sort key function (default: scan_order
+                setting); applies to repositories already listed and waiting
+            triage: Metadata triage deciding which repositories are analyzed
+                (None analyzes every repository)
+
+        Example:
+            >>> scanner = RepositoryScanner(analyzer, claude_detector)
+            >>> result = await scanner.scan(client.iter_organization_repos())
+            >>> print(f"Analyzed {len(result.analyses)} repositories")
+        """
+        self.analyzer = analyzer
+        self.claude_detector = claude_detector
+        self.deep_analysis = deep_analysis
+        self.triage = triage
+        settings = analyzer.github_client.settings
+        self.workers = max(1, workers or settings.analysis.max_concurrent_analyses)
+        order = order or settings.analysis.scan_order
+        self.order_key = SCAN_ORDERS[order] if isinstance(order, str) else order
+        self.prefetch_batch_size = settings.github.graphql_batch_size
+
+    async def scan(
+        self,
+        repos: AsyncIterable[Repository],
+        on_start: Callable[[int, Repository], None] | None = None,
+    ) -> ScanResult:
+        """
+        Analyze every repository yielded by a stream
+
+        Args:
+            repos: Repository stream (e.g. GitHubMCPClient.iter_organization_repos)
+            on_start: Called with the 1-based position and repository before analysis
+
+        Returns:
+            ScanResult with analyses in stream order, failures by repository, and
+            repositories held back by triage
+
+        Raises:
+            GitHubAPIError: If listing repositories fails
+        """
+        # Bounded so a fast listing cannot run arbitrarily far ahead of analysis
+        queue: asyncio.PriorityQueue[_QueueItem] = asyncio.PriorityQueue(
+            maxsize=self.prefetch_batch_size + self.workers
+        )
+        result = ScanResult()
+        completed: list[tuple[int, RepoAnalysis]] = []
+
+        async def produce() -> None:
+            position = 0
+            batch: list[Repository] = []
+            async for repo in repos:
+                if self.triage:
+                    triaged = self.triage.assess(repo)
+                    if not triaged.promoted:
+                        result.skipped[repo.full_name] = "; ".join(triaged.reasons)
+                        continue
+                batch.append(repo)
+                if len(batch) >= self.prefetch_batch_size:
+                    position = await self._enqueue(queue, batch, position)
+                    batch = []
+            if batch:
+                await self._enqueue(queue, batch, position)
+
+            # A listing failure skips this; the task group cancels the workers instead.
+            # Sentinels sort after every repository still queued.
+            for _ in range(self.workers):
+                await queue.put((1, 0, 0, None, None))
+
+        async def work() -> None:
+            while (item := await queue.get())[3] is not None:
+                _, _, position, repo, signals = item
+                if on_start:
+                    on_start(position + 1, repo)
+                try:
+                    completed.append((position, await self.analyze(repo, signals)))
+                except Exception as e:
+                    logger.error(f"Failed to analyze {repo.name}: {str(e)}")
+                    result.failures[repo.full_name] = str(e)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(self.workers):
+                    group.create_task(work())
+        except ExceptionGroup as e:
+            # Surface the listing error itself rather than the task group wrapper
+            raise e.exceptions[0] from None
+
+        result.analyses = [analysis for _, analysis in sorted(completed, key=lambda c: c[0])]
+        if result.skipped:
+            logger.info(f"Triage held back {len(result.skipped)} repositories from analysis")
+        if self.claude_detector and self.claude_detector.skipped:
+            logger.info(
+                f"Code search ruled out Claude configuration in "
+                f"{self.claude_detector.skipped} repositories"
+            )
+        await self.revisit_deferred(result.analyses)
+        return result
+
+    async def revisit_deferred(self, analyses: list[RepoAnalysis]) -> int:
+        """
+        Re-score analyses built from provisional commit counts
+
+        GitHub answers 202 while it computes repository statistics; by the end of
+        the scan most are ready. Pending repositories are polled for a few rounds
+        and keep their provisional counts if statistics never arrive.
+
+        Args:
+            analyses: Completed analyses (updated in place)
+
+        Returns:
+            Number of analyses re-scored
+        """
+        client = self.analyzer.github_client
+        github = client.settings.github
+        pending = {
+            analysis.repository.full_name: analysis
+            for analysis in analyses
+            if analysis.repository.full_name in client.deferred_stats
+        }
+        rescored = 0
+
+        async def revisit(full_name: str, analysis: RepoAnalysis) -> None:
+            nonlocal rescored
+            try:
+                stats = await client.get_commit_statistics(analysis.repository)
+            except StatisticsPendingError:
+                return
+            except GitHubAPIError as e:
+                logger.warning(
+                    f"Commit statistics for {analysis.repository.name} failed: {e.message}"
+                )
+            else:
+                self.analyzer.apply_commit_stats(analysis, stats)
+                rescored += 1
+            pending.pop(full_name)
+            client.deferred_stats.pop(full_name, None)
+
+        for _ in range(github.stats_poll_rounds):
+            if not pending:
+                break
+            await asyncio.sleep(github.stats_poll_interval_seconds)
+            await asyncio.gather(*(revisit(name, a) for name, a in list(pending.items())))
+
+        if rescored:
+            logger.info(f"Re-scored {rescored} repositories with deferred commit statistics")
+        if pending:
+            logger.info(
+                f"Commit statistics still pending for {len(pending)} repositories; "
+                "kept provisional counts"
+            )
+        return rescored
+
+    async def analyze(self, repo: Repository, signals: RepoSignals | None = None) -> RepoAnalysis:
+        """
+        Analyze one repository, including Claude detection when configured
+
+        Args:
+            repo: Repository to analyze
+            signals: Prefetched signals (None falls back to REST)
+
+        Returns:
+            Complete repository analysis
+        """
+        # Claude detection runs as a step of the same analysis pipeline
+        steps = [self.claude_detector.pipeline_step()] if self.claude_detector else []
+        return await self.analyzer.analyze_repository(
+            repo, deep_analysis=self.deep_analysis, signals=signals, steps=steps
+        )
+
+    async def _enqueue(
+        self,
+        queue: asyncio.PriorityQueue[_QueueItem],
+        batch: list[Repository],
+        position: int,
+    ) -> int:
+        """Prefetch signals for a batch and queue its repositories, returning the next position"""
+        signals = await self.analyzer.prefetch_signals(batch)
+        for repo in batch:
+            key = self.order_key(repo) if self.order_key else 0
+            await queue.put((0, key, position, repo, signals.get(repo.full_name)))
+            position += 1
+        return position
@@ -0,0 +1,144 @@
+"""
+Request Coalescing for Brookside BI Repository Analyzer
+
+Establishes a singleflight layer: concurrent calls for the same key share one
+underlying call, and completed results are remembered for the rest of the scan,
+so repeated probes (CI indicators checked twice, overlapping manifest and Claude
+configuration reads) cost a single GitHub request.
+
+Best for: Scans where several analyzers ask the GitHub client for the same data.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Failure:
+    """Remembered exception for a key"""
+
+    error: Exception
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesce identical calls and memoize their outcomes
+
+    Results are kept in a bounded LRU; exceptions are only remembered when
+    remember_error accepts them (e.g. a definitive 404), so transient failures
+    are retried by the next caller.
+    """
+
+    def __init__(
+        self,
+        memo_size: int = 1024,
+        remember_error: Callable[[Exception], bool] | None = None,
+    ):
+        """
+        Initialize singleflight group
+
+        Args:
+            memo_size: Completed outcomes kept (0 disables memoization)
+            remember_error: Predicate selecting exceptions to remember
+
+        Example:
+            >>> flight = SingleFlight(memo_size=512)
+            >>> data = await flight.do(("GET", url), lambda: fetch(url))
+        """
+        self.memo_size = memo_size
+        self.remember_error = remember_error or (lambda error: False)
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+        self._memo: OrderedDict[Hashable, T | _Failure] = OrderedDict()
+        self.calls = 0
+        self.coalesced = 0
+        self.memoized = 0
+
+    @property
+    def hits(self) -> int:
+        """Calls answered without running the underlying function"""
+        return self.coalesced + self.memoized
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Call, coalesced and memoized counts"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "memoized": self.memoized,
+            "hits": self.hits,
+        }
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for key, sharing its outcome with concurrent and later callers
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine factory performing the call
+
+        Returns:
+            Result of fn (possibly from an earlier or concurrent call)
+
+        Raises:
+            Exception: Whatever fn raised (shared with concurrent callers)
+        """
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            self.memoized += 1
+            outcome = self._memo[key]
+            if isinstance(outcome, _Failure):
+                raise outcome.error
+            return outcome
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leading caller was cancelled, not us: run the call ourselves
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.do(key, fn)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.calls += 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            if self.remember_error(e):
+                self._remember(key, _Failure(e))
+            raise
+        else:
+            future.set_result(result)
+            self._remember(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop a remembered outcome"""
+        self._memo.pop(key, None)
+
+    def _remember(self, key: Hashable, outcome: T | _Failure) -> None:
+        if self.memo_size <= 0:
+            return
+        self._memo[key] = outcome
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
@@ -0,0 +1,184 @@
+"""
+Repository Snapshot Store for Brookside BI Repository Analyzer
+
+Establishes an opt-in deep-analysis mode that downloads each repository's tarball
+once and extracts it locally, so analyzers read files from disk instead of issuing
+one rate-limited contents request per file.
+
+Best for: Deep scans that inspect many files per repository (manifests, Claude
+configuration, source) where per-file API calls dominate cost.
+"""
+
+import asyncio
+import io
+import logging
+import shutil
+import tarfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+
+class RepositorySnapshot:
+    """
+    Extracted copy of one repository's default branch
+
+    Paths use "/" separators relative to the repository root; a trailing slash
+    requires the path to be a directory.
+    """
+
+    def __init__(self, full_name: str, root: Path):
+        """
+        Initialize snapshot view
+
+        Args:
+            full_name: Full repository name (org/repo)
+            root: Directory containing the extracted repository
+        """
+        self.full_name = full_name
+        self.root = root
+
+    def _resolve(self, path: str) -> Path | None:
+        """Resolve a repository path, refusing anything outside the snapshot"""
+        candidate = (self.root / path.strip("/")).resolve()
+        root = self.root.resolve()
+        if candidate != root and root not in candidate.parents:
+            return None
+        return candidate
+
+    def exists(self, path: str) -> bool:
+        """Check whether a file or directory exists in the snapshot"""
+        resolved = self._resolve(path)
+        if resolved is None:
+            return False
+        if path.endswith("/"):
+            return resolved.is_dir()
+        return resolved.exists()
+
+    def read_bytes(self, path: str) -> bytes | None:
+        """Read a file, or None if it does not exist"""
+        resolved = self._resolve(path)
+        if resolved is None or not resolved.is_file():
+            return None
+        return resolved.read_bytes()
+
+    def read_text(self, path: str) -> str | None:
+        """Read a UTF-8 text file, or None if missing or not valid UTF-8"""
+        data = self.read_bytes(path)
+        if data is None:
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def list_dir(self, path: str, recursive: bool = False) -> list[str]:
+        """List children of a directory (nested entries too if recursive) as repository paths"""
+        resolved = self._resolve(path)
+        if resolved is None or not resolved.is_dir():
+            return []
+        prefix = path.strip("/")
+        children = resolved.rglob("*") if recursive else resolved.iterdir()
+        return sorted(
+            f"{prefix}/{child.relative_to(resolved).as_posix()}"
+            if prefix
+            else child.relative_to(resolved).as_posix()
+            for child in children
+        )
+
+    def remove(self) -> None:
+        """Delete the extracted files"""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class AsyncChunkReader(io.RawIOBase):
+    """
+    Blocking, read-only file object over an async byte stream
+
+    Meant to be read from a worker thread: each read pulls the next chunk from
+    the stream on the event loop, so a download can be consumed by synchronous
+    code (such as tarfile) as it arrives, without buffering it whole.
+
+    Example:
+        >>> reader = AsyncChunkReader(response.aiter_bytes(), asyncio.get_running_loop())
+        >>> await asyncio.to_thread(extract_tarball, io.BufferedReader(reader), destination)
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop):
+        """
+        Initialize reader
+
+        Args:
+            chunks: Async byte stream (e.g. httpx Response.aiter_bytes())
+            loop: Event loop the stream belongs to
+        """
+        super().__init__()
+        self._chunks = chunks
+        self._loop = loop
+        self._pending = memoryview(b"")
+        self._exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        while not self._pending:
+            if self._exhausted:
+                return 0
+            try:
+                chunk = asyncio.run_coroutine_threadsafe(
+                    self._chunks.__anext__(), self._loop
+                ).result()
+            except StopAsyncIteration:
+                self._exhausted = True
+                return 0
+            self._pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def extract_tarball(source: Path | BinaryIO, destination: Path) -> None:
+    """
+    Stream-extract a GitHub repository tarball
+
+    GitHub wraps the repository in a single "<owner>-<repo>-<sha>/" directory,
+    which is stripped. Members are filtered with tarfile's "data" filter, so
+    absolute paths, links escaping the destination and device files are rejected.
+
+    Args:
+        source: Downloaded .tar.gz file, or a readable stream of one (read
+            sequentially, e.g. an AsyncChunkReader over the download)
+        destination: Directory to extract into (created if missing)
+
+    Raises:
+        tarfile.TarError: If the archive is malformed
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+
+    def strip_top_level(member: tarfile.TarInfo, path: str) -> tarfile.TarInfo | None:
+        _, _, relative = member.name.partition("/")
+        if not relative:
+            return None
+        changes = {"name": relative}
+        if member.islnk():
+            # Hard link targets are archive paths and carry the same prefix
+            changes["linkname"] = member.linkname.partition("/")[2]
+        return tarfile.data_filter(member.replace(**changes, deep=False), path)
+
+    # "r|gz" reads the archive sequentially without seeking
+    if isinstance(source, Path):
+        archive = tarfile.open(source, mode="r|gz")
+    else:
+        archive = tarfile.open(fileobj=source, mode="r|gz")
+    with archive:
+        archive.extractall(destination, filter=strip_top_level)
+
+
+def snapshots_supported() -> bool:
+    """Check whether this Python provides safe tar extraction filters (3.11.4+)"""
+    return hasattr(tarfile, "data_filter")
@@ -0,0 +1,177 @@
+"""
+Repository Tree Index for Brookside BI Repository Analyzer
+
+Establishes an in-memory index of every path in a repository, loaded from a single
+recursive Git Trees API call, so file and directory checks are answered locally
+instead of one round-trip per probe.
+
+Best for: Analyses that check many indicator paths per repository (tests, CI,
+Claude configuration) without spending rate-limit budget on each check.
+"""
+
+import json
+import logging
+import os
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """Single blob or tree in a repository tree"""
+
+    path: str
+    type: str  # "blob", "tree" or "commit" (submodule)
+    sha: str
+    size: int | None = None
+
+
+class RepoTreeIndex:
+    """
+    Sorted path array with prefix search over one repository tree
+
+    Paths use "/" separators without a leading slash. Directory queries may be
+    written with or without a trailing slash.
+    """
+
+    def __init__(self, tree_sha: str, entries: list[TreeEntry], truncated: bool = False):
+        """
+        Initialize tree index
+
+        Args:
+            tree_sha: SHA of the root tree
+            entries: Tree entries (any order)
+            truncated: Whether GitHub truncated the recursive listing
+
+        Example:
+            >>> index = RepoTreeIndex.from_api(payload)
+            >>> index.exists("tests/")
+            True
+        """
+        self.tree_sha = tree_sha
+        self.truncated = truncated
+        self._entries = {entry.path: entry for entry in entries}
+        self._paths = sorted(self._entries)
+
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "RepoTreeIndex":
+        """Build index from a GET /git/trees/{sha}?recursive=1 response"""
+        entries = [
+            TreeEntry(
+                path=item["path"],
+                type=item["type"],
+                sha=item["sha"],
+                size=item.get("size"),
+            )
+            for item in payload.get("tree", [])
+        ]
+        return cls(payload["sha"], entries, truncated=payload.get("truncated", False))
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def get(self, path: str) -> TreeEntry | None:
+        """Get the entry for an exact path"""
+        return self._entries.get(path.strip("/"))
+
+    def exists(self, path: str) -> bool:
+        """
+        Check whether a path exists
+
+        A trailing slash requires the path to be a directory.
+        """
+        entry = self.get(path)
+        if entry is None:
+            return False
+        if path.endswith("/"):
+            return entry.type == "tree"
+        return True
+
+    def is_dir(self, path: str) -> bool:
+        """Check whether a path is a directory"""
+        entry = self.get(path)
+        return entry is not None and entry.type == "tree"
+
+    def list_dir(self, path: str, recursive: bool = False) -> list[TreeEntry]:
+        """
+        List entries under a directory
+
+        Args:
+            path: Directory path ("" for repository root)
+            recursive: Include nested entries, not only direct children
+
+        Returns:
+            Entries sorted by path
+        """
+        prefix = f"{path.strip('/')}/" if path.strip("/") else ""
+        start = bisect_left(self._paths, prefix)
+        children: list[TreeEntry] = []
+
+        for candidate in self._paths[start:]:
+            if not candidate.startswith(prefix):
+                break
+            if recursive or "/" not in candidate[len(prefix) :]:
+                children.append(self._entries[candidate])
+
+        return children
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a compact JSON-compatible structure"""
+        return {
+            "sha": self.tree_sha,
+            "truncated": self.truncated,
+            "entries": [
+                [entry.path, entry.type, entry.sha, entry.size]
+                for entry in self._entries.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RepoTreeIndex":
+        """Deserialize from to_dict output"""
+        entries = [TreeEntry(path, kind, sha, size) for path, kind, sha, size in data["entries"]]
+        return cls(data["sha"], entries, truncated=data.get("truncated", False))
+
+
+class TreeIndexStore:
+    """
+    On-disk store of tree indexes keyed by tree SHA
+
+    Tree SHAs are content hashes, so a stored index never goes stale; unchanged
+    repositories reuse it across runs without downloading the tree again.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize tree index store
+
+        Args:
+            cache_dir: Root cache directory (indexes go under cache_dir/trees)
+        """
+        self.root = Path(cache_dir) / "trees"
+
+    def _path(self, tree_sha: str) -> Path:
+        return self.root / tree_sha[:2] / f"{tree_sha}.json"
+
+    def get(self, tree_sha: str) -> RepoTreeIndex | None:
+        """Load a stored index, or None if absent or unreadable"""
+        try:
+            data = json.loads(self._path(tree_sha).read_text(encoding="utf-8"))
+            return RepoTreeIndex.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, index: RepoTreeIndex) -> None:
+        """Persist an index"""
+        path = self._path(index.tree_sha)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to store tree index {index.tree_sha}: {e}")
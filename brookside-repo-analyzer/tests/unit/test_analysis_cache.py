@@ -0,0 +1,125 @@
+"""
+Unit Tests for the Analysis Result Cache
+
+Validates round-tripping analyses keyed by head SHA and analyzer version, the
+hit/miss/invalidation counters, and reuse of cached analyses by the analyzer
+with refreshed commit activity.
+
+Best for: Ensuring unchanged repositories are not re-analyzed from scratch.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.analysis_cache import AnalysisCache
+from src.analyzers.repo_analyzer import ANALYZER_VERSION, RepositoryAnalyzer
+from src.config import Settings
+from src.models import CommitStats
+
+
+class TestAnalysisCache:
+    """Test the on-disk analysis store"""
+
+    def test_round_trip_and_counters(self, tmp_path, sample_repo_analysis):
+        cache = AnalysisCache(tmp_path)
+        full_name = sample_repo_analysis.repository.full_name
+
+        assert cache.get(full_name, "abc", "1") is None
+        cache.put(sample_repo_analysis, "abc", "1")
+
+        assert cache.get(full_name, "abc", "1") == sample_repo_analysis
+        assert cache.get(full_name, "def", "1") is None
+        assert cache.get(full_name, "abc", "2") is None
+        assert (cache.hits, cache.misses, cache.invalidations) == (1, 3, 2)
+
+
+class TestAnalyzerReuse:
+    """Test RepositoryAnalyzer.analyze_repository with an analysis cache"""
+
+    def make_client(self, tmp_path, head_sha: str) -> Mock:
+        client = Mock()
+        client.settings = Settings()
+        client.analysis_cache = AnalysisCache(tmp_path)
+        client.get_head_sha = AsyncMock(return_value=head_sha)
+        client.get_repository_languages = AsyncMock(return_value={"Python": 100})
+        client.get_commit_activity = AsyncMock(return_value=CommitStats(commits_last_30_days=8))
+        client.get_repository_dependencies = AsyncMock(return_value=[])
+        client.check_file_exists = AsyncMock(return_value=True)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repository_reused(self, tmp_path, sample_repository):
+        repo = sample_repository.model_copy(
+            update={"pushed_at": datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+        await RepositoryAnalyzer(self.make_client(tmp_path, "abc")).analyze_repository(
+            repo, deep_analysis=False
+        )
+
+        client = self.make_client(tmp_path, "abc")
+        client.get_commit_activity.return_value = CommitStats(commits_last_30_days=0)
+        analysis = await RepositoryAnalyzer(client).analyze_repository(repo, deep_analysis=False)
+
+        client.get_repository_languages.assert_not_called()
+        client.get_repository_dependencies.assert_not_called()
+        client.check_file_exists.assert_not_called()
+        assert analysis.languages == {"Python": 100}
+        assert analysis.has_tests
+        assert analysis.commit_stats.commits_last_30_days == 0
+        assert client.analysis_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_new_head_reanalyzed(self, tmp_path, sample_repository):
+        repo = sample_repository.model_copy(
+            update={"pushed_at": datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+        await RepositoryAnalyzer(self.make_client(tmp_path, "abc")).analyze_repository(
+            repo, deep_analysis=False
+        )
+
+        client = self.make_client(tmp_path, "def")
+        await RepositoryAnalyzer(client).analyze_repository(repo, deep_analysis=False)
+
+        client.get_repository_languages.assert_called_once()
+        assert client.analysis_cache.invalidations == 1
+        assert client.analysis_cache.get(repo.full_name, "def", ANALYZER_VERSION) is not None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_probes_for_cached_heads(self, tmp_path, sample_repository):
+        unchanged = sample_repository.model_copy(
+            update={"pushed_at": datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+        changed = unchanged.model_copy(update={"name": "other", "full_name": "test-org/other"})
+        await RepositoryAnalyzer(self.make_client(tmp_path, "abc")).analyze_repository(
+            unchanged, deep_analysis=False
+        )
+
+        queries: list[tuple[str, dict]] = []
+
+        async def graphql(query: str, variables: dict) -> dict:
+            queries.append((query, variables))
+            names = [value for key, value in variables.items() if key.startswith("n")]
+            head = {"defaultBranchRef": {"target": {"oid": "abc"}}}
+            if "...RepoSignals" in query:
+                return {f"r{index}": head for index, _ in enumerate(names)}
+            return {f"r{index}": {"e0": {"__typename": "Blob"}} for index, _ in enumerate(names)}
+
+        client = self.make_client(tmp_path, "abc")
+        client.graphql = graphql
+        analyzer = RepositoryAnalyzer(client)
+        signals = await analyzer.prefetch_signals([unchanged, changed])
+
+        assert len(queries) == 2
+        assert "since90" not in queries[1][1]
+        assert [v for k, v in queries[1][1].items() if k.startswith("n")] == ["other"]
+        assert not signals[unchanged.full_name].paths_probed
+        assert signals[changed.full_name].paths_probed
+        assert signals[unchanged.full_name].head_sha == "abc"
+
+        await analyzer.analyze_repository(
+            unchanged, deep_analysis=False, signals=signals[unchanged.full_name]
+        )
+        client.get_head_sha.assert_not_called()
+        assert client.analysis_cache.hits == 1
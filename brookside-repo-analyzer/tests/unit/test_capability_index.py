@@ -0,0 +1,127 @@
+"""
+Unit Tests for the Claude Capability Index
+
+Validates bitset postings with incremental updates and position reuse, set
+algebra queries, widespread capabilities, shared command sets, and persistence.
+
+Best for: Ensuring portfolio capability questions are answered without rescanning.
+"""
+
+from src.analyzers.capability_index import CapabilityIndex
+from src.bitset_index import BitsetIndex
+from src.models import ClaudeConfig
+
+
+def config(agents=(), commands=(), mcp_servers=()) -> ClaudeConfig:
+    return ClaudeConfig(agents=list(agents), commands=list(commands), mcp_servers=list(mcp_servers))
+
+
+def build_index() -> CapabilityIndex:
+    index = CapabilityIndex()
+    index.update("org/app", config(["cost-analyst"], ["deploy", "test"], ["notion", "github"]))
+    index.update("org/api", config(["cost-analyst"], ["deploy", "test"], ["github"]))
+    index.update("org/web", config(["reviewer"], ["deploy"], ["notion"]))
+    index.update("org/docs", config())
+    return index
+
+
+class TestBitsetIndex:
+    """Test term postings"""
+
+    def test_update_replaces_terms_incrementally(self):
+        index = BitsetIndex()
+        index.update("org/app", ["a", "b"])
+        index.update("org/api", ["b"])
+
+        index.update("org/app", ["b", "c"])
+
+        assert index.decode(index.bits("a")) == set()
+        assert "a" not in set(index.terms())
+        assert index.decode(index.bits("b")) == {"org/app", "org/api"}
+        assert index.count("c") == 1
+
+    def test_removed_positions_are_reused(self):
+        index = BitsetIndex()
+        index.update("org/app", ["a"])
+        index.update("org/api", ["a"])
+        index.remove("org/app")
+        index.update("org/web", ["b"])
+
+        assert len(index) == 2
+        assert index.bits("b") == 0b01
+        assert index.decode(index.bits("a")) == {"org/api"}
+        assert index.decode(index.all_bits) == {"org/api", "org/web"}
+
+
+class TestCapabilityIndex:
+    """Test capability queries"""
+
+    def test_repositories_with(self):
+        index = build_index()
+
+        assert index.repositories_with("mcp_server", "notion") == {"org/app", "org/web"}
+        assert index.repositories_with("agent", "missing") == set()
+
+    def test_query_set_algebra(self):
+        index = build_index()
+
+        assert index.query(
+            all_of=[("command", "deploy")], none_of=[("mcp_server", "notion")]
+        ) == {"org/api"}
+        assert index.query(any_of=[("agent", "reviewer"), ("mcp_server", "github")]) == {
+            "org/app",
+            "org/api",
+            "org/web",
+        }
+        assert index.query(none_of=[("command", "deploy")]) == {"org/docs"}
+
+    def test_common(self):
+        index = build_index()
+
+        assert index.common("command") == {"deploy": 3, "test": 2}
+        assert index.common("agent", min_repositories=3) == {}
+
+    def test_shared_sets(self):
+        index = build_index()
+
+        assert index.shared_sets("command") == [
+            (frozenset({"deploy", "test"}), {"org/app", "org/api"})
+        ]
+
+    def test_update_changes_one_repository(self):
+        index = build_index()
+
+        index.update("org/api", config(["reviewer"], ["deploy"], ["notion"]))
+
+        assert index.repositories_with("agent", "cost-analyst") == {"org/app"}
+        assert index.repositories_with("mcp_server", "notion") == {"org/app", "org/api", "org/web"}
+        assert index.shared_sets("command") == [(frozenset({"deploy"}), {"org/api", "org/web"})]
+
+    def test_from_analyses(self, sample_repo_analysis):
+        index = CapabilityIndex.from_analyses(
+            [sample_repo_analysis, sample_repo_analysis.model_copy(update={"claude_config": None})]
+        )
+
+        name = sample_repo_analysis.repository.full_name
+        assert len(index) == 1
+        for server in sample_repo_analysis.claude_config.mcp_servers:
+            assert index.repositories_with("mcp_server", server) == {name}
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "capabilities.json"
+        index = build_index()
+
+        index.save(path)
+        loaded = CapabilityIndex.load(path)
+
+        assert len(loaded) == 4
+        assert loaded.to_dict() == index.to_dict()
+        assert loaded.query(all_of=[("agent", "cost-analyst"), ("mcp_server", "notion")]) == {
+            "org/app"
+        }
+
+    def test_load_unreadable_file_is_empty(self, tmp_path):
+        path = tmp_path / "capabilities.json"
+        path.write_text("not json", encoding="utf-8")
+
+        assert len(CapabilityIndex.load(path)) == 0
@@ -0,0 +1,193 @@
+"""
+Unit Tests for Claude Configuration Discovery
+
+Validates that agents and slash commands are discovered from directory listings
+(any name, not a fixed list), answered from the shared tree index when
+available and from one contents call per directory otherwise, and that an
+org-wide code search sweep rules out repositories without any hits.
+
+Best for: Ensuring Claude detection is complete and costs a handful of requests.
+"""
+
+import httpx
+import pytest
+
+from src.analyzers.claude_detector import ClaudeCapabilitiesDetector
+from src.config import Settings
+from src.exceptions import RateLimitError
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+
+TREE_PAYLOAD = {
+    "sha": "tree123",
+    "truncated": False,
+    "tree": [
+        {"path": "CLAUDE.md", "type": "blob", "sha": "b0", "size": 10},
+        {"path": ".claude", "type": "tree", "sha": "t1"},
+        {"path": ".claude/agents", "type": "tree", "sha": "t2"},
+        {"path": ".claude/agents/cost-analyst.md", "type": "blob", "sha": "b1", "size": 10},
+        {"path": ".claude/agents/release-captain.md", "type": "blob", "sha": "b2", "size": 10},
+        {"path": ".claude/agents/notes.txt", "type": "blob", "sha": "b3", "size": 10},
+        {"path": ".claude/commands", "type": "tree", "sha": "t3"},
+        {"path": ".claude/commands/ship-it.md", "type": "blob", "sha": "b4", "size": 10},
+        {"path": ".claude/commands/README.md", "type": "blob", "sha": "b5", "size": 10},
+        {"path": ".claude/commands/innovation", "type": "tree", "sha": "t4"},
+        {"path": ".claude/commands/innovation/new-idea.md", "type": "blob", "sha": "b6"},
+        {"path": ".claude/agents/README.md", "type": "blob", "sha": "b7", "size": 10},
+    ],
+}
+
+
+def make_client(
+    mock_credentials, handler, tree_index: bool = True, sweep: bool = False
+) -> GitHubMCPClient:
+    settings = Settings()
+    settings.analysis.tree_index_enabled = tree_index
+    settings.analysis.claude_search_sweep_enabled = sweep
+    client = GitHubMCPClient(
+        settings, mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestClaudeDiscovery:
+    """Test ClaudeCapabilitiesDetector.detect_claude_capabilities"""
+
+    @pytest.mark.asyncio
+    async def test_discovered_from_tree_index(self, mock_credentials, sample_repository):
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path.endswith("/branches/main"):
+                return httpx.Response(
+                    200, json={"commit": {"sha": "h1", "commit": {"tree": {"sha": "tree123"}}}}
+                )
+            if request.url.path.endswith("/git/trees/tree123"):
+                return httpx.Response(200, json=TREE_PAYLOAD)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = make_client(mock_credentials, handler)
+
+        config = await ClaudeCapabilitiesDetector(client).detect_claude_capabilities(
+            sample_repository
+        )
+
+        assert config.agents == ["cost-analyst", "release-captain"]
+        assert config.commands == ["innovation:new-idea", "ship-it"]
+        assert config.has_claude_md and config.has_claude_dir
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_directory_listing_without_tree(self, mock_credentials, sample_repository):
+        requests: list[str] = []
+        listings = {
+            "/repos/test-org/sample-repo/contents/.claude/agents": [
+                {"path": ".claude/agents/triage-bot.md", "name": "triage-bot.md", "type": "file"}
+            ],
+            "/repos/test-org/sample-repo/contents/.claude/commands": [
+                {"path": ".claude/commands/readme.md", "name": "readme.md", "type": "file"},
+                {"path": ".claude/commands/ops", "name": "ops", "type": "dir"},
+            ],
+            "/repos/test-org/sample-repo/contents/.claude/commands/ops": [
+                {"path": ".claude/commands/ops/deploy.md", "name": "deploy.md", "type": "file"}
+            ],
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path in listings:
+                return httpx.Response(200, json=listings[request.url.path])
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = make_client(mock_credentials, handler, tree_index=False)
+
+        config = await ClaudeCapabilitiesDetector(client).detect_claude_capabilities(
+            sample_repository
+        )
+
+        assert config.agents == ["triage-bot"]
+        assert config.commands == ["ops:deploy"]
+        assert not config.has_claude_md
+        assert len(requests) == 5
+
+
+def search_result(full_names: list[str], incomplete: bool = False) -> dict:
+    return {
+        "total_count": len(full_names),
+        "incomplete_results": incomplete,
+        "items": [{"repository": {"full_name": name}} for name in full_names],
+    }
+
+
+class TestCodeSearchSweep:
+    """Test the org-wide code search sweep"""
+
+    @pytest.mark.asyncio
+    async def test_repository_without_hits_skipped(self, mock_credentials, sample_repository):
+        requests: list[str] = []
+        queries: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path == "/search/code":
+                queries.append(request.url.params["q"])
+                if "CLAUDE.md" in request.url.params["q"]:
+                    return httpx.Response(200, json=search_result(["test-org/other-repo"]))
+                return httpx.Response(200, json=search_result([]))
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        detector = ClaudeCapabilitiesDetector(make_client(mock_credentials, handler, sweep=True))
+        other = sample_repository.model_copy(
+            update={"name": "other-repo", "full_name": "test-org/other-repo"}
+        )
+
+        config = await detector.detect_claude_capabilities(sample_repository)
+        await detector.detect_claude_capabilities(other)
+
+        assert config.agents == [] and not config.has_claude_md
+        assert len(queries) == 4
+        assert all(q.startswith("org:test-org ") for q in queries)
+        assert detector.skipped == 1
+        assert any(path.startswith("/repos/test-org/other-repo") for path in requests)
+        assert not any(path.startswith("/repos/test-org/sample-repo") for path in requests)
+
+    @pytest.mark.asyncio
+    async def test_incomplete_sweep_inspects_every_repository(
+        self, mock_credentials, sample_repository
+    ):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/search/code":
+                return httpx.Response(200, json=search_result([], incomplete=True))
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        detector = ClaudeCapabilitiesDetector(make_client(mock_credentials, handler, sweep=True))
+
+        assert await detector.sweep_organization("test-org") is None
+        await detector.detect_claude_capabilities(sample_repository)
+        assert detector.skipped == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_sweep_inspects_every_repository(
+        self, mock_credentials, sample_repository
+    ):
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        async def exhausted(query: str) -> set[str] | None:
+            raise RateLimitError("Secondary rate limit exceeded", retry_after=60)
+
+        client = make_client(mock_credentials, handler, sweep=True)
+        client.search_code_repositories = exhausted
+        detector = ClaudeCapabilitiesDetector(client)
+
+        assert await detector.sweep_organization("test-org") is None
+        config = await detector.detect_claude_capabilities(sample_repository)
+
+        assert config is not None
+        assert detector.skipped == 0
+        assert any(path.startswith("/repos/test-org/sample-repo") for path in requests)
@@ -0,0 +1,183 @@
+"""
+Unit Tests for the Commit Ledger
+
+Validates rolling window statistics, persistence, incremental syncing from the
+recorded head SHA, relisting after rewritten history, skipping unchanged
+repositories, and recovery from a listing cut off by the page limit.
+
+Best for: Ensuring daily activity analysis stays cheap and accurate.
+"""
+
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.commit_ledger import CommitLedger, CommitLedgerEntry
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+
+DAY = 86400
+
+
+def listed_commit(sha: str, email: str, committed_at: float) -> dict:
+    date = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(committed_at))
+    return {
+        "sha": sha,
+        "commit": {"author": {"email": email, "date": date}, "committer": {"date": date}},
+    }
+
+
+class TestCommitLedgerEntry:
+    """Test rolling statistics and serialization"""
+
+    def test_rolling_windows(self):
+        now = 1_700_000_000.0
+        entry = CommitLedgerEntry(covered_since=now - 90 * DAY)
+        entry.add("a", now - 1 * DAY, "dev1@x.com")
+        entry.add("b", now - 45 * DAY, "dev2@x.com")
+        entry.add("c", now - 100 * DAY, "dev3@x.com")
+
+        stats = entry.stats(days=90, now=now)
+
+        assert stats.commits_last_30_days == 1
+        assert stats.commits_last_90_days == 2
+        assert stats.unique_contributors == 2
+        assert not entry.add("a", now, "dev1@x.com")
+
+    def test_store_round_trip(self, tmp_path):
+        ledger = CommitLedger(tmp_path)
+        entry = CommitLedgerEntry(covered_since=1.0, synced_at=2.0, head="a")
+        entry.add("a", 5.0, "dev@x.com")
+
+        ledger.put("org/app", entry)
+
+        assert ledger.get("org/app") == entry
+        assert ledger.get("org/other") is None
+
+
+class TestIncrementalListing:
+    """Test GitHubMCPClient commit listing through the ledger"""
+
+    def make_client(self, mock_credentials, tmp_path, handler) -> GitHubMCPClient:
+        settings = Settings()
+        settings.github.stats_endpoints_enabled = False
+        settings.analysis.cache_dir = tmp_path
+        client = GitHubMCPClient(
+            settings, mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.commit_ledger = CommitLedger(tmp_path)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_second_run_compares_from_recorded_head(
+        self, mock_credentials, tmp_path, sample_repository
+    ):
+        now = time.time()
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if "/compare/" in request.url.path:
+                return httpx.Response(
+                    200,
+                    json={
+                        "status": "ahead",
+                        "total_commits": 2,
+                        "commits": [
+                            # Merged branch commit with an old committer date
+                            listed_commit("m", "dev4@x.com", now - 60 * DAY),
+                            listed_commit("c", "dev3@x.com", now - 1 * DAY),
+                        ],
+                    },
+                )
+            return httpx.Response(
+                200,
+                json=[
+                    listed_commit("b", "dev2@x.com", now - 2 * DAY),
+                    listed_commit("a", "dev1@x.com", now - 40 * DAY),
+                ],
+            )
+
+        def pushed_now():
+            return sample_repository.model_copy(update={"pushed_at": datetime.now(timezone.utc)})
+
+        first_client = self.make_client(mock_credentials, tmp_path, handler)
+        first = await first_client.get_commit_activity(pushed_now())
+        second_client = self.make_client(mock_credentials, tmp_path, handler)
+        second = await second_client.get_commit_activity(pushed_now())
+
+        assert first.commits_last_90_days == 2
+        assert second.commits_last_90_days == 4
+        assert second.commits_last_30_days == 2
+        assert requests[1] == "/repos/test-org/sample-repo/compare/b...main"
+        assert second_client.commit_ledger.get(sample_repository.full_name).head == "c"
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_relisted(self, mock_credentials, tmp_path, sample_repository):
+        now = time.time()
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if "/compare/" in request.url.path:
+                return httpx.Response(200, json={"status": "diverged", "commits": []})
+            if len(requests) == 1:
+                return httpx.Response(200, json=[listed_commit("a", "dev1@x.com", now - DAY)])
+            return httpx.Response(200, json=[listed_commit("a2", "dev1@x.com", now - DAY)])
+
+        def pushed_now():
+            return sample_repository.model_copy(update={"pushed_at": datetime.now(timezone.utc)})
+
+        await self.make_client(mock_credentials, tmp_path, handler).get_commit_activity(
+            pushed_now()
+        )
+        client = self.make_client(mock_credentials, tmp_path, handler)
+        stats = await client.get_commit_activity(pushed_now())
+
+        assert "/compare/a...main" in requests[1]
+        assert requests[2].endswith("/commits")
+        assert stats.commits_last_90_days == 1
+        assert client.commit_ledger.get(sample_repository.full_name).head == "a2"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repository_not_listed(
+        self, mock_credentials, tmp_path, sample_repository
+    ):
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, json=[listed_commit("a", "dev@x.com", time.time() - DAY)])
+
+        repo = sample_repository.model_copy(
+            update={"pushed_at": datetime.fromtimestamp(time.time() - DAY, timezone.utc)}
+        )
+
+        await self.make_client(mock_credentials, tmp_path, handler).get_commit_activity(repo)
+        client = self.make_client(mock_credentials, tmp_path, handler)
+        stats = await client.get_commit_activity(repo)
+
+        assert len(requests) == 1
+        assert stats.commits_last_30_days == 1
+        assert client.commit_ledger.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_listing_marks_partial_coverage(
+        self, mock_credentials, tmp_path, sample_repository
+    ):
+        now = time.time()
+        page = [listed_commit(f"c{i}", "dev@x.com", now - DAY - i) for i in range(100)]
+        client = self.make_client(
+            mock_credentials, tmp_path, lambda request: httpx.Response(200, json=page)
+        )
+        client.settings.github.max_commit_pages = 1
+
+        await client.get_commit_activity(sample_repository)
+
+        entry = client.commit_ledger.get(sample_repository.full_name)
+        assert entry.covered_since == pytest.approx(now - DAY - 99, abs=1)
+        assert not entry.covers(now - 90 * DAY)
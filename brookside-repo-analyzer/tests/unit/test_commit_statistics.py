@@ -0,0 +1,206 @@
+"""
+Unit Tests for Commit Statistics
+
+Validates commit counts built from GitHub's precomputed statistics, deferral of
+repositories whose statistics are still being computed (202 Accepted), the
+streamed commit-listing fallback, and re-scoring deferred repositories at the
+end of a scan.
+
+Best for: Ensuring activity scores count every commit in busy repositories.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.config import Settings
+from src.exceptions import StatisticsPendingError
+from src.github_mcp_client import GitHubMCPClient, commit_stats_from_statistics
+from src.rate_limiter import RateLimitScheduler
+from src.scanner import RepositoryScanner
+
+DAY = 86400
+
+
+def make_client(mock_credentials, handler) -> GitHubMCPClient:
+    client = GitHubMCPClient(
+        Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def listed_commit(sha: str, email: str, days_ago: float) -> dict:
+    date = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - days_ago * DAY))
+    return {
+        "sha": sha,
+        "commit": {"author": {"email": email, "date": date}, "committer": {"date": date}},
+    }
+
+
+def statistics(now: float) -> tuple[list, list]:
+    """One commit per day for the last 120 days, split across two authors"""
+    start = now - 120 * DAY
+    commit_activity = [
+        {
+            "week": start + week * 7 * DAY,
+            "days": [int(start + (week * 7 + day) * DAY < now) for day in range(7)],
+        }
+        for week in range(18)
+    ]
+    contributors = [
+        {"total": 500, "weeks": [{"w": now - 10 * DAY, "c": 3}]},
+        {"total": 20, "weeks": [{"w": now - 200 * DAY, "c": 5}]},  # Inactive in window
+    ]
+    return commit_activity, contributors
+
+
+class TestCommitStatsFromStatistics:
+    """Test statistics payload conversion"""
+
+    def test_counts_days_inside_window(self):
+        now = 1_700_000_000.0
+        commit_activity, contributors = statistics(now)
+
+        stats = commit_stats_from_statistics(commit_activity, contributors, days=90, now=now)
+
+        assert stats.commits_last_90_days == 90
+        assert stats.commits_last_30_days == 30
+        assert stats.unique_contributors == 1
+        assert stats.total_commits == stats.commits_last_90_days
+
+    def test_empty_repository(self):
+        stats = commit_stats_from_statistics({}, {}, days=90, now=time.time())
+
+        assert stats.commits_last_90_days == 0
+        assert stats.total_commits == 0
+
+
+class TestClientCommitActivity:
+    """Test GitHubMCPClient.get_commit_activity"""
+
+    @pytest.mark.asyncio
+    async def test_uses_statistics_endpoints(self, mock_credentials, sample_repository):
+        commit_activity, contributors = statistics(time.time())
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/stats/commit_activity"):
+                return httpx.Response(200, json=commit_activity)
+            return httpx.Response(200, json=contributors)
+
+        client = make_client(mock_credentials, handler)
+
+        stats = await client.get_commit_activity(sample_repository)
+
+        assert stats.commits_last_90_days in (89, 90, 91)
+        assert not any(path.endswith("/commits") for path in paths)
+
+    @pytest.mark.asyncio
+    async def test_pending_statistics_deferred_with_streamed_fallback(
+        self, mock_credentials, sample_repository
+    ):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "/stats/" in request.url.path:
+                return httpx.Response(202, json={})
+            return httpx.Response(
+                200, json=[listed_commit("c1", "a@x.com", 1), listed_commit("c2", "b@x.com", 40)]
+            )
+
+        client = make_client(mock_credentials, handler)
+
+        stats = await client.get_commit_activity(sample_repository)
+
+        assert stats.commits_last_90_days == 2
+        assert stats.commits_last_30_days == 1
+        assert stats.unique_contributors == 2
+        assert client.deferred_stats == {sample_repository.full_name: sample_repository}
+
+    @pytest.mark.asyncio
+    async def test_pending_answer_not_remembered(self, mock_credentials, sample_repository):
+        responses = [httpx.Response(202, json={}), httpx.Response(200, json=[])]
+        client = make_client(mock_credentials, lambda request: responses.pop(0))
+
+        endpoint = "/repos/test-org/sample-repo/stats/commit_activity"
+
+        with pytest.raises(StatisticsPendingError):
+            await client._request("GET", endpoint)
+
+        assert await client._request("GET", endpoint) == []
+
+    @pytest.mark.asyncio
+    async def test_empty_repository_no_content(self, mock_credentials, sample_repository):
+        client = make_client(mock_credentials, lambda request: httpx.Response(204))
+
+        stats = await client.get_commit_activity(sample_repository)
+
+        assert stats.commits_last_90_days == 0
+        assert client.deferred_stats == {}
+
+
+class TestPrefetchedScan:
+    """Test commit statistics for repositories with GraphQL-prefetched signals"""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_scan_reads_statistics_endpoints(
+        self, mock_credentials, sample_repository
+    ):
+        commit_activity, contributors = statistics(time.time())
+        queries: list[str] = []
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/graphql":
+                queries.append(json.loads(request.content)["query"])
+                target = {"oid": "abc"}
+                return httpx.Response(
+                    200, json={"data": {"r0": {"defaultBranchRef": {"target": target}}}}
+                )
+            if request.url.path.endswith("/stats/commit_activity"):
+                return httpx.Response(200, json=commit_activity)
+            if request.url.path.endswith("/stats/contributors"):
+                return httpx.Response(200, json=contributors)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = make_client(mock_credentials, handler)
+        client.analysis_cache = None
+        analyzer = RepositoryAnalyzer(client)
+
+        signals = await analyzer.prefetch_signals([sample_repository])
+        analysis = await analyzer.analyze_repository(
+            sample_repository, deep_analysis=False, signals=signals[sample_repository.full_name]
+        )
+
+        assert "history90" not in queries[0]
+        assert signals[sample_repository.full_name].commit_stats is None
+        assert any(path.endswith("/stats/commit_activity") for path in paths)
+        assert analysis.commit_stats.commits_last_90_days in (89, 90, 91)
+        assert analysis.commit_stats.total_commits == analysis.commit_stats.commits_last_90_days
+
+
+class TestScannerRevisit:
+    """Test re-scoring deferred repositories at the end of a scan"""
+
+    @pytest.mark.asyncio
+    async def test_deferred_repository_rescored(self, sample_repository):
+        analyzer = Mock()
+        analyzer.github_client.settings = Settings()
+        analyzer.github_client.settings.github.stats_poll_interval_seconds = 0
+        analyzer.github_client.deferred_stats = {sample_repository.full_name: sample_repository}
+        accurate = Mock()
+        analyzer.github_client.get_commit_statistics = AsyncMock(
+            side_effect=[StatisticsPendingError("computing"), accurate]
+        )
+        analysis = Mock(repository=sample_repository)
+
+        rescored = await RepositoryScanner(analyzer).revisit_deferred([analysis])
+
+        assert rescored == 1
+        analyzer.apply_commit_stats.assert_called_once_with(analysis, accurate)
+        assert analyzer.github_client.deferred_stats == {}
@@ -0,0 +1,51 @@
+"""
+Unit Tests for GitHub HTTP Client Construction
+
+Validates that pool limits, split timeouts and HTTP/2 come from AnalysisSettings,
+and that a missing h2 package falls back to HTTP/1.1.
+
+Best for: Ensuring connection tuning is configurable without code changes.
+"""
+
+import pytest
+
+from src import github_mcp_client
+from src.config import Settings
+from src.github_mcp_client import build_http_client
+
+
+class TestBuildHttpClient:
+    """Test httpx client configuration"""
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_limits_from_settings(self):
+        settings = Settings()
+        settings.analysis.connect_timeout_seconds = 3.0
+        settings.analysis.read_timeout_seconds = 45.0
+        settings.analysis.max_connections = 7
+
+        client = build_http_client(settings, headers={"Accept": "application/json"})
+
+        assert client.timeout.connect == 3.0
+        assert client.timeout.read == 45.0
+        assert client._transport._pool._max_connections == 7
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(github_mcp_client, "http2_available", lambda: False)
+
+        client = build_http_client(Settings(), headers={})
+
+        assert not client._transport._pool._http2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_disabled_by_setting(self):
+        settings = Settings()
+        settings.analysis.http2_enabled = False
+
+        client = build_http_client(settings, headers={})
+
+        assert not client._transport._pool._http2
+        await client.aclose()
@@ -0,0 +1,318 @@
+"""
+Unit Tests for the GitHub Credential Pool
+
+Validates budget-aware credential selection, GitHub App installation token
+minting and refresh, pool construction from settings, and that a rate-limited
+request moves to another credential instead of pausing the scan.
+
+Best for: Ensuring pooled credentials add up to more throughput per scan.
+"""
+
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.config import Settings
+from src.credential_pool import (
+    AppInstallationCredential,
+    CredentialPool,
+    GitHubCredential,
+    TokenCredential,
+    endpoint_owner,
+)
+from src.github_mcp_client import GitHubMCPClient
+from src.http_cache import ConditionalRequestCache
+from src.rate_limiter import RateLimitScheduler
+
+
+def token_credential(token: str) -> TokenCredential:
+    return TokenCredential(Settings(), token, rate_limiter=RateLimitScheduler(burst_size=100))
+
+
+def report_remaining(credential: TokenCredential, remaining: int, reset_in: float = 3600) -> None:
+    credential.rate_limiter.observe(
+        {
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+        },
+        200,
+    )
+
+
+def installation(installation_id: int, account: str | None, private_key=None):
+    """Installation credential holding a valid token (no minting needed)"""
+    pem = (
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        if private_key
+        else ""
+    )
+    credential = AppInstallationCredential(
+        Settings(),
+        "123",
+        pem,
+        installation_id,
+        rate_limiter=RateLimitScheduler(burst_size=100),
+        account=account,
+    )
+    credential._token = f"ghs_{installation_id}"
+    credential._expires_at = time.time() + 3600
+    return credential
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class TestSelection:
+    """Test routing by remaining budget"""
+
+    def test_prefers_most_remaining_budget(self):
+        low, high = token_credential("ghp_low"), token_credential("ghp_high")
+        report_remaining(low, 10)
+        report_remaining(high, 4000)
+
+        assert CredentialPool([low, high]).select() is high
+
+    def test_unknown_budgets_used_in_turn(self):
+        first, second = token_credential("ghp_a"), token_credential("ghp_b")
+        pool = CredentialPool([first, second])
+
+        assert [pool.select(), pool.select(), pool.select()] == [first, second, first]
+
+    def test_exhausted_pool_waits_for_soonest_reset(self):
+        late, soon = token_credential("ghp_late"), token_credential("ghp_soon")
+        report_remaining(late, 0, reset_in=1800)
+        report_remaining(soon, 0, reset_in=60)
+
+        assert CredentialPool([late, soon]).select() is soon
+
+    def test_budget_is_per_resource(self):
+        first, second = token_credential("ghp_a"), token_credential("ghp_b")
+        report_remaining(first, 0)
+        report_remaining(second, 100)
+
+        pool = CredentialPool([first, second])
+
+        assert pool.select("core") is second
+        assert first.rate_limiter.available("graphql") == float("inf")
+
+
+class TestOwnerAccess:
+    """Test routing by the accounts each credential can access"""
+
+    def test_endpoint_owner(self):
+        assert endpoint_owner("/repos/Org-A/app/languages") == "Org-A"
+        assert endpoint_owner("orgs/org-b/repos") == "org-b"
+        assert endpoint_owner("/users/someone/repos") == "someone"
+        assert endpoint_owner("/graphql") is None
+        assert endpoint_owner("/rate_limit") is None
+
+    def test_mixed_installations_routed_by_owner(self):
+        org_a, org_b = installation(1, "org-a"), installation(2, "Org-B")
+        pat = token_credential("ghp_pat")
+        report_remaining(org_a, 4000)
+        report_remaining(org_b, 10)
+        report_remaining(pat, 5)
+        pool = CredentialPool([pat, org_a, org_b])
+
+        assert pool.select(owner="org-b") is org_b
+        assert pool.select(owner="ORG-A") is org_a
+        assert pool.select(owner="org-c") is pat
+        assert pool.select("graphql") is pat
+
+    def test_unmatched_owner_falls_back_to_any_credential(self):
+        org_a = installation(1, "org-a")
+
+        assert CredentialPool([org_a]).select(owner="org-c") is org_a
+
+    @pytest.mark.asyncio
+    async def test_installation_accounts_resolved_once(self, private_key):
+        looked_up: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            looked_up.append(request.url.path)
+            installation_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"account": {"login": f"org-{installation_id}"}})
+
+        first, second = installation(1, None, private_key), installation(2, None, private_key)
+        pool = CredentialPool([first, second])
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await pool.resolve_accounts(client, "https://api.github.com")
+        await pool.resolve_accounts(client, "https://api.github.com")
+
+        assert sorted(looked_up) == ["/app/installations/1", "/app/installations/2"]
+        assert pool.select(owner="org-2") is second
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_sends_each_owner_to_its_installation(self, mock_credentials):
+        org_a, org_b = installation(1, "org-a"), installation(2, "org-b")
+        seen: list[tuple[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.url.path.split("/")[2], request.headers["Authorization"]))
+            return httpx.Response(200, json={"Python": 1})
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, credential_pool=CredentialPool([org_a, org_b])
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        report_remaining(org_a, 4000)
+        report_remaining(org_b, 10)
+        await client._request("GET", "/repos/org-a/app/languages")
+        await client._request("GET", "/repos/org-b/api/languages")
+
+        assert seen == [("org-a", "Bearer ghs_1"), ("org-b", "Bearer ghs_2")]
+
+
+class TestAppInstallationCredential:
+    """Test installation token minting"""
+
+    @pytest.mark.asyncio
+    async def test_mints_and_refreshes_installation_token(self, private_key):
+        now = {"t": 1_700_000_000.0}
+        minted: list[dict] = []
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            app_jwt = request.headers["Authorization"].removeprefix("Bearer ")
+            minted.append(
+                jwt.decode(
+                    app_jwt,
+                    private_key.public_key(),
+                    algorithms=["RS256"],
+                    options={"verify_exp": False, "verify_iat": False},
+                )
+            )
+            assert request.url.path == "/app/installations/42/access_tokens"
+            return httpx.Response(
+                201,
+                json={
+                    "token": f"ghs_{len(minted)}",
+                    "expires_at": time.strftime(
+                        "%Y-%m-%dT%H:%M:%SZ", time.gmtime(now["t"] + 3600)
+                    ),
+                },
+            )
+
+        credential = AppInstallationCredential(
+            Settings(), "123", pem, 42, refresh_margin=300, clock=lambda: now["t"]
+        )
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await credential.authorization(client, "https://api.github.com") == "Bearer ghs_1"
+        assert await credential.authorization(client, "https://api.github.com") == "Bearer ghs_1"
+        assert minted[0]["iss"] == "123"
+
+        now["t"] += 3600 - 299  # Inside the refresh margin
+        assert await credential.authorization(client, "https://api.github.com") == "Bearer ghs_2"
+        assert credential.refreshes == 2
+        await client.aclose()
+
+
+class TestCredentialInterface:
+    """Test the GitHubCredential contract"""
+
+    def test_incomplete_subclass_fails_on_instantiation(self):
+        class NamedOnly(GitHubCredential):
+            @property
+            def identity(self) -> str:
+                return "named"
+
+        with pytest.raises(TypeError):
+            NamedOnly(Settings())
+
+
+class TestPoolConstruction:
+    """Test CredentialPool.from_settings"""
+
+    def test_includes_additional_tokens(self, mock_credentials):
+        settings = Settings()
+        settings.github.additional_tokens = ["ghp_extra"]
+
+        pool = CredentialPool.from_settings(settings, mock_credentials)
+
+        assert [c.token for c in pool.credentials] == ["ghp_test_token_12345", "ghp_extra"]
+
+    def test_includes_app_installations(self, mock_credentials):
+        settings = Settings()
+        settings.github.app_id = "123"
+        settings.github.app_installation_ids = [1, 2]
+
+        pool = CredentialPool.from_settings(settings, mock_credentials)
+
+        assert [c.identity for c in pool.credentials[1:]] == ["app:123:1", "app:123:2"]
+
+
+class TestClientRouting:
+    """Test GitHubMCPClient spreads requests across the pool"""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_moves_to_other_credential(self, mock_credentials):
+        primary, spare = token_credential("ghp_primary"), token_credential("ghp_spare")
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            if request.headers["Authorization"] == "Bearer ghp_primary":
+                return httpx.Response(
+                    403,
+                    headers={
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": str(int(time.time() + 3600)),
+                    },
+                    json={"message": "API rate limit exceeded"},
+                )
+            return httpx.Response(200, json={"Python": 1})
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, credential_pool=CredentialPool([primary, spare])
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        data = await client._request("GET", "/repos/org/app/languages")
+
+        assert data == {"Python": 1}
+        assert seen == ["Bearer ghp_primary", "Bearer ghp_spare"]
+        assert spare.rate_limiter.total_wait_seconds == 0
+
+    @pytest.mark.asyncio
+    async def test_http_cache_keyed_by_sending_credential(self, tmp_path, mock_credentials):
+        primary, spare = token_credential("ghp_primary"), token_credential("ghp_spare")
+        seen: list[tuple[str, str | None]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.headers["Authorization"], request.headers.get("If-None-Match")))
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"Python": 1})
+
+        settings = Settings()
+        settings.github.request_memo_size = 0
+        client = GitHubMCPClient(
+            settings, mock_credentials, credential_pool=CredentialPool([primary, spare])
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.http_cache = ConditionalRequestCache(tmp_path, ttl_hours=1)
+
+        report_remaining(primary, 100)
+        report_remaining(spare, 50)
+        await client._request("GET", "/repos/org/app/languages")
+        report_remaining(primary, 10)
+        await client._request("GET", "/repos/org/app/languages")
+
+        # The spare token never saw the primary token's ETag
+        assert seen == [("Bearer ghp_primary", None), ("Bearer ghp_spare", None)]
@@ -0,0 +1,129 @@
+"""
+Unit Tests for the Dependency Index
+
+Validates normalized exact lookups, token-indexed substring rules, shared
+dependencies, and pattern extraction driven by the index.
+
+Best for: Ensuring pattern mining queries one index instead of rescanning
+every dependency per rule.
+"""
+
+from src.analyzers.dependency_index import DependencyIndex
+from src.analyzers.pattern_miner import PatternMiner
+from src.models import Dependency
+
+
+def build_index() -> DependencyIndex:
+    return DependencyIndex(
+        [
+            ("ingest", ["Azure-Functions", "httpx", "pytest", "pytest-cov"]),
+            ("portal", ["express", "express-validator", "eventemitter3"]),
+            ("reporter", ["azure-functions-worker", "FastAPI", "httpx"]),
+            ("docs", []),
+            ("webhooks", ["httpx", "aws-lambda-powertools", "github"]),
+        ]
+    )
+
+
+class TestDependencyIndex:
+    """Test index queries"""
+
+    def test_exact_is_normalized(self):
+        index = build_index()
+
+        assert index.repositories(index.exact("AZURE-FUNCTIONS")) == ["ingest"]
+        assert index.repositories(index.exact("github", "octokit")) == ["webhooks"]
+        assert index.exact("missing") == 0
+
+    def test_containing_matches_substrings(self):
+        index = build_index()
+
+        assert index.repositories(index.containing("azure-functions")) == ["ingest", "reporter"]
+        assert index.repositories(index.containing("event")) == ["portal"]
+        assert index.repositories(index.containing("functions", "aws-lambda")) == [
+            "ingest",
+            "reporter",
+            "webhooks",
+        ]
+        assert index.containing("flask") == 0
+
+    def test_repeated_matches_count_once(self):
+        index = build_index()
+
+        assert index.repositories(index.containing("pytest")) == ["ingest"]
+        assert index.repositories(index.containing("express")) == ["portal"]
+
+    def test_set_algebra(self):
+        index = build_index()
+
+        bits = index.exact("httpx") & ~index.containing("azure")
+        assert index.repositories(bits) == ["webhooks"]
+        assert index.repositories(index.all_bits & ~index.exact("httpx")) == ["portal", "docs"]
+
+    def test_shared_keeps_first_spelling_and_order(self):
+        index = DependencyIndex(
+            [("a", ["Requests", "httpx"]), ("b", ["httpx", "requests"]), ("c", ["requests"])]
+        )
+
+        shared = index.shared(min_repositories=2)
+
+        assert list(shared) == ["Requests", "httpx"]
+        assert index.repositories(shared["Requests"]) == ["a", "b", "c"]
+
+    def test_from_records(self):
+        index = DependencyIndex.from_records(
+            [{"name": "ingest", "dependencies": [{"name": "pydantic"}]}, {"dependencies": []}]
+        )
+
+        assert index.names == ["ingest", "Unknown"]
+        assert index.repositories(index.containing("pydantic")) == ["ingest"]
+
+
+class TestPatternMinerWithIndex:
+    """Test pattern extraction through the dependency index"""
+
+    def make_analyses(self, sample_repo_analysis, names, dependencies, language="Python"):
+        return [
+            sample_repo_analysis.model_copy(
+                update={
+                    "repository": sample_repo_analysis.repository.model_copy(
+                        update={
+                            "name": name,
+                            "full_name": f"org/{name}",
+                            "primary_language": language,
+                        }
+                    ),
+                    "dependencies": [
+                        Dependency(name=dep, package_manager="pip") for dep in dependencies
+                    ],
+                }
+            )
+            for name in names
+        ]
+
+    def test_extract_patterns(self, sample_repo_analysis):
+        analyses = self.make_analyses(
+            sample_repo_analysis,
+            ["api-a", "api-b", "api-c"],
+            ["azure-functions", "fastapi", "FastAPI"],
+        )
+
+        patterns = {pattern.name: pattern for pattern in PatternMiner().extract_patterns(analyses)}
+
+        assert patterns["Serverless Architecture (Azure Functions)"].repos_using == [
+            "api-a",
+            "api-b",
+            "api-c",
+        ]
+        assert patterns["RESTful API Pattern"].repos_using == ["api-a", "api-b", "api-c"]
+        assert patterns["Shared Dependency: fastapi"].repos_using == ["api-a", "api-b", "api-c"]
+        assert "Shared Dependency: FastAPI" not in patterns
+
+    def test_api_pattern_requires_language(self, sample_repo_analysis):
+        analyses = self.make_analyses(
+            sample_repo_analysis, ["svc-a", "svc-b"], ["express"], language="Go"
+        )
+
+        patterns = PatternMiner().extract_patterns(analyses)
+
+        assert "RESTful API Pattern" not in {pattern.name for pattern in patterns}
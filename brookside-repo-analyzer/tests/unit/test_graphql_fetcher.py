@@ -0,0 +1,166 @@
+"""
+Unit Tests for GraphQL Signal Fetcher
+
+Validates batched query construction, parsing of per-repository signal bundles,
+REST fallback on failed batches, and analyzer consumption of prefetched signals.
+
+Best for: Ensuring bulk GraphQL prefetching yields the same inputs as REST probing.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.config import Settings
+from src.exceptions import GitHubAPIError
+from src.github_mcp_client import GitHubMCPClient
+from src.graphql_fetcher import GraphQLSignalFetcher
+from src.models import RepoSignals
+
+
+def make_repo_data() -> dict:
+    """GraphQL result for one aliased repository"""
+    return {
+        "languages": {"edges": [{"size": 1200, "node": {"name": "Python"}}]},
+        "defaultBranchRef": {
+            "target": {
+                "history90": {"totalCount": 42},
+                "history30": {"totalCount": 7},
+                "authors": {
+                    "nodes": [
+                        {"author": {"email": "a@example.com"}},
+                        {"author": {"email": "b@example.com"}},
+                        {"author": {"email": "a@example.com"}},
+                    ]
+                },
+            }
+        },
+        "c0": {"__typename": "Blob", "text": "azure-functions==1.18.0\nhttpx\n", "isBinary": False},
+        "e0": {"__typename": "Tree"},
+        "e1": None,
+        "e2": {"__typename": "Blob"},
+    }
+
+
+def make_fetcher(client=None, batch_size: int = 25) -> GraphQLSignalFetcher:
+    return GraphQLSignalFetcher(
+        client or Mock(),
+        existence_paths=["tests/", ".github/workflows/", "README.md"],
+        content_paths=["requirements.txt"],
+        batch_size=batch_size,
+    )
+
+
+class TestQueryConstruction:
+    """Test aliased query building"""
+
+    def test_build_query_aliases_each_repository(self, sample_repository, sample_repository_inactive):
+        fetcher = make_fetcher()
+
+        query, variables = fetcher.build_query([sample_repository, sample_repository_inactive])
+
+        assert "r0: repository(owner: $o0, name: $n0)" in query
+        assert "r1: repository(owner: $o1, name: $n1)" in query
+        assert 'object(expression: "HEAD:tests")' in query
+        assert variables["o0"] == "test-org"
+        assert variables["n1"] == "abandoned-repo"
+        assert "since90" in variables
+
+    def test_commit_activity_can_be_left_out(self, sample_repository):
+        fetcher = GraphQLSignalFetcher(Mock(), [], [], include_commit_activity=False)
+
+        query, variables = fetcher.build_query([sample_repository])
+        signals = fetcher.parse_repository(
+            sample_repository.full_name, {"defaultBranchRef": {"target": {"oid": "abc"}}}
+        )
+
+        assert "history90" not in query
+        assert "since90" not in variables
+        assert signals.commit_stats is None
+        assert signals.head_sha == "abc"
+
+
+class TestSignalParsing:
+    """Test conversion of GraphQL data into RepoSignals"""
+
+    def test_parse_repository(self):
+        signals = make_fetcher().parse_repository("test-org/sample-repo", make_repo_data())
+
+        assert signals.languages == {"Python": 1200}
+        assert signals.commit_stats.commits_last_90_days == 42
+        assert signals.commit_stats.commits_last_30_days == 7
+        assert signals.commit_stats.unique_contributors == 2
+        assert signals.exists("tests/")
+        assert not signals.exists(".github/workflows/")
+        assert signals.exists("README.md")
+        assert signals.file_contents["requirements.txt"].startswith("azure-functions")
+
+    def test_directory_probe_requires_tree(self):
+        data = make_repo_data()
+        data["e0"] = {"__typename": "Blob"}  # A file named "tests" is not a test directory
+
+        signals = make_fetcher().parse_repository("test-org/sample-repo", data)
+
+        assert not signals.exists("tests/")
+
+    def test_empty_repository_has_no_commits(self):
+        data = make_repo_data()
+        data["defaultBranchRef"] = None
+
+        signals = make_fetcher().parse_repository("test-org/sample-repo", data)
+
+        assert signals.commit_stats.commits_last_90_days == 0
+
+
+class TestBatchFetching:
+    """Test batching and fallback"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_batches_and_skips_failures(
+        self, sample_repository, sample_repository_inactive
+    ):
+        client = Mock()
+        client.graphql = AsyncMock(
+            side_effect=[{"r0": make_repo_data()}, GitHubAPIError("boom")]
+        )
+        fetcher = make_fetcher(client, batch_size=1)
+
+        signals = await fetcher.fetch([sample_repository, sample_repository_inactive])
+
+        assert client.graphql.await_count == 2
+        assert list(signals) == ["test-org/sample-repo"]
+
+
+class TestAnalyzerConsumesSignals:
+    """Test RepositoryAnalyzer uses prefetched signals instead of REST"""
+
+    @pytest.mark.asyncio
+    async def test_analyze_with_signals_skips_rest(self, sample_repository):
+        client = Mock()
+        client.settings = Settings()
+        client.analysis_cache = None
+        client.parse_dependency_manifests = (
+            lambda manifests: GitHubMCPClient.parse_dependency_manifests(client, manifests)
+        )
+        client.check_file_exists = AsyncMock()
+        client.get_repository_languages = AsyncMock()
+        analyzer = RepositoryAnalyzer(client)
+        repo = sample_repository.model_copy(update={"pushed_at": datetime.now(timezone.utc)})
+        signals = make_fetcher().parse_repository(repo.full_name, make_repo_data())
+
+        analysis = await analyzer.analyze_repository(repo, signals=signals)
+
+        client.check_file_exists.assert_not_awaited()
+        client.get_repository_languages.assert_not_awaited()
+        assert analysis.has_tests
+        assert analysis.has_documentation
+        assert not analysis.has_ci_cd
+        assert [d.name for d in analysis.dependencies] == ["azure-functions", "httpx"]
+        assert "Azure Functions" in analysis.microsoft_services
+
+    def test_repo_signals_defaults(self):
+        signals = RepoSignals(full_name="org/repo")
+
+        assert not signals.exists("README.md")
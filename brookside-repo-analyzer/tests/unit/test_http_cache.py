@@ -0,0 +1,118 @@
+"""
+Unit Tests for Conditional Request Cache
+
+Validates ETag/Last-Modified storage, conditional replay of GET requests, TTL
+expiry, and credential isolation of cached GitHub responses.
+
+Best for: Ensuring unchanged payloads are served from disk via free 304 responses.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.http_cache import ConditionalRequestCache, credential_identity
+from src.rate_limiter import RateLimitScheduler
+
+
+def make_request(url: str = "https://api.github.com/repos/org/repo/languages") -> httpx.Request:
+    return httpx.Request("GET", url, headers={"Accept": "application/vnd.github+json"})
+
+
+class TestConditionalRequestCache:
+    """Test cache storage and lookup"""
+
+    def test_put_and_get_roundtrip(self, tmp_path):
+        cache = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="abc")
+        request = make_request()
+        response = httpx.Response(200, headers={"ETag": '"v1"'}, json={"Python": 10})
+
+        cache.put(request, response)
+        entry = cache.get(request)
+
+        assert entry is not None
+        assert entry.etag == '"v1"'
+        assert entry.json() == {"Python": 10}
+
+    def test_response_without_validators_not_stored(self, tmp_path):
+        cache = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="abc")
+        request = make_request()
+
+        cache.put(request, httpx.Response(200, json={}))
+
+        assert cache.get(request) is None
+        assert cache.stores == 0
+
+    def test_identity_isolates_entries(self, tmp_path):
+        request = make_request()
+        cache_a = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="token-a")
+        cache_b = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="token-b")
+
+        cache_a.put(request, httpx.Response(200, headers={"ETag": '"v1"'}, json=[]))
+
+        assert cache_b.get(request) is None
+
+    def test_expired_entry_discarded(self, tmp_path, monkeypatch):
+        cache = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="abc")
+        request = make_request()
+        cache.put(request, httpx.Response(200, headers={"ETag": '"v1"'}, json=[]))
+
+        monkeypatch.setattr(time, "time", lambda: time.monotonic() + 10**10)
+
+        assert cache.get(request) is None
+        assert cache.expired == 1
+
+    def test_revalidation_restarts_entry_age(self, tmp_path, monkeypatch):
+        cache = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="abc")
+        request = make_request()
+        start = time.time()
+        cache.put(request, httpx.Response(200, headers={"ETag": '"v1"'}, json=[]))
+
+        monkeypatch.setattr(time, "time", lambda: start + 3000)
+        cache.record_hit(request)
+        monkeypatch.setattr(time, "time", lambda: start + 6000)
+
+        entry = cache.get(request)
+        assert entry is not None
+        assert entry.stored_at == start + 3000
+        assert cache.hits == 1
+
+    def test_credential_identity_does_not_leak_token(self):
+        identity = credential_identity("ghp_secret_token")
+
+        assert "ghp_secret_token" not in identity
+        assert identity == credential_identity("ghp_secret_token")
+
+
+class TestClientConditionalRequests:
+    """Test GitHubMCPClient replays cached GETs conditionally"""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_disk(self, tmp_path, mock_credentials):
+        seen_validators: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            validator = request.headers.get("If-None-Match")
+            seen_validators.append(validator)
+            if validator == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"Python": 42})
+
+        # No in-scan memoization, so the second call behaves like a later run
+        settings = Settings()
+        settings.github.request_memo_size = 0
+        client = GitHubMCPClient(
+            settings, mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.http_cache = ConditionalRequestCache(tmp_path, ttl_hours=1, identity="abc")
+
+        first = await client._request("GET", "/repos/org/repo/languages")
+        second = await client._request("GET", "/repos/org/repo/languages")
+
+        assert first == second == {"Python": 42}
+        assert seen_validators == [None, '"v1"']
+        assert client.http_cache.hits == 1
@@ -0,0 +1,130 @@
+"""
+Unit Tests for Missing-Path Cache
+
+Validates the Bloom filter, exact handling of probe-path collisions, persistence
+across runs, invalidation on tree SHA change, and GitHubMCPClient skipping 404
+probes for paths already known to be missing.
+
+Best for: Ensuring absent files are probed once per repository content version.
+"""
+
+import httpx
+import pytest
+
+from src import negative_cache
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.negative_cache import BloomFilter, MissingPathCache
+from src.rate_limiter import RateLimitScheduler
+
+PROBES = ["package.json", "requirements.txt", ".claude.json", "CLAUDE.md"]
+
+
+class TestBloomFilter:
+    """Test Bloom filter basics"""
+
+    def test_added_items_are_members(self):
+        bloom = BloomFilter.for_capacity(10, 0.01)
+        bloom.add("package.json")
+
+        assert "package.json" in bloom
+        assert "requirements.txt" not in bloom
+
+    def test_hex_roundtrip(self):
+        bloom = BloomFilter.for_capacity(10, 0.01)
+        bloom.add("CLAUDE.md")
+
+        restored = BloomFilter(bloom.size_bits, bloom.hash_count, bytes.fromhex(bloom.to_hex()))
+
+        assert "CLAUDE.md" in restored
+
+
+class TestMissingPathCache:
+    """Test negative cache semantics"""
+
+    def test_records_probe_and_other_paths(self, tmp_path):
+        cache = MissingPathCache(tmp_path, PROBES)
+        cache.record_missing("org/repo", "tree1", "package.json")
+        cache.record_missing("org/repo", "tree1", ".claude/agents/x.md")
+
+        assert cache.is_missing("org/repo", "tree1", "package.json")
+        assert cache.is_missing("org/repo", "tree1", ".claude/agents/x.md")
+        assert not cache.is_missing("org/repo", "tree1", "requirements.txt")
+        assert not cache.is_missing("org/other", "tree1", "package.json")
+        assert cache.hits == 2
+
+    def test_collisions_never_report_present_paths_missing(self, tmp_path, monkeypatch):
+        # A near-useless filter collides on almost everything
+        monkeypatch.setattr(negative_cache, "BLOOM_FALSE_POSITIVE_RATE", 0.9)
+        cache = MissingPathCache(tmp_path, PROBES)
+        cache.record_missing("org/repo", "tree1", "package.json")
+        cache.record_missing("org/repo", "tree1", "CLAUDE.md")
+
+        assert cache.is_missing("org/repo", "tree1", "package.json")
+        assert cache.is_missing("org/repo", "tree1", "CLAUDE.md")
+        assert not cache.is_missing("org/repo", "tree1", "requirements.txt")
+        assert not cache.is_missing("org/repo", "tree1", ".claude.json")
+
+    def test_tree_change_invalidates(self, tmp_path):
+        cache = MissingPathCache(tmp_path, PROBES)
+        cache.record_missing("org/repo", "tree1", "package.json")
+
+        assert not cache.is_missing("org/repo", "tree2", "package.json")
+
+        cache.record_missing("org/repo", "tree2", "CLAUDE.md")
+        assert not cache.is_missing("org/repo", "tree1", "package.json")
+
+    def test_persists_across_runs(self, tmp_path):
+        first = MissingPathCache(tmp_path, PROBES)
+        first.record_missing("org/repo", "tree1", "package.json")
+        first.record_missing("org/repo", "tree1", "docs/guide.md")
+        first.save()
+
+        second = MissingPathCache(tmp_path, PROBES)
+
+        assert second.is_missing("org/repo", "tree1", "package.json")
+        assert second.is_missing("org/repo", "tree1", "docs/guide.md")
+
+    def test_changed_probe_set_keeps_only_exact_paths(self, tmp_path):
+        first = MissingPathCache(tmp_path, PROBES)
+        first.record_missing("org/repo", "tree1", "package.json")
+        first.record_missing("org/repo", "tree1", "docs/guide.md")
+        first.save()
+
+        second = MissingPathCache(tmp_path, PROBES + ["go.mod"])
+
+        assert not second.is_missing("org/repo", "tree1", "package.json")
+        assert second.is_missing("org/repo", "tree1", "docs/guide.md")
+
+
+class TestClientNegativeCaching:
+    """Test GitHubMCPClient skipping known-missing paths"""
+
+    def make_client(self, tmp_path, mock_credentials, requests: list[str]) -> GitHubMCPClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path.endswith("/git/trees/HEAD"):
+                return httpx.Response(200, json={"sha": "tree1", "tree": []})
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.missing_paths = MissingPathCache(tmp_path, PROBES)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_missing_paths_not_probed_next_run(self, tmp_path, mock_credentials):
+        first_run: list[str] = []
+        client = self.make_client(tmp_path, mock_credentials, first_run)
+        assert await client._get_file_content("org", "repo", "package.json") is None
+        client.missing_paths.save()
+
+        second_run: list[str] = []
+        client = self.make_client(tmp_path, mock_credentials, second_run)
+        assert await client._get_file_content("org", "repo", "package.json") is None
+
+        assert first_run == ["/repos/org/repo/git/trees/HEAD", "/repos/org/repo/contents/package.json"]
+        assert second_run == ["/repos/org/repo/git/trees/HEAD"]
+        assert client.missing_paths.hits == 1
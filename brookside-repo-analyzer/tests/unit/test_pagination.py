@@ -0,0 +1,190 @@
+"""
+Unit Tests for Concurrent Pagination
+
+Validates Link header parsing, concurrent page fetching with stable ordering,
+sequential fallback, and repository listing filters on top of the paging helper.
+
+Best for: Ensuring large organizations are listed quickly without losing or
+reordering repositories.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.exceptions import GitHubAPIError
+from src.github_mcp_client import PAGE_SIZE, GitHubMCPClient, parse_last_page
+from src.rate_limiter import RateLimitScheduler
+
+
+def make_repo_data(index: int, private: bool = False) -> dict:
+    """REST repository payload"""
+    return {
+        "name": f"repo-{index}",
+        "full_name": f"test-org/repo-{index}",
+        "html_url": f"https://github.com/test-org/repo-{index}",
+        "private": private,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-06-01T00:00:00Z",
+        "pushed_at": "2024-06-01T00:00:00Z",
+    }
+
+
+def make_client(mock_credentials, handler, settings: Settings | None = None) -> GitHubMCPClient:
+    client = GitHubMCPClient(
+        settings or Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=1000)
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def paged_handler(items: list[dict], pages_seen: list[int], link: bool = True, delay: bool = False):
+    """Serve items in PAGE_SIZE pages, later pages finishing first when delayed"""
+    last_page = max(1, -(-len(items) // PAGE_SIZE))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        pages_seen.append(page)
+        if delay:
+            await asyncio.sleep(0.01 * (last_page - page))
+        headers = {}
+        if link and last_page > 1:
+            headers["Link"] = (
+                f'<{request.url.copy_set_param("page", 2)}>; rel="next", '
+                f'<{request.url.copy_set_param("page", last_page)}>; rel="last"'
+            )
+        chunk = items[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+        return httpx.Response(200, json=chunk, headers=headers)
+
+    return handler
+
+
+class TestParseLastPage:
+    """Test Link header parsing"""
+
+    def test_parses_last_link(self):
+        header = (
+            '<https://api.github.com/organizations/1/repos?page=2&per_page=100>; rel="next", '
+            '<https://api.github.com/organizations/1/repos?page=7&per_page=100>; rel="last"'
+        )
+
+        assert parse_last_page(header) == 7
+
+    def test_missing_header(self):
+        assert parse_last_page(None) is None
+        assert parse_last_page('<https://api.github.com/x?page=1>; rel="prev"') is None
+
+
+class TestPaginate:
+    """Test the shared paging helper"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_keep_order(self, mock_credentials):
+        items = [{"id": i} for i in range(PAGE_SIZE * 4 + 5)]
+        pages_seen: list[int] = []
+        client = make_client(mock_credentials, paged_handler(items, pages_seen, delay=True))
+
+        result = await client._paginate("/orgs/test-org/repos")
+
+        assert result == items
+        assert sorted(pages_seen) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, mock_credentials):
+        items = [{"id": i} for i in range(PAGE_SIZE * 8)]
+        in_flight = 0
+        peak = 0
+        inner = paged_handler(items, [])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await inner(request)
+
+        settings = Settings()
+        settings.github.max_concurrent_pages = 2
+        client = make_client(mock_credentials, handler, settings)
+
+        assert len(await client._paginate("/orgs/test-org/repos")) == len(items)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_fallback_without_link_header(self, mock_credentials):
+        items = [{"id": i} for i in range(PAGE_SIZE * 2)]
+        pages_seen: list[int] = []
+        client = make_client(mock_credentials, paged_handler(items, pages_seen, link=False))
+
+        result = await client._paginate("/user/orgs")
+
+        assert result == items
+        assert pages_seen == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_max_pages(self, mock_credentials):
+        items = [{"id": i} for i in range(PAGE_SIZE * 5)]
+        pages_seen: list[int] = []
+        client = make_client(mock_credentials, paged_handler(items, pages_seen))
+
+        result = await client._paginate("/repos/test-org/repo/commits", max_pages=2)
+
+        assert result == items[: PAGE_SIZE * 2]
+        assert sorted(pages_seen) == [1, 2]
+
+
+class TestListOrganizationRepos:
+    """Test repository listing on top of the paging helper"""
+
+    @pytest.mark.asyncio
+    async def test_filters_private_and_excluded(self, mock_credentials):
+        items = [make_repo_data(i, private=(i % 50 == 0)) for i in range(PAGE_SIZE * 3)]
+        settings = Settings()
+        settings.github.exclude_repos = ["repo-1"]
+        client = make_client(mock_credentials, paged_handler(items, []), settings)
+
+        repos = await client.list_organization_repos("test-org", include_private=False)
+
+        names = [repo.name for repo in repos]
+        assert "repo-1" not in names
+        assert "repo-50" not in names
+        assert names == sorted(names, key=lambda name: int(name.split("-")[1]))
+        assert len(names) == PAGE_SIZE * 3 - 6 - 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_user_endpoint(self, mock_credentials):
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.startswith("/orgs/"):
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json=[make_repo_data(1)])
+
+        client = make_client(mock_credentials, handler)
+
+        repos = await client.list_organization_repos("someone")
+
+        assert [repo.name for repo in repos] == ["repo-1"]
+        assert paths == ["/orgs/someone/repos", "/users/someone/repos"]
+
+    @pytest.mark.asyncio
+    async def test_later_org_page_404_not_retried_as_user(self, mock_credentials):
+        paths: list[str] = []
+        serve = paged_handler([make_repo_data(i) for i in range(PAGE_SIZE * 2)], [])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.params.get("page") == "2":
+                return httpx.Response(404, json={"message": "Not Found"})
+            return await serve(request)
+
+        client = make_client(mock_credentials, handler)
+
+        with pytest.raises(GitHubAPIError):
+            await client.list_organization_repos("test-org")
+
+        assert "/users/test-org/repos" not in paths
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the Parse Result Cache
+
+Validates Git blob SHA computation, LRU eviction, persistence, and agent
+details resolved in one pass with vendored files parsed and downloaded once.
+
+Best for: Ensuring identical configuration files are not re-parsed per repository.
+"""
+
+import subprocess
+
+import httpx
+import pytest
+
+from src.analyzers.claude_detector import ClaudeCapabilitiesDetector
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.parse_cache import ParseCache, blob_sha
+from src.rate_limiter import RateLimitScheduler
+
+AGENT = "---\nname: cost-analyst\ndescription: Tracks spend\n---\nBody\n"
+
+
+class TestParseCache:
+    """Test the LRU and its persistence"""
+
+    def test_blob_sha_matches_git(self, tmp_path):
+        path = tmp_path / "agent.md"
+        path.write_text(AGENT, encoding="utf-8")
+        try:
+            expected = subprocess.run(
+                ["git", "hash-object", str(path)], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git not available")
+
+        assert blob_sha(AGENT) == expected
+
+    def test_parse_reuses_identical_content(self):
+        cache = ParseCache()
+        calls: list[str] = []
+
+        def parser(content: str) -> list[str]:
+            calls.append(content)
+            return [content.upper()]
+
+        assert cache.parse("kind", "abc", parser) == ["ABC"]
+        assert cache.parse("kind", "abc", parser) == ["ABC"]
+        assert cache.parse("other", "abc", parser) == ["ABC"]
+
+        assert len(calls) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_lru_eviction_and_persistence(self, tmp_path):
+        cache = ParseCache(max_entries=2, path=tmp_path / "parsed.json")
+        cache.put("kind", "a", [1])
+        cache.put("kind", "b", [2])
+        cache.get("kind", "a")
+        cache.put("kind", "c", [3])
+
+        assert cache.get("kind", "b") is None
+        cache.save()
+
+        restored = ParseCache(max_entries=2, path=tmp_path / "parsed.json")
+        restored.load()
+        assert restored.get("kind", "a") == [1]
+        assert restored.get("kind", "c") == [3]
+
+
+class TestAgentDetails:
+    """Test batched agent resolution through the parse cache"""
+
+    @pytest.mark.asyncio
+    async def test_vendored_agent_downloaded_once(self, mock_credentials, sample_repository):
+        sha = blob_sha(AGENT)
+        downloads: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/branches/main"):
+                return httpx.Response(
+                    200, json={"commit": {"sha": "h", "commit": {"tree": {"sha": "t"}}}}
+                )
+            if path.endswith("/git/trees/t"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "sha": "t",
+                        "tree": [
+                            {"path": ".claude/agents", "type": "tree", "sha": "d"},
+                            {
+                                "path": ".claude/agents/cost-analyst.md",
+                                "type": "blob",
+                                "sha": sha,
+                                "size": len(AGENT),
+                            },
+                        ],
+                    },
+                )
+            downloads.append(path)
+            return httpx.Response(200, content=AGENT.encode())
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        detector = ClaudeCapabilitiesDetector(client)
+        repos = [
+            sample_repository.model_copy(update={"name": name, "full_name": f"test-org/{name}"})
+            for name in ("app", "api")
+        ]
+
+        portfolio = await detector.get_portfolio_agent_details(repos)
+
+        assert portfolio["test-org/app"] == {
+            "cost-analyst": {"name": "cost-analyst", "description": "Tracks spend"}
+        }
+        assert portfolio["test-org/api"] == portfolio["test-org/app"]
+        assert len(downloads) == 1
@@ -0,0 +1,126 @@
+"""
+Unit Tests for the Analysis Pipeline
+
+Validates graph validation, computing each needed step exactly once, running
+independent steps concurrently, skipping steps no target needs, failure
+propagation, and extra steps run alongside repository analysis.
+
+Best for: Ensuring shared analysis inputs are fetched once per repository.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.config import Settings
+from src.exceptions import ConfigurationError
+from src.models import ClaudeConfig, CommitStats
+from src.pipeline import Pipeline, Step
+
+
+class TestPipelineGraph:
+    """Test pipeline construction and planning"""
+
+    def test_unknown_requirement_rejected(self):
+        with pytest.raises(ConfigurationError):
+            Pipeline([Step("score", lambda tree: 1, ("tree",))])
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ConfigurationError):
+            Pipeline([Step("a", lambda b: b, ("b",)), Step("b", lambda a: a, ("a",))])
+
+    def test_plan_orders_dependencies_first(self):
+        pipeline = Pipeline(
+            [
+                Step("score", lambda tree, manifests: 1, ("tree", "manifests")),
+                Step("manifests", lambda tree: [], ("tree",)),
+                Step("tree", lambda repo: {}, ("repo",)),
+                Step("unused", lambda repo: 0, ("repo",)),
+            ],
+            inputs=["repo"],
+        )
+
+        assert pipeline.plan(["score"]) == ["tree", "manifests", "score"]
+
+
+class TestPipelineRun:
+    """Test Pipeline.run"""
+
+    @pytest.mark.asyncio
+    async def test_shared_input_computed_once_and_steps_overlap(self):
+        calls: list[str] = []
+        running = {"now": 0, "peak": 0}
+
+        async def fetch(name: str, value):
+            calls.append(name)
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return value
+
+        pipeline = Pipeline(
+            [
+                Step("tree", lambda repo: fetch("tree", {"README.md"}), ("repo",)),
+                Step("languages", lambda repo: fetch("languages", {"Python": 1}), ("repo",)),
+                Step("has_docs", lambda tree: "README.md" in tree, ("tree",)),
+                Step("has_ci", lambda tree: ".github/" in tree, ("tree",)),
+                Step("expensive", lambda repo: fetch("expensive", None), ("repo",)),
+            ],
+            inputs=["repo"],
+        )
+
+        results = await pipeline.run(["has_docs", "has_ci", "languages"], repo="org/app")
+
+        assert sorted(calls) == ["languages", "tree"]
+        assert running["peak"] == 2
+        assert results["has_docs"] and not results["has_ci"]
+        assert results["repo"] == "org/app"
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates(self):
+        pipeline = Pipeline(
+            [
+                Step("tree", AsyncMock(side_effect=ValueError("boom")), ("repo",)),
+                Step("has_docs", lambda tree: True, ("tree",)),
+            ],
+            inputs=["repo"],
+        )
+
+        with pytest.raises(ValueError, match="boom"):
+            await pipeline.run(["has_docs"], repo="org/app")
+
+    @pytest.mark.asyncio
+    async def test_missing_input_rejected(self):
+        pipeline = Pipeline([Step("name", lambda repo: repo, ("repo",))], inputs=["repo"])
+
+        with pytest.raises(ConfigurationError):
+            await pipeline.run(["name"])
+
+
+class TestAnalyzerSteps:
+    """Test extra steps run by RepositoryAnalyzer.analyze_repository"""
+
+    @pytest.mark.asyncio
+    async def test_extra_step_assigned_to_analysis(self, sample_repository):
+        client = Mock()
+        client.settings = Settings()
+        client.analysis_cache = None
+        client.get_repository_languages = AsyncMock(return_value={"Python": 100})
+        client.get_commit_activity = AsyncMock(return_value=CommitStats())
+        client.get_repository_dependencies = AsyncMock(return_value=[])
+        client.check_file_exists = AsyncMock(return_value=False)
+        config = ClaudeConfig(has_claude_md=True)
+        repo = sample_repository.model_copy(update={"pushed_at": datetime.now(timezone.utc)})
+
+        analysis = await RepositoryAnalyzer(client).analyze_repository(
+            repo,
+            deep_analysis=False,
+            steps=[Step("claude_config", AsyncMock(return_value=config), ("repo",))],
+        )
+
+        assert analysis.claude_config == config
+        client.get_commit_activity.assert_awaited_once()
@@ -0,0 +1,168 @@
+"""
+Unit Tests for Rate-Limit Scheduler
+
+Validates token-bucket pacing, header tracking, and pause/resume behavior around
+exhausted GitHub rate-limit windows.
+
+Best for: Ensuring long scans wait out rate limits instead of failing.
+"""
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.exceptions import RateLimitError
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler, rate_limit_resource
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time instantly"""
+
+    def __init__(self, start: float = 1_700_000_000.0):
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock: FakeClock, **kwargs) -> RateLimitScheduler:
+    return RateLimitScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestRateLimitResource:
+    """Test endpoint to resource mapping"""
+
+    def test_resource_mapping(self):
+        assert rate_limit_resource("/repos/org/repo") == "core"
+        assert rate_limit_resource("/search/code") == "code_search"
+        assert rate_limit_resource("search/repositories") == "search"
+        assert rate_limit_resource("/graphql") == "graphql"
+
+
+class TestTokenBucket:
+    """Test request pacing"""
+
+    @pytest.mark.asyncio
+    async def test_burst_released_without_waiting(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, requests_per_second=1, burst_size=3)
+
+        for _ in range(3):
+            await scheduler.acquire()
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, requests_per_second=2, burst_size=1)
+
+        await scheduler.acquire()
+        await scheduler.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    @pytest.mark.asyncio
+    async def test_slows_down_when_budget_low(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, requests_per_second=100, burst_size=1)
+        scheduler.observe(
+            {
+                "X-RateLimit-Remaining": "10",
+                "X-RateLimit-Reset": str(int(clock.now + 100)),
+            },
+            200,
+        )
+
+        await scheduler.acquire()
+        await scheduler.acquire()
+
+        # 10 requests over 100 seconds -> one request every ~10 seconds
+        assert clock.sleeps[0] > 5
+
+
+class TestRateLimitWindows:
+    """Test pause and resume around exhausted windows"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_window_reset(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, burst_size=10)
+        reset = int(clock.now + 120)
+
+        pause = scheduler.observe(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}, 403
+        )
+        await scheduler.acquire()
+
+        assert pause == pytest.approx(121)
+        assert clock.now >= reset
+        assert scheduler.pauses == 1
+
+    @pytest.mark.asyncio
+    async def test_secondary_limit_retry_after(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, burst_size=10)
+
+        pause = scheduler.observe({"Retry-After": "30"}, 429)
+        await scheduler.acquire()
+
+        assert pause == 30
+        assert clock.sleeps == [pytest.approx(30)]
+
+    def test_plain_forbidden_is_not_rate_limit(self):
+        scheduler = make_scheduler(FakeClock())
+
+        assert scheduler.observe({"X-RateLimit-Remaining": "4000"}, 403) is None
+
+    @pytest.mark.asyncio
+    async def test_raises_when_pause_exceeds_max_wait(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, max_wait_seconds=60)
+        scheduler.observe(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(clock.now + 600))},
+            403,
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await scheduler.acquire()
+
+        assert exc_info.value.retry_after >= 600
+
+
+class TestClientIntegration:
+    """Test GitHubMCPClient resumes after a rate-limit rejection"""
+
+    @pytest.mark.asyncio
+    async def test_request_retried_after_rate_limit(self, mock_credentials):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+        calls = {"count": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["count"] += 1
+            if calls["count"] == 1:
+                return httpx.Response(
+                    403,
+                    headers={
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": str(int(clock.now + 5)),
+                    },
+                    json={"message": "API rate limit exceeded"},
+                )
+            return httpx.Response(200, json={"Python": 100})
+
+        client = GitHubMCPClient(Settings(), mock_credentials, rate_limiter=scheduler)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        data = await client._request("GET", "/repos/org/repo/languages")
+
+        assert data == {"Python": 100}
+        assert calls["count"] == 2
+        assert scheduler.pauses == 1
@@ -0,0 +1,115 @@
+"""
+Unit Tests for Raw File Fetching
+
+Validates raw media-type reads, the blobs API fallback for files too large for
+the contents API, size limits, and dependency parsing from raw bytes.
+
+Best for: Ensuring large manifests and lockfiles are read without JSON/base64
+round-trips.
+"""
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.github_mcp_client import RAW_MEDIA_TYPE, GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+from src.tree_index import RepoTreeIndex
+
+
+def make_client(mock_credentials, handler, settings: Settings | None = None) -> GitHubMCPClient:
+    client = GitHubMCPClient(
+        settings or Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestRawFileReads:
+    """Test raw content fetching"""
+
+    @pytest.mark.asyncio
+    async def test_reads_raw_bytes(self, mock_credentials):
+        accepts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            accepts.append(request.headers["Accept"])
+            return httpx.Response(200, content=b'{"name": "app"}')
+
+        client = make_client(mock_credentials, handler)
+
+        data = await client.get_file_bytes("org", "repo", "package.json")
+
+        assert data == b'{"name": "app"}'
+        assert accepts == [RAW_MEDIA_TYPE]
+        assert await client._get_file_content("org", "repo", "package.json") == '{"name": "app"}'
+
+    @pytest.mark.asyncio
+    async def test_too_large_for_contents_falls_back_to_blob(self, mock_credentials):
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/contents/package-lock.json"):
+                return httpx.Response(403, json={"errors": [{"code": "too_large"}]})
+            if request.url.path.endswith("/contents/"):
+                return httpx.Response(
+                    200, json=[{"name": "package-lock.json", "sha": "blob1", "type": "file"}]
+                )
+            if request.url.path.endswith("/git/blobs/blob1"):
+                return httpx.Response(200, content=b"{}")
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = make_client(mock_credentials, handler)
+
+        assert await client.get_file_bytes("org", "repo", "package-lock.json") == b"{}"
+        assert paths[-1] == "/repos/org/repo/git/blobs/blob1"
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_rejected(self, mock_credentials):
+        settings = Settings()
+        settings.analysis.max_file_size_kb = 1
+        client = make_client(
+            mock_credentials, lambda request: httpx.Response(200, content=b"x" * 2048), settings
+        )
+
+        assert await client.get_file_bytes("org", "repo", "poetry.lock") is None
+
+    @pytest.mark.asyncio
+    async def test_oversized_tree_entry_not_requested(self, mock_credentials):
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, content=b"")
+
+        settings = Settings()
+        settings.analysis.max_file_size_kb = 1
+        client = make_client(mock_credentials, handler, settings)
+        client._trees["org/repo"] = RepoTreeIndex.from_api(
+            {"sha": "t", "tree": [{"path": "poetry.lock", "type": "blob", "sha": "b", "size": 4096}]}
+        )
+
+        assert await client.get_file_bytes("org", "repo", "poetry.lock") is None
+        assert requests == []
+
+
+class TestDependencyParsingFromBytes:
+    """Test manifest parsing accepts raw bytes"""
+
+    def test_parse_bytes_manifests(self, mock_credentials):
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+
+        dependencies = client.parse_dependency_manifests(
+            {
+                "package.json": b'{"dependencies": {"express": "^4.0.0"}}',
+                "requirements.txt": b"httpx==0.27.0\n# comment\n",
+            }
+        )
+
+        assert [(d.name, d.version) for d in dependencies] == [
+            ("express", "^4.0.0"),
+            ("httpx", "0.27.0"),
+        ]
@@ -7,12 +7,15 @@ assessment, and Microsoft service detection to ensure accurate repository evalua
 Best for: Comprehensive testing of analysis logic with edge cases and boundary conditions.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.analyzers.repo_analyzer import RepositoryAnalyzer
+from src.config import Settings
+from src.exceptions import GitHubAPIError
 from src.models import (
     CommitStats,
     Repository,
@@ -418,3 +421,86 @@ class TestAnalysisPerformance:
         # Implementation would use asyncio.gather or similar
 
         assert True  # Placeholder for concurrent testing
+
+
+class TestConcurrentFetches:
+    """Test independent per-repository fetches run concurrently"""
+
+    def make_client(self, existing_paths: set[str], delay: float = 0.02) -> Mock:
+        client = Mock()
+        client.settings = Settings()
+        client.analysis_cache = None
+        client.in_flight = 0
+        client.peak = 0
+        client.probed = []
+
+        def timed(result):
+            async def call(*args):
+                client.in_flight += 1
+                client.peak = max(client.peak, client.in_flight)
+                try:
+                    await asyncio.sleep(delay)
+                    return result(*args) if callable(result) else result
+                finally:
+                    client.in_flight -= 1
+
+            return call
+
+        def exists(repo, path):
+            client.probed.append(path)
+            return path in existing_paths
+
+        client.get_repository_languages = timed({"Python": 100})
+        client.get_commit_activity = timed(CommitStats(commits_last_30_days=3))
+        client.get_repository_dependencies = timed([])
+        client.check_file_exists = timed(exists)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fetches_overlap_within_limit(self, sample_repository):
+        client = self.make_client({"tests/", "README.md", ".github/workflows/"})
+        client.settings.analysis.max_concurrent_fetches_per_repo = 4
+        analyzer = RepositoryAnalyzer(client)
+
+        repo = sample_repository.model_copy(
+            update={"pushed_at": datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+
+        analysis = await analyzer.analyze_repository(repo, deep_analysis=False)
+
+        assert client.peak == 4
+        assert analysis.has_tests and analysis.has_ci_cd and analysis.has_documentation
+        assert analysis.test_coverage_percentage == 70.0
+        assert analysis.commit_stats.commits_last_30_days == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_propagates(self, sample_repository):
+        client = self.make_client(set())
+        client.get_repository_languages = AsyncMock(side_effect=GitHubAPIError("timeout"))
+        analyzer = RepositoryAnalyzer(client)
+
+        with pytest.raises(GitHubAPIError):
+            await analyzer.analyze_repository(sample_repository, deep_analysis=False)
+
+    @pytest.mark.asyncio
+    async def test_first_hit_settles_remaining_probes(self, sample_repository):
+        client = self.make_client(set())
+        finished: list[str] = []
+
+        async def exists(repo, path):
+            try:
+                if path != "tests/":
+                    await asyncio.sleep(10)
+                return True
+            finally:
+                finished.append(path)
+
+        client.check_file_exists = exists
+        analyzer = RepositoryAnalyzer(client)
+
+        found = await analyzer._any_path_exists(
+            sample_repository, ["test/", "tests/", "spec/"], None
+        )
+
+        assert found
+        assert sorted(finished) == ["spec/", "test/", "tests/"]
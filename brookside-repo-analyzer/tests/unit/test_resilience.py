@@ -0,0 +1,202 @@
+"""
+Unit Tests for Request Resilience
+
+Validates endpoint family grouping, jittered backoff bounds, idempotency-aware
+retries, the retry budget, circuit breaker transitions, and that the GitHub
+client surfaces outages instead of reporting empty results.
+
+Best for: Ensuring transient GitHub failures neither corrupt scores nor amplify load.
+"""
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.exceptions import CircuitOpenError, GitHubAPIError
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+from src.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    endpoint_family,
+    is_transient,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_policy(**kwargs) -> tuple[RetryPolicy, list[float]]:
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    kwargs.setdefault("rng", lambda: 1.0)
+    return RetryPolicy(sleep=sleep, **kwargs), delays
+
+
+def failing(errors: list[Exception], result: str = "ok"):
+    """Coroutine factory raising the given errors in turn, then succeeding"""
+    calls = []
+
+    async def fn() -> str:
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    fn.calls = calls
+    return fn
+
+
+class TestClassification:
+    """Test endpoint families and transient detection"""
+
+    def test_endpoint_family(self):
+        assert endpoint_family("/repos/org/app/commits") == "commits"
+        assert endpoint_family("repos/org/app/contents/src/main.py") == "contents"
+        assert endpoint_family("/repos/org/app") == "repos"
+        assert endpoint_family("/orgs/org/repos?page=2") == "orgs"
+        assert endpoint_family("/graphql") == "graphql"
+
+    def test_is_transient(self):
+        assert is_transient(GitHubAPIError("timeout"))
+        assert is_transient(GitHubAPIError("bad gateway", status_code=502))
+        assert is_transient(CircuitOpenError("open", family="commits"))
+        assert not is_transient(GitHubAPIError("missing", status_code=404))
+
+
+class TestRetryPolicy:
+    """Test retries and backoff"""
+
+    def test_backoff_is_bounded(self):
+        policy, _ = make_policy(base_delay=0.5, max_delay=3.0)
+
+        assert [policy.backoff(n) for n in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self):
+        policy, delays = make_policy(base_delay=0.5)
+        fn = failing([GitHubAPIError("502", status_code=502), GitHubAPIError("timeout")])
+
+        assert await policy.call("commits", fn) == "ok"
+        assert len(fn.calls) == 3
+        assert delays == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_definitive_errors_not_retried(self):
+        policy, delays = make_policy()
+        fn = failing([GitHubAPIError("missing", status_code=404)])
+
+        with pytest.raises(GitHubAPIError):
+            await policy.call("contents", fn)
+
+        assert len(fn.calls) == 1
+        assert policy.breaker("contents").state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_not_retried(self):
+        policy, _ = make_policy()
+        fn = failing([GitHubAPIError("502", status_code=502)])
+
+        with pytest.raises(GitHubAPIError):
+            await policy.call("issues", fn, idempotent=False)
+
+        assert len(fn.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_retries(self):
+        policy, _ = make_policy(budget=RetryBudget(ratio=0.0, min_tokens=1.0))
+        fn = failing([GitHubAPIError("502", status_code=502)] * 3)
+
+        with pytest.raises(GitHubAPIError):
+            await policy.call("commits", fn)
+
+        assert len(fn.calls) == 2
+        assert policy.budget.exhausted == 1
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions"""
+
+    @pytest.mark.asyncio
+    async def test_opens_fails_fast_and_recovers(self):
+        clock = FakeClock()
+        policy, _ = make_policy(max_retries=0, failure_threshold=2, reset_timeout=30, clock=clock)
+
+        for _ in range(2):
+            with pytest.raises(GitHubAPIError):
+                await policy.call("commits", failing([GitHubAPIError("503", status_code=503)]))
+
+        skipped = failing([])
+        with pytest.raises(CircuitOpenError):
+            await policy.call("commits", skipped)
+        assert skipped.calls == []
+
+        # Other families are unaffected
+        assert await policy.call("contents", failing([])) == "ok"
+
+        clock.now = 31
+        assert await policy.call("commits", failing([])) == "ok"
+        assert policy.breaker("commits").state == CircuitBreaker.CLOSED
+
+    def test_half_open_failure_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("commits", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 11
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # Only one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestClientResilience:
+    """Test GitHubMCPClient retry integration"""
+
+    def make_client(self, mock_credentials, handler) -> GitHubMCPClient:
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.retry_policy, _ = make_policy()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self, mock_credentials):
+        responses = [
+            httpx.Response(502, text="<html>Bad Gateway</html>"),
+            httpx.Response(200, json={"Python": 1}),
+        ]
+        client = self.make_client(mock_credentials, lambda request: responses.pop(0))
+
+        assert await client._request("GET", "/repos/org/app/languages") == {"Python": 1}
+
+    @pytest.mark.asyncio
+    async def test_outage_not_reported_as_inactivity(self, mock_credentials, sample_repository):
+        client = self.make_client(
+            mock_credentials, lambda request: httpx.Response(503, json={"message": "Unavailable"})
+        )
+
+        with pytest.raises(GitHubAPIError):
+            await client.get_commit_activity(sample_repository)
+
+    @pytest.mark.asyncio
+    async def test_outage_not_reported_as_missing_file(self, mock_credentials):
+        client = self.make_client(mock_credentials, lambda request: httpx.Response(504))
+
+        with pytest.raises(GitHubAPIError):
+            await client.get_file_bytes("org", "app", "package.json")
@@ -0,0 +1,164 @@
+"""
+Unit Tests for Streaming Repository Scanner
+
+Validates that analysis starts before listing finishes, results keep listing
+order, signal prefetching happens per batch, and per-repository failures are
+isolated.
+
+Best for: Ensuring organization scans overlap listing with analysis.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.config import Settings
+from src.scanner import RepositoryScanner
+
+
+def make_analyzer(batch_size: int = 25) -> Mock:
+    analyzer = Mock()
+    analyzer.github_client.settings = Settings()
+    analyzer.github_client.settings.github.graphql_batch_size = batch_size
+    analyzer.github_client.deferred_stats = {}
+    analyzer.prefetch_signals = AsyncMock(return_value={})
+    return analyzer
+
+
+def make_repos(sample_repository, count: int) -> list:
+    return [
+        sample_repository.model_copy(
+            update={"name": f"repo-{i}", "full_name": f"test-org/repo-{i}"}
+        )
+        for i in range(count)
+    ]
+
+
+async def stream(repos, events: list[str] | None = None, delay: float = 0):
+    for repo in repos:
+        if delay:
+            await asyncio.sleep(delay)
+        if events is not None:
+            events.append(f"listed {repo.name}")
+        yield repo
+
+
+class TestRepositoryScanner:
+    """Test producer/consumer scan loop"""
+
+    @pytest.mark.asyncio
+    async def test_analysis_starts_before_listing_finishes(self, sample_repository):
+        events: list[str] = []
+        analyzer = make_analyzer(batch_size=1)
+
+        async def analyze(repo, deep_analysis, signals, steps):
+            events.append(f"analyzed {repo.name}")
+            return Mock(repository=repo)
+
+        analyzer.analyze_repository = analyze
+        scanner = RepositoryScanner(analyzer)
+
+        await scanner.scan(stream(make_repos(sample_repository, 3), events, delay=0.01))
+
+        assert events.index("analyzed repo-0") < events.index("listed repo-2")
+
+    @pytest.mark.asyncio
+    async def test_results_keep_listing_order_with_workers(self, sample_repository):
+        analyzer = make_analyzer()
+
+        async def analyze(repo, deep_analysis, signals, steps):
+            # Earlier repositories take longer, so completion order is reversed
+            await asyncio.sleep(0.01 * (5 - int(repo.name.split("-")[1])))
+            return Mock(repository=repo)
+
+        analyzer.analyze_repository = analyze
+        scanner = RepositoryScanner(analyzer, workers=5)
+
+        result = await scanner.scan(stream(make_repos(sample_repository, 5)))
+
+        assert [a.repository.name for a in result.analyses] == [f"repo-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_signals_prefetched_per_batch(self, sample_repository):
+        analyzer = make_analyzer(batch_size=2)
+        analyzer.prefetch_signals = AsyncMock(
+            side_effect=lambda batch: {repo.full_name: f"signals-{repo.name}" for repo in batch}
+        )
+        analyzer.analyze_repository = AsyncMock(side_effect=lambda repo, **kwargs: Mock())
+        scanner = RepositoryScanner(analyzer)
+
+        await scanner.scan(stream(make_repos(sample_repository, 5)))
+
+        assert [len(call.args[0]) for call in analyzer.prefetch_signals.await_args_list] == [2, 2, 1]
+        assert analyzer.analyze_repository.await_args_list[4].kwargs["signals"] == "signals-repo-4"
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self, sample_repository):
+        analyzer = make_analyzer()
+
+        async def analyze(repo, deep_analysis, signals, steps):
+            if repo.name == "repo-1":
+                raise RuntimeError("boom")
+            return Mock(repository=repo)
+
+        analyzer.analyze_repository = analyze
+        scanner = RepositoryScanner(analyzer)
+
+        result = await scanner.scan(stream(make_repos(sample_repository, 3)))
+
+        assert [a.repository.name for a in result.analyses] == ["repo-0", "repo-2"]
+        assert result.failures == {"test-org/repo-1": "boom"}
+        assert result.scanned == 3
+
+    @pytest.mark.asyncio
+    async def test_listing_failure_propagates(self, sample_repository):
+        analyzer = make_analyzer()
+        analyzer.analyze_repository = AsyncMock(side_effect=lambda repo, **kwargs: Mock())
+
+        async def failing_stream():
+            yield make_repos(sample_repository, 1)[0]
+            raise RuntimeError("listing failed")
+
+        with pytest.raises(RuntimeError, match="listing failed"):
+            await RepositoryScanner(analyzer).scan(failing_stream())
+
+    @pytest.mark.asyncio
+    async def test_workers_default_to_max_concurrent_analyses(self, sample_repository):
+        analyzer = make_analyzer()
+        analyzer.github_client.settings.analysis.max_concurrent_analyses = 3
+        running = {"now": 0, "peak": 0}
+
+        async def analyze(repo, deep_analysis, signals, steps):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return Mock(repository=repo)
+
+        analyzer.analyze_repository = analyze
+        scanner = RepositoryScanner(analyzer)
+
+        result = await scanner.scan(stream(make_repos(sample_repository, 10)))
+
+        assert scanner.workers == 3
+        assert running["peak"] == 3
+        assert len(result.analyses) == 10
+
+    @pytest.mark.asyncio
+    async def test_queued_repositories_follow_order(self, sample_repository):
+        analyzer = make_analyzer()
+        started: list[str] = []
+        analyzer.analyze_repository = AsyncMock(side_effect=lambda repo, **kwargs: Mock(repository=repo))
+        repos = [
+            repo.model_copy(update={"size_kb": size})
+            for repo, size in zip(make_repos(sample_repository, 4), [10, 400, 30, 2000])
+        ]
+        scanner = RepositoryScanner(analyzer, workers=1, order="largest")
+
+        result = await scanner.scan(
+            stream(repos), on_start=lambda position, repo: started.append(repo.name)
+        )
+
+        assert started == ["repo-3", "repo-1", "repo-2", "repo-0"]
+        assert [a.repository.name for a in result.analyses] == [f"repo-{i}" for i in range(4)]
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Request Coalescing
+
+Validates that concurrent identical calls share one execution, completed
+results are memoized with LRU eviction, only selected errors are remembered,
+and GitHubMCPClient issues one HTTP request for repeated GETs.
+
+Best for: Ensuring repeated probes within a scan cost a single API call.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.exceptions import GitHubAPIError
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+from src.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test coalescing and memoization"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert calls == 1
+        assert flight.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_are_memoized(self):
+        flight: SingleFlight[str] = SingleFlight(memo_size=1)
+        calls: list[str] = []
+
+        async def fetch(key: str) -> str:
+            calls.append(key)
+            return key
+
+        await flight.do("a", lambda: fetch("a"))
+        await flight.do("a", lambda: fetch("a"))
+        await flight.do("b", lambda: fetch("b"))  # Evicts "a"
+        await flight.do("a", lambda: fetch("a"))
+
+        assert calls == ["a", "b", "a"]
+        assert flight.memoized == 1
+        assert flight.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_only_selected_errors_are_remembered(self):
+        flight: SingleFlight[int] = SingleFlight(
+            remember_error=lambda e: isinstance(e, KeyError)
+        )
+        calls = 0
+
+        async def fail(error: Exception) -> int:
+            nonlocal calls
+            calls += 1
+            raise error
+
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                await flight.do("missing", lambda: fail(KeyError("x")))
+            with pytest.raises(RuntimeError):
+                await flight.do("flaky", lambda: fail(RuntimeError("x")))
+
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def fetch() -> int:
+            await asyncio.sleep(0.02)
+            return 7
+
+        leader = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 7
+
+
+class TestClientCoalescing:
+    """Test GitHubMCPClient GET coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_issue_one_request(self, mock_credentials):
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(str(request.url))
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json={"Python": 42})
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await asyncio.gather(
+            *(client._request("GET", "/repos/org/repo/languages") for _ in range(3))
+        )
+        await client._request("GET", "/repos/org/repo/languages", params={"page": 2})
+        for _ in range(2):
+            with pytest.raises(GitHubAPIError):
+                await client._request("GET", "/repos/org/repo/contents/missing")
+
+        assert len(paths) == 3
+        assert client.singleflight.hits == 3
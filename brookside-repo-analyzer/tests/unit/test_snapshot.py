@@ -0,0 +1,152 @@
+"""
+Unit Tests for Repository Snapshots
+
+Validates tarball extraction (prefix stripping, unsafe member rejection), local
+file access, and GitHubMCPClient serving file reads from a loaded snapshot.
+
+Best for: Ensuring deep analysis can read repository files from disk safely.
+"""
+
+import asyncio
+import io
+import tarfile
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+from src.snapshot import (
+    AsyncChunkReader,
+    RepositorySnapshot,
+    extract_tarball,
+    snapshots_supported,
+)
+
+pytestmark = pytest.mark.skipif(
+    not snapshots_supported(), reason="tarfile extraction filters unavailable"
+)
+
+
+def make_tarball(files: dict[str, bytes], prefix: str = "test-org-sample-repo-abc123") -> bytes:
+    """Build a GitHub-style tarball with a single top-level directory"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in files.items():
+            info = tarfile.TarInfo(f"{prefix}/{path}" if prefix else path)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+class TestExtraction:
+    """Test tarball extraction"""
+
+    def test_strips_top_level_directory(self, tmp_path):
+        archive = tmp_path / "repo.tar.gz"
+        archive.write_bytes(make_tarball({"README.md": b"# Hi", "tests/test_a.py": b""}))
+
+        extract_tarball(archive, tmp_path / "out")
+
+        snapshot = RepositorySnapshot("test-org/sample-repo", tmp_path / "out")
+        assert snapshot.read_text("README.md") == "# Hi"
+        assert snapshot.exists("tests/")
+        assert not snapshot.exists("README.md/")
+        assert snapshot.list_dir("tests") == ["tests/test_a.py"]
+
+    def test_list_dir_recursive(self, tmp_path):
+        archive = tmp_path / "repo.tar.gz"
+        archive.write_bytes(make_tarball({"docs/a.md": b"", "docs/guides/b.md": b""}))
+
+        extract_tarball(archive, tmp_path / "out")
+
+        snapshot = RepositorySnapshot("test-org/sample-repo", tmp_path / "out")
+        assert snapshot.list_dir("docs") == ["docs/a.md", "docs/guides"]
+        assert snapshot.list_dir("docs", recursive=True) == [
+            "docs/a.md",
+            "docs/guides",
+            "docs/guides/b.md",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_extracts_from_async_stream(self, tmp_path):
+        data = make_tarball({"src/app.py": b"print('hi')\n" * 500, "README.md": b"# Hi"})
+        chunks_read: list[int] = []
+
+        async def download():
+            for start in range(0, len(data), 1000):
+                chunks_read.append(start)
+                await asyncio.sleep(0)
+                yield data[start : start + 1000]
+
+        reader = AsyncChunkReader(download(), asyncio.get_running_loop())
+        await asyncio.to_thread(extract_tarball, io.BufferedReader(reader), tmp_path / "out")
+
+        snapshot = RepositorySnapshot("test-org/sample-repo", tmp_path / "out")
+        assert snapshot.read_text("src/app.py") == "print('hi')\n" * 500
+        assert snapshot.read_text("README.md") == "# Hi"
+        assert len(chunks_read) == -(-len(data) // 1000)
+
+    def test_rejects_path_traversal(self, tmp_path):
+        archive = tmp_path / "repo.tar.gz"
+        archive.write_bytes(make_tarball({"../../escape.txt": b"x"}))
+
+        with pytest.raises(tarfile.TarError):
+            extract_tarball(archive, tmp_path / "out")
+
+        assert not (tmp_path / "escape.txt").exists()
+
+    def test_snapshot_refuses_paths_outside_root(self, tmp_path):
+        (tmp_path / "secret.txt").write_text("secret")
+        (tmp_path / "repo").mkdir()
+        snapshot = RepositorySnapshot("test-org/sample-repo", tmp_path / "repo")
+
+        assert snapshot.read_text("../secret.txt") is None
+
+
+class TestClientSnapshots:
+    """Test GitHubMCPClient snapshot loading and file access"""
+
+    @pytest.mark.asyncio
+    async def test_files_served_from_snapshot(self, tmp_path, mock_credentials, sample_repository):
+        requests: list[str] = []
+        tarball = make_tarball({"package.json": b'{"dependencies": {"express": "^4.0.0"}}'})
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if "/tarball/" in request.url.path:
+                return httpx.Response(200, content=tarball)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        settings = Settings()
+        settings.analysis.cache_dir = tmp_path
+        client = GitHubMCPClient(
+            settings, mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        snapshot = await client.load_snapshot(sample_repository)
+        dependencies = await client.get_repository_dependencies(sample_repository)
+        has_readme = await client.check_file_exists(sample_repository, "README.md")
+
+        assert snapshot is not None
+        assert [d.name for d in dependencies] == ["express"]
+        assert not has_readme
+        assert requests == ["/repos/test-org/sample-repo/tarball/main"]
+
+        client.release_snapshot(sample_repository)
+        assert not snapshot.root.exists()
+
+    @pytest.mark.asyncio
+    async def test_large_repository_skipped(self, mock_credentials, sample_repository):
+        settings = Settings()
+        settings.analysis.snapshot_max_size_kb = 1
+        client = GitHubMCPClient(
+            settings, mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+
+        assert await client.load_snapshot(sample_repository) is None
@@ -0,0 +1,167 @@
+"""
+Unit Tests for Repository Tree Index
+
+Validates path lookups, directory prefix search, on-disk reuse by tree SHA, and
+GitHubMCPClient answering existence checks from a single tree listing.
+
+Best for: Ensuring file-existence probing no longer costs one request per path.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.github_mcp_client import GitHubMCPClient
+from src.rate_limiter import RateLimitScheduler
+from src.tree_index import RepoTreeIndex, TreeIndexStore
+
+TREE_PAYLOAD = {
+    "sha": "tree123",
+    "truncated": False,
+    "tree": [
+        {"path": "README.md", "type": "blob", "sha": "b1", "size": 100},
+        {"path": "tests", "type": "tree", "sha": "t1"},
+        {"path": "tests/test_app.py", "type": "blob", "sha": "b2", "size": 50},
+        {"path": ".github", "type": "tree", "sha": "t2"},
+        {"path": ".github/workflows", "type": "tree", "sha": "t3"},
+        {"path": ".github/workflows/ci.yml", "type": "blob", "sha": "b3", "size": 20},
+        {"path": "testing.md", "type": "blob", "sha": "b4", "size": 10},
+    ],
+}
+
+
+class TestRepoTreeIndex:
+    """Test in-memory path index"""
+
+    def test_exists_files_and_directories(self):
+        index = RepoTreeIndex.from_api(TREE_PAYLOAD)
+
+        assert index.exists("README.md")
+        assert index.exists("tests/")
+        assert index.exists(".github/workflows/")
+        assert not index.exists("README.md/")
+        assert not index.exists("spec/")
+
+    def test_list_dir_direct_children(self):
+        index = RepoTreeIndex.from_api(TREE_PAYLOAD)
+
+        assert [e.path for e in index.list_dir(".github")] == [".github/workflows"]
+        assert [e.path for e in index.list_dir("tests/")] == ["tests/test_app.py"]
+
+    def test_list_dir_does_not_match_sibling_prefix(self):
+        index = RepoTreeIndex.from_api(TREE_PAYLOAD)
+
+        # "testing.md" shares the "test" prefix but is not under "tests/"
+        assert all(e.path.startswith("tests/") for e in index.list_dir("tests", recursive=True))
+
+    def test_list_dir_recursive(self):
+        index = RepoTreeIndex.from_api(TREE_PAYLOAD)
+
+        paths = [e.path for e in index.list_dir(".github", recursive=True)]
+
+        assert paths == [".github/workflows", ".github/workflows/ci.yml"]
+
+    def test_store_roundtrip(self, tmp_path):
+        store = TreeIndexStore(tmp_path)
+        store.put(RepoTreeIndex.from_api(TREE_PAYLOAD))
+
+        loaded = store.get("tree123")
+
+        assert loaded is not None
+        assert len(loaded) == len(TREE_PAYLOAD["tree"])
+        assert loaded.get("README.md").size == 100
+        assert store.get("unknown") is None
+
+
+class TestClientTreeLookups:
+    """Test GitHubMCPClient existence checks backed by the tree index"""
+
+    def make_client(self, tmp_path, mock_credentials, requests: list[str]) -> GitHubMCPClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path.endswith("/branches/main"):
+                return httpx.Response(
+                    200,
+                    json={"commit": {"sha": "head1", "commit": {"tree": {"sha": "tree123"}}}},
+                )
+            if request.url.path.endswith("/git/trees/tree123"):
+                return httpx.Response(200, json=TREE_PAYLOAD)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = GitHubMCPClient(
+            Settings(), mock_credentials, rate_limiter=RateLimitScheduler(burst_size=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.tree_store = TreeIndexStore(tmp_path)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_existence_checks_use_one_tree_fetch(
+        self, tmp_path, mock_credentials, sample_repository
+    ):
+        requests: list[str] = []
+        client = self.make_client(tmp_path, mock_credentials, requests)
+
+        assert await client.check_file_exists(sample_repository, "tests/")
+        assert await client.check_file_exists(sample_repository, "README.md")
+        assert not await client.check_file_exists(sample_repository, "spec/")
+        assert not await client.check_file_exists(sample_repository, ".gitlab-ci.yml")
+
+        assert len(requests) == 2
+        assert client.head_shas[sample_repository.full_name] == "head1"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_one_tree_load(
+        self, tmp_path, mock_credentials, sample_repository, monkeypatch
+    ):
+        requests: list[str] = []
+        client = self.make_client(tmp_path, mock_credentials, [])
+        parses: list[str] = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)  # Keep the fetch in flight while other probes start
+            if request.url.path.endswith("/branches/main"):
+                return httpx.Response(
+                    200,
+                    json={"commit": {"sha": "head1", "commit": {"tree": {"sha": "tree123"}}}},
+                )
+            return httpx.Response(200, json=TREE_PAYLOAD)
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(slow_handler))
+        from_api = RepoTreeIndex.from_api
+        monkeypatch.setattr(
+            RepoTreeIndex,
+            "from_api",
+            staticmethod(lambda payload: parses.append(payload["sha"]) or from_api(payload)),
+        )
+
+        found = await asyncio.gather(
+            *(
+                client.check_file_exists(sample_repository, path)
+                for path in ("tests/", "README.md", "spec/", ".github/workflows/")
+            )
+        )
+
+        assert found == [True, True, False, True]
+        assert parses == ["tree123"]
+        assert sum("/git/trees/" in path for path in requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_reused_across_runs(
+        self, tmp_path, mock_credentials, sample_repository
+    ):
+        first_run: list[str] = []
+        await self.make_client(tmp_path, mock_credentials, first_run).get_repository_tree(
+            sample_repository
+        )
+
+        second_run: list[str] = []
+        tree = await self.make_client(
+            tmp_path, mock_credentials, second_run
+        ).get_repository_tree(sample_repository)
+
+        assert tree is not None and tree.exists("tests/")
+        assert not any("/git/trees/" in path for path in second_run)
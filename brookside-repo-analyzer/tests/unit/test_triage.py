@@ -0,0 +1,132 @@
+"""
+Unit Tests for Repository Triage
+
+Validates metadata-only scoring, the promotion policy (forks, archived, stale,
+empty and excluded-topic repositories), settings wiring, and that the scanner
+analyzes only promoted repositories.
+
+Best for: Ensuring API spend scales with active repositories.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.analyzers.triage import RepositoryTriage, TriagePolicy
+from src.config import Settings
+from src.scanner import RepositoryScanner
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def listed(sample_repository, name: str, days_ago: float | None = 2, **update):
+    pushed_at = NOW - timedelta(days=days_ago) if days_ago is not None else None
+    return sample_repository.model_copy(
+        update={"name": name, "full_name": f"test-org/{name}", "pushed_at": pushed_at, **update}
+    )
+
+
+class TestTriageScoring:
+    """Test metadata scoring"""
+
+    def test_active_repository_scores_high(self, sample_repository):
+        repo = listed(sample_repository, "active")
+
+        assert RepositoryTriage().score(repo, now=NOW) == 100
+
+    def test_stale_empty_repository_scores_low(self, sample_repository):
+        repo = listed(
+            sample_repository,
+            "stale",
+            days_ago=1000,
+            size_kb=0,
+            stars_count=0,
+            forks_count=0,
+            primary_language=None,
+            topics=[],
+        )
+
+        assert RepositoryTriage().score(repo, now=NOW) == 0
+
+
+class TestTriagePolicy:
+    """Test promotion decisions"""
+
+    def test_default_policy_holds_back_inactive_repositories(self, sample_repository):
+        triage = RepositoryTriage()
+        repos = [
+            listed(sample_repository, "active"),
+            listed(sample_repository, "fork", is_fork=True),
+            listed(sample_repository, "archived", is_archived=True),
+            listed(sample_repository, "stale", days_ago=800),
+            listed(sample_repository, "never-pushed", days_ago=None),
+            listed(sample_repository, "empty", size_kb=0),
+        ]
+
+        results = {repo.name: triage.assess(repo, now=NOW) for repo in repos}
+
+        assert [name for name, r in results.items() if r.promoted] == ["active"]
+        assert results["fork"].reasons == ["fork"]
+        assert results["stale"].reasons == ["no push in 730 days"]
+        assert (triage.promoted, triage.skipped) == (1, 5)
+
+    def test_policy_from_settings(self, sample_repository):
+        settings = Settings()
+        settings.analysis.triage_include_forks = True
+        settings.analysis.triage_excluded_topics = ["Sandbox"]
+        settings.analysis.triage_min_score = 90
+
+        triage = RepositoryTriage(TriagePolicy.from_settings(settings))
+
+        assert triage.assess(listed(sample_repository, "fork", is_fork=True), now=NOW).promoted
+        sandbox = triage.assess(listed(sample_repository, "demo", topics=["sandbox"]), now=NOW)
+        assert sandbox.reasons == ["topic sandbox"]
+        old = triage.assess(listed(sample_repository, "old", days_ago=200), now=NOW)
+        assert old.reasons == ["score 75 below 90"]
+
+    def test_disabled_by_default(self):
+        assert RepositoryTriage.from_settings(Settings()) is None
+
+    def test_enabled_override(self):
+        settings = Settings()
+        settings.analysis.triage_max_days_since_push = 30
+
+        triage = RepositoryTriage.from_settings(settings, enabled=True)
+
+        assert triage is not None and triage.policy.max_days_since_push == 30
+        settings.analysis.triage_enabled = True
+        assert RepositoryTriage.from_settings(settings, enabled=False) is None
+
+
+class TestScannerTriage:
+    """Test RepositoryScanner with triage"""
+
+    @pytest.mark.asyncio
+    async def test_only_promoted_repositories_analyzed(self, sample_repository):
+        analyzer = Mock()
+        analyzer.github_client.settings = Settings()
+        analyzer.github_client.deferred_stats = {}
+        analyzer.prefetch_signals = AsyncMock(return_value={})
+        analyzer.analyze_repository = AsyncMock(
+            side_effect=lambda repo, **kwargs: Mock(repository=repo)
+        )
+        now = datetime.now(timezone.utc)
+        repos = [
+            sample_repository.model_copy(
+                update={"name": name, "full_name": f"test-org/{name}", "pushed_at": now, **update}
+            )
+            for name, update in [("app", {}), ("fork", {"is_fork": True}), ("api", {})]
+        ]
+
+        async def stream():
+            for repo in repos:
+                yield repo
+
+        result = await RepositoryScanner(analyzer, triage=RepositoryTriage()).scan(stream())
+
+        assert [a.repository.name for a in result.analyses] == ["app", "api"]
+        assert result.skipped == {"test-org/fork": "fork"}
+        assert result.scanned == 2
+        prefetched = analyzer.prefetch_signals.await_args.args[0]
+        assert [repo.name for repo in prefetched] == ["app", "api"]